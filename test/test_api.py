@@ -120,3 +120,14 @@ def test_open_dataset_grid_kwargs():
             dsfile_var2_ne30,
             grid_kwargs={"drop_variables": "Mesh2_face_nodes"}
         )
+
+
+def test_set_options():
+    with ux.set_options(compact_indices=True):
+        assert ux.options.OPTIONS["compact_indices"]
+    assert not ux.options.OPTIONS["compact_indices"]
+
+    with pytest.raises(ValueError):
+        ux.set_options(not_an_option=True)
+    with pytest.raises(ValueError):
+        ux.set_options(compact_indices="yes")
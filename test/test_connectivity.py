@@ -4,6 +4,11 @@ import uxarray as ux
 import numpy as np
 
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE as fv
+from uxarray.conventions import ugrid
+from uxarray.grid.connectivity import (
+    _build_edge_node_connectivity,
+    _build_face_face_connectivity,
+)
 
 
 class TestQuadHexagon:
@@ -195,3 +200,156 @@ class TestQuadHexagon:
         assert "face_edge_connectivity" in uxgrid.connectivity
         assert "face_face_connectivity" in uxgrid.connectivity
         np.testing.assert_array_equal(face_faces, expected_face_faces)
+
+
+def test_node_face_connectivity_matches_face_nodes():
+    """Every (node, face) pair of ``face_node_connectivity`` appears once, in
+    ascending face order, in ``node_face_connectivity``."""
+    grid_path = Path(__file__).parent / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+    uxgrid = ux.open_grid(grid_path)
+    face_nodes = uxgrid.face_node_connectivity.values
+    node_faces = uxgrid.node_face_connectivity.values
+
+    valid = face_nodes != fv
+    expected = sorted(zip(face_nodes[valid], np.nonzero(valid)[0]))
+
+    rows, cols = np.nonzero(node_faces != fv)
+    actual = list(zip(rows, node_faces[rows, cols]))
+    assert actual == expected
+    assert uxgrid.n_max_node_faces == np.bincount(face_nodes[valid]).max()
+
+
+def test_face_face_connectivity_matches_edge_faces():
+    """Each interior edge makes its two faces neighbors of each other, with the
+    neighbors of each face ordered by edge index."""
+    grid_path = Path(__file__).parent / "meshfiles" / "ugrid" / "fesom" / "fesom.mesh.diag.nc"
+    uxgrid = ux.open_grid(grid_path)
+    edge_faces = uxgrid.edge_face_connectivity.values
+    # fesom stores its own face_face_connectivity, so build it from the edges
+    face_faces = _build_face_face_connectivity(uxgrid)
+
+    interior = edge_faces[np.all(edge_faces != fv, axis=1)]
+    expected = {face: [] for face in range(uxgrid.n_face)}
+    for face_a, face_b in interior:
+        expected[face_a].append(face_b)
+        expected[face_b].append(face_a)
+
+    assert face_faces.shape == (uxgrid.n_face, uxgrid.n_max_face_edges)
+    for face, neighbors in expected.items():
+        np.testing.assert_array_equal(face_faces[face][face_faces[face] != fv], neighbors)
+
+
+def test_edge_node_connectivity_matches_face_nodes():
+    """Edges are the unique sorted node pairs of every face side, and
+    ``face_edge_connectivity`` points each side at its edge."""
+    grid_path = Path(__file__).parent / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+    uxgrid = ux.open_grid(grid_path)
+    face_nodes = uxgrid.face_node_connectivity.values
+    n_nodes_per_face = uxgrid.n_nodes_per_face.values
+
+    edge_nodes, inverse_indices, _ = _build_edge_node_connectivity(
+        face_nodes, uxgrid.n_face, uxgrid.n_max_face_nodes
+    )
+    face_edges = inverse_indices.reshape(uxgrid.n_face, uxgrid.n_max_face_nodes)
+
+    sides = set()
+    for face, n_nodes in enumerate(n_nodes_per_face):
+        nodes = face_nodes[face, :n_nodes]
+        for side in range(n_nodes):
+            pair = sorted((nodes[side], nodes[(side + 1) % n_nodes]))
+            np.testing.assert_array_equal(edge_nodes[face_edges[face, side]], pair)
+            sides.add(tuple(pair))
+        assert np.all(face_edges[face, n_nodes:] == fv)
+
+    assert sorted(sides) == [tuple(edge) for edge in edge_nodes]
+
+
+def test_connectivity_csr_matches_padded():
+    """Each row of the CSR form holds the non-fill values of the padded row."""
+    grid_path = Path(__file__).parent / "meshfiles" / "exodus" / "mixed" / "mixed.exo"
+    uxgrid = ux.open_grid(grid_path)
+
+    # the padded arrays do not keep a copy of their CSR form
+    uxgrid.node_edge_connectivity
+    assert "node_edge" not in uxgrid._connectivity_csr
+
+    # node_face and node_edge are built without their padded arrays
+    offsets, faces = uxgrid.connectivity_csr("node_face")
+    assert "node_face_connectivity" not in uxgrid._ds
+    assert uxgrid.connectivity_csr("node_face_connectivity")[1] is faces
+
+    for name in ["face_node", "face_edge", "face_face", "edge_node", "edge_face",
+                 "node_edge", "node_face"]:
+        offsets, indices = uxgrid.connectivity_csr(name)
+        padded = getattr(uxgrid, f"{name}_connectivity").values
+        assert offsets.shape == (padded.shape[0] + 1,)
+        for row, values in enumerate(padded):
+            np.testing.assert_array_equal(
+                indices[offsets[row]:offsets[row + 1]], values[values != fv]
+            )
+
+    with pytest.raises(ValueError):
+        uxgrid.connectivity_csr("node_node")
+
+
+def test_connectivity_csr_reset_on_set():
+    grid_path = Path(__file__).parent / "meshfiles" / "ugrid" / "quad-hexagon" / "grid.nc"
+    uxgrid = ux.open_grid(grid_path)
+    offsets, faces = uxgrid.connectivity_csr("node_face")
+
+    # reversing the faces renumbers face i as n_face - 1 - i
+    uxgrid.face_node_connectivity = uxgrid.face_node_connectivity[::-1]
+    new_offsets, new_faces = uxgrid.connectivity_csr("node_face")
+
+    np.testing.assert_array_equal(new_offsets, offsets)
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        np.testing.assert_array_equal(
+            new_faces[start:end], np.sort(uxgrid.n_face - 1 - faces[start:end])
+        )
+
+
+def test_connectivity_csr_compact_indices():
+    grid_path = Path(__file__).parent / "meshfiles" / "exodus" / "mixed" / "mixed.exo"
+    uxgrid = ux.open_grid(grid_path)
+
+    with ux.set_options(compact_indices=True):
+        offsets, faces = uxgrid.connectivity_csr("node_face")
+    assert offsets.dtype == faces.dtype == np.int32
+
+    # the dual is built from the compact arrays and keeps their type
+    dual_face_nodes = uxgrid.get_dual().face_node_connectivity.values
+    assert dual_face_nodes.dtype == np.int32
+    expected = ux.open_grid(grid_path).get_dual().face_node_connectivity.values
+    np.testing.assert_array_equal(
+        dual_face_nodes, np.where(expected == fv, np.iinfo(np.int32).min, expected)
+    )
+
+
+
+def test_compact_indices_connectivity():
+    grid_path = Path(__file__).parent / "meshfiles" / "exodus" / "mixed" / "mixed.exo"
+    expected = ux.open_grid(grid_path)
+    int32_fv = np.iinfo(np.int32).min
+
+    with ux.set_options(compact_indices=True):
+        uxgrid = ux.open_grid(grid_path)
+        connectivity = {
+            name: getattr(uxgrid, name) for name in ugrid.CONNECTIVITY_NAMES
+        }
+    assert uxgrid.face_node_connectivity.dtype == np.int32
+
+    for name, conn in connectivity.items():
+        assert conn.dtype == np.int32
+        if "_FillValue" in conn.attrs:
+            assert conn.attrs["_FillValue"] == int32_fv
+
+        # same indices, with the fill value of the compact type
+        expected_values = getattr(expected, name).values
+        np.testing.assert_array_equal(
+            conn.values, np.where(expected_values == fv, int32_fv, expected_values)
+        )
+
+    np.testing.assert_allclose(uxgrid.face_areas, expected.face_areas)
+    np.testing.assert_array_equal(
+        uxgrid.boundary_edge_indices, expected.boundary_edge_indices
+    )
@@ -13,7 +13,12 @@ quad_hex_data_path = current_path / 'meshfiles' / "ugrid" / "quad-hexagon" / 'da
 quad_hex_node_data = current_path / 'meshfiles' / "ugrid" / "quad-hexagon" / 'random-node-data.nc'
 cube_sphere_grid = current_path / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
 
-from uxarray.grid.intersections import constant_lat_intersections_face_bounds
+from uxarray.grid.intersections import (
+    constant_lat_intersections_face_bounds,
+    constant_lon_intersections_face_bounds,
+    faces_within_lat_bounds,
+    faces_within_lon_bounds,
+)
 
 
 def test_repr():
@@ -220,3 +225,62 @@ def test_double_cross_section():
     sub_lat_lon = sub_lat.cross_section.constant_longitude(0.0)
 
     assert "n_edge" in sub_lat_lon._ds.dims
+
+
+def test_face_bounds_index_matches_scan():
+    uxgrid = ux.open_grid(cube_sphere_grid)
+    bounds_lat = uxgrid.face_bounds_lat.values
+    bounds_lon = uxgrid.face_bounds_lon.values
+
+    for lat in [-90.0, -45.5, 0.0, 12.3, 90.0]:
+        nt.assert_array_equal(uxgrid.get_faces_at_constant_latitude(lat),
+                              constant_lat_intersections_face_bounds(lat, bounds_lat))
+
+    for lon in [-180.0, -12.0, 0.0, 179.5, 180.0]:
+        nt.assert_array_equal(uxgrid.get_faces_at_constant_longitude(lon),
+                              constant_lon_intersections_face_bounds(lon, bounds_lon))
+
+    for lats in [(-10.0, 10.0), (-90.0, -60.0), (30.0, 90.0)]:
+        nt.assert_array_equal(uxgrid.get_faces_between_latitudes(lats),
+                              faces_within_lat_bounds(lats, bounds_lat))
+
+    # the last interval crosses the antimeridian
+    for lons in [(-10.0, 10.0), (-180.0, -100.0), (160.0, -160.0)]:
+        nt.assert_array_equal(uxgrid.get_faces_between_longitudes(lons),
+                              faces_within_lon_bounds(lons, bounds_lon))
+
+
+def test_face_bounds_index_reset_on_set():
+    uxgrid = ux.open_grid(quad_hex_grid_path)
+    before = uxgrid.get_faces_at_constant_latitude(0.1)
+    index = uxgrid._get_face_bounds_index()
+
+    # rotate the grid by 180 degrees around the x axis, which negates latitudes
+    for name in ["node_lon", "node_lat", "node_y", "node_z", "face_lon", "face_lat"]:
+        setattr(uxgrid, name, -getattr(uxgrid, name))
+    expected = ux.Grid.from_topology(
+        uxgrid.node_lon.values,
+        uxgrid.node_lat.values,
+        uxgrid.face_node_connectivity.values,
+    ).get_faces_at_constant_latitude(0.1)
+
+    assert "bounds" not in uxgrid._ds
+    assert uxgrid._get_face_bounds_index() is not index
+    after = uxgrid.get_faces_at_constant_latitude(0.1)
+    nt.assert_array_equal(after, expected)
+    assert not np.array_equal(after, before)
+
+
+def test_faces_at_constant_latitudes():
+    uxgrid = ux.open_grid(cube_sphere_grid)
+    lats = np.linspace(-90, 90, 19)
+
+    offsets, faces = uxgrid.get_faces_at_constant_latitudes(lats)
+    assert offsets.shape == (lats.size + 1,)
+
+    for i, lat in enumerate(lats):
+        nt.assert_array_equal(faces[offsets[i]:offsets[i + 1]],
+                              uxgrid.get_faces_at_constant_latitude(lat))
+
+    with pytest.raises(ValueError):
+        uxgrid.get_faces_at_constant_latitudes([0.0, 95.0])
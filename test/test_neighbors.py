@@ -185,3 +185,83 @@ def test_construct_edge_face_distances():
     # Run the function under test
     calculated = _construct_edge_face_distances(face_lon, face_lat, edge_faces)
     np.testing.assert_array_almost_equal(calculated, expected, decimal=5)
+
+
+def test_save_load_index(tmp_path):
+    """Tests that spatial indices saved by one grid are memory-mapped and reused by another."""
+    uxgrid = ux.open_grid(gridfile_mpas)
+    uxgrid.get_ball_tree(coordinates="nodes")
+    uxgrid.get_kd_tree()
+    uxgrid.get_spatial_hash()
+    uxgrid._get_scipy_kd_tree()
+    uxgrid.get_faces_containing_point([0.0, 0.0])
+
+    # saving into a directory names the file after the grid fingerprint
+    uxgrid.save_index(tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    loaded = ux.open_grid(gridfile_mpas)
+    loaded.load_index(tmp_path)
+
+    assert isinstance(loaded._face_bvh[0], np.memmap)
+    assert isinstance(loaded.get_spatial_hash()._face_hash_table[1], np.memmap)
+    assert loaded.get_ball_tree(coordinates="nodes")._source_grid is loaded
+    assert ("scipy", "face", "cartesian", "euclidean") in loaded._trees
+
+    points = np.column_stack([np.linspace(-180, 180, 50), np.linspace(-80, 80, 50)])
+    np.testing.assert_array_equal(
+        loaded.get_ball_tree(coordinates="nodes").query(points, k=3)[1],
+        uxgrid.get_ball_tree(coordinates="nodes").query(points, k=3)[1],
+    )
+    np.testing.assert_array_equal(
+        loaded.get_spatial_hash().query(points)[0], uxgrid.get_spatial_hash().query(points)[0]
+    )
+    np.testing.assert_array_equal(loaded.locate_points(points), uxgrid.locate_points(points))
+
+    # indices of another grid are rejected
+    other = ux.open_grid(gridfile_CSne30)
+    with pytest.raises(ValueError):
+        other.load_index(next(tmp_path.iterdir()))
+
+
+def test_tree_cache_reuses_trees():
+    """Tests that alternating between elements and metrics reuses the cached trees."""
+    uxgrid = ux.open_grid(gridfile_mpas)
+
+    node_tree = uxgrid.get_ball_tree(coordinates="nodes")._current_tree()
+    face_tree = uxgrid.get_ball_tree(coordinates="face centers")._current_tree()
+    assert uxgrid.get_ball_tree(coordinates="nodes")._current_tree() is node_tree
+    assert uxgrid.get_ball_tree(coordinates="face centers")._current_tree() is face_tree
+
+    # a different coordinate system or metric selects a different tree
+    cartesian = uxgrid.get_ball_tree(
+        coordinates="nodes", coordinate_system="cartesian", distance_metric="minkowski"
+    )
+    assert cartesian._current_tree() is not node_tree
+    d, ind = cartesian.query([1.0, 0.0, 0.0], k=2)
+    assert len(ind) == 2
+
+    uxgrid.get_kd_tree(coordinates="nodes")
+    assert len(uxgrid._trees) == 4
+
+
+def test_tree_cache_max_memory():
+    """Tests that the least recently used trees are evicted beyond the memory budget."""
+    uxgrid = ux.open_grid(gridfile_CSne30)
+    uxgrid.get_ball_tree(coordinates="nodes")
+    uxgrid.get_ball_tree(coordinates="face centers")
+    uxgrid._get_scipy_kd_tree(coordinates="node")
+    assert len(uxgrid._trees) == 3
+
+    # keep room for a single tree
+    uxgrid.tree_cache_max_memory = uxgrid._trees.nbytes // 2
+    assert len(uxgrid._trees) == 1
+    assert ("scipy", "node", "cartesian", "euclidean") in uxgrid._trees
+
+    # evicted trees are rebuilt on demand
+    d, ind = uxgrid.get_ball_tree(coordinates="nodes").query([3.0, 3.0], k=3)
+    assert len(ind) == 3
+    assert ("BallTree", "nodes", "spherical", "haversine") in uxgrid._trees
+
+    uxgrid.tree_cache_max_memory = "1GB"
+    assert uxgrid.tree_cache_max_memory == 10**9
@@ -157,3 +157,144 @@ def test_coordinates(grid):
     with pytest.raises(ValueError):
         dummy_points = np.ones((10, 4))
         faces_query_both, _ = grid.get_faces_containing_point(points=dummy_points)
+
+
+def test_matches_brute_force():
+    """The bounding-cap hierarchy must not cull any face containing the point."""
+    from uxarray.grid.point_in_face import _get_faces_containing_point
+
+    grid = ux.open_grid(gridfile_mpas)
+    grid.normalize_cartesian_coordinates()
+
+    rng = np.random.default_rng(42)
+    points = rng.normal(size=(200, 3))
+    points /= np.linalg.norm(points, axis=1)[:, np.newaxis]
+    # include nodes, which are shared by several faces
+    points = np.vstack([points, np.column_stack([grid.node_x, grid.node_y, grid.node_z])])
+
+    all_faces = np.arange(grid.n_face)
+    hits = grid.get_faces_containing_point(points, return_counts=False)
+
+    for point, hit in zip(points, hits):
+        expected = _get_faces_containing_point(
+            point,
+            all_faces,
+            grid.face_node_connectivity.values,
+            grid.n_nodes_per_face.values,
+            grid.node_x.values,
+            grid.node_y.values,
+            grid.node_z.values,
+        )
+        assert hit == sorted(expected.tolist())
+
+    # the hierarchy is built once and reused
+    assert grid._get_face_bvh() is grid._get_face_bvh()
+
+
+def test_face_bvh_reset_on_set(grid):
+    """Replacing the grid coordinates rebuilds the bounding-cap hierarchy."""
+    point = np.array([grid.face_x[0], grid.face_y[0], grid.face_z[0]])
+    expected = grid.get_faces_containing_point(point, return_counts=False)[0]
+    bvh = grid._get_face_bvh()
+
+    # rotate the grid by 180 degrees around the z axis
+    for name in ["node_x", "node_y", "face_x", "face_y"]:
+        setattr(grid, name, -getattr(grid, name))
+
+    assert grid._get_face_bvh() is not bvh
+    rotated = np.array([-point[0], -point[1], point[2]])
+    assert grid.get_faces_containing_point(rotated, return_counts=False)[0] == expected
+
+
+def test_locate_points_walk_trajectory():
+    """Walking along a trajectory finds the same faces as the tree search."""
+    grid = ux.open_grid(gridfile_mpas)
+
+    lon = np.linspace(-170, 170, 500)
+    lat = 60 * np.sin(np.linspace(0, 6, 500))
+    points = np.column_stack([lon, lat])
+
+    expected = grid.locate_points(points)
+    assert np.all(expected != INT_FILL_VALUE)
+
+    nt.assert_array_equal(grid.locate_points(points, method="walk"), expected)
+    nt.assert_array_equal(grid.locate_points(points, method="walk", hint=0), expected)
+
+
+def test_locate_points_walk_hints():
+    """Walks from per-point hints, including invalid ones, fall back to the tree."""
+    grid = ux.open_grid(gridfile_mpas)
+
+    rng = np.random.default_rng(0)
+    points = np.column_stack([rng.uniform(-180, 180, 100), rng.uniform(-90, 90, 100)])
+    expected = grid.locate_points(points)
+
+    hints = rng.integers(0, grid.n_face, 100)
+    hints[:10] = INT_FILL_VALUE
+    nt.assert_array_equal(grid.locate_points(points, method="walk", hint=hints), expected)
+
+    with pytest.raises(ValueError):
+        grid.locate_points(points, method="walk", hint=hints[:10])
+    with pytest.raises(ValueError):
+        grid.locate_points(points, method="hash")
+
+
+def test_locate_points_outside_grid():
+    """Points outside of a regional grid are not located."""
+    grid = ux.open_grid(quad_hex_grid_path)
+    grid.normalize_cartesian_coordinates()
+
+    points = np.array([[grid.face_lon.values[0], grid.face_lat.values[0]], [120.0, 45.0]])
+    for method in ("tree", "walk"):
+        nt.assert_array_equal(grid.locate_points(points, method=method), [0, INT_FILL_VALUE])
+
+
+def _sample_path(points_xyz, n=200):
+    """Dense samples along the great-circle arcs joining consecutive points."""
+    samples = []
+    for a, b in zip(points_xyz[:-1], points_xyz[1:]):
+        omega = np.arccos(np.clip(a @ b, -1.0, 1.0))
+        t = np.linspace(0, 1, n, endpoint=False)[:, None]
+        samples.append((np.sin((1 - t) * omega) * a + np.sin(t * omega) * b) / np.sin(omega))
+    return np.vstack(samples)
+
+
+def test_faces_along_path():
+    """The faces along a path contain every point sampled along it."""
+    grid = ux.open_grid(gridfile_mpas)
+    track = np.array([[-70.0, 40.0], [-10.0, 50.0], [60.0, -20.0], [170.0, -10.0], [-160.0, 30.0]])
+
+    faces, entry, exit = grid.get_faces_along_path(track)
+
+    track_xyz = np.column_stack([
+        np.cos(np.deg2rad(track[:, 1])) * np.cos(np.deg2rad(track[:, 0])),
+        np.cos(np.deg2rad(track[:, 1])) * np.sin(np.deg2rad(track[:, 0])),
+        np.sin(np.deg2rad(track[:, 1])),
+    ])
+    length = np.sum(np.arccos(np.sum(track_xyz[:-1] * track_xyz[1:], axis=1)))
+
+    # consecutive faces share their crossing point, and the path is fully covered
+    assert np.all(faces[1:] != faces[:-1])
+    nt.assert_allclose(entry[1:], exit[:-1])
+    assert entry[0] == 0.0
+    nt.assert_allclose(exit[-1], length)
+    assert np.all(exit >= entry)
+
+    sampled = grid.locate_points(_sample_path(track_xyz))
+    assert set(sampled) <= set(faces)
+
+
+def test_faces_along_path_regional_grid():
+    """Parts of a path outside of a regional grid are skipped."""
+    grid = ux.Grid.from_structured(lon=np.linspace(-40, 40, 41), lat=np.linspace(-30, 30, 31))
+
+    track = np.array([[-60.0, 0.0], [60.0, 0.5]])
+    faces, entry, exit = grid.get_faces_along_path(track)
+
+    assert entry[0] > 0.0
+    assert exit[-1] < np.deg2rad(120.0)
+    nt.assert_allclose(entry[1:], exit[:-1])
+    assert len(faces) == 41
+
+    faces, entry, exit = grid.get_faces_along_path([[100.0, 0.0], [120.0, 0.0]])
+    assert faces.size == 0
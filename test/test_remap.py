@@ -2,6 +2,7 @@ import os
 import numpy as np
 import numpy.testing as nt
 import pytest
+import xarray as xr
 from pathlib import Path
 
 import uxarray as ux
@@ -256,3 +257,483 @@ def test_b_quadrilateral():
     out = uxds['var2'].remap.bilinear(destination_grid=dest)
 
     assert out.size > 0
+
+
+def test_b_reuses_cached_dual_and_weights():
+    """Repeated bilinear remaps reuse the cached dual and weights."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(gridfile_geoflow)
+
+    first = uxds["latCell"].remap.bilinear(destination_grid=dest)
+    dual = uxds.uxgrid._get_dual()
+    weights = ux.RemapWeights.bilinear(uxds.uxgrid, dest)
+    second = uxds["latCell"].remap.bilinear(destination_grid=dest)
+
+    assert uxds.uxgrid._get_dual() is dual
+    assert uxds.uxgrid.get_dual() is not dual
+    assert ux.RemapWeights.bilinear(uxds.uxgrid, dest) is weights
+    nt.assert_array_equal(first.values, second.values)
+
+
+def test_b_dual_rebuilt_on_set():
+    """Replacing the face centers of a grid discards its cached dual."""
+    grid = ux.open_grid(outCSne30)
+    dual = grid._get_dual()
+
+    grid.face_lon = grid.face_lon * 0.5
+
+    assert grid._get_dual() is not dual
+    nt.assert_allclose(grid._get_dual().node_lon.values, grid.face_lon.values)
+    nt.assert_allclose(grid.get_dual().node_lon.values, grid.face_lon.values)
+
+
+def test_b_fallback_outside_dual():
+    """Points outside the dual take the value of the primal face containing them."""
+    from uxarray.remap.bilinear import _barycentric_weights
+
+    grid = ux.open_grid(ROOT / "meshfiles" / "ugrid" / "quad-hexagon" / "grid.nc")
+    dual = grid.get_dual()
+
+    # points halfway between each face center and its corner nodes
+    face_xyz = np.c_[grid.face_x.values, grid.face_y.values, grid.face_z.values]
+    node_xyz = np.c_[grid.node_x.values, grid.node_y.values, grid.node_z.values]
+    face_ids = np.repeat(np.arange(grid.n_face), grid.n_max_face_nodes)
+    points = (face_xyz[face_ids] + node_xyz[grid.face_node_connectivity.values.ravel()])
+    points = (points / np.linalg.norm(points, axis=1, keepdims=True)).astype(np.float64)
+
+    _, hits = dual.get_faces_containing_point(points=points)
+    fallback = hits == 0
+    assert fallback.any()
+
+    weights, indices = _barycentric_weights(points, dual, len(points), grid)
+
+    nt.assert_array_equal(weights[fallback, 0], 1.0)
+    nt.assert_array_equal(indices[fallback, 0], face_ids[fallback])
+
+
+# ------------------------------------------------------------
+# Reusable remap weights
+# ------------------------------------------------------------
+def test_weights_match_idw():
+    """Applying precomputed IDW weights matches the IDW remap."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    dest = ux.open_grid(mpasfile_QU)
+
+    weights = ux.RemapWeights.inverse_distance_weighted(
+        uxds.uxgrid, dest, source_dim="n_node", remap_to="faces"
+    )
+    expected = uxds["v1"].remap.inverse_distance_weighted(dest, remap_to="faces")
+    out = uxds["v1"].remap.apply_weights(weights)
+
+    assert isinstance(out, UxDataArray)
+    assert out.uxgrid == dest
+    nt.assert_allclose(out.values, expected.values)
+
+
+def test_weights_match_nearest_neighbor_and_bilinear():
+    """Nearest-neighbor and bilinear weights reproduce their remap methods."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(gridfile_geoflow)
+
+    nn = ux.RemapWeights.nearest_neighbor(uxds.uxgrid, dest, remap_to="nodes")
+    nt.assert_array_equal(
+        nn.apply(uxds["latCell"]).values,
+        uxds["latCell"].remap.nearest_neighbor(dest, remap_to="nodes").values,
+    )
+
+    bl = ux.RemapWeights.bilinear(uxds.uxgrid, dest)
+    nt.assert_allclose(
+        bl.apply(uxds["latCell"]).values,
+        uxds["latCell"].remap.bilinear(dest).values,
+    )
+
+
+def test_weights_roundtrip(tmp_path):
+    """Weights written to netCDF can be read back and applied."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    dest = ux.open_grid(mpasfile_QU)
+
+    weights = ux.RemapWeights.inverse_distance_weighted(
+        uxds.uxgrid, dest, source_dim="n_node", remap_to="nodes", k=4
+    )
+    path = tmp_path / "weights.nc"
+    weights.to_netcdf(path)
+    loaded = ux.RemapWeights.from_file(path)
+
+    assert loaded.method == "inverse_distance_weighted"
+    assert (loaded.matrix != weights.matrix).nnz == 0
+
+    # a destination grid is needed once the weights are loaded from disk
+    with pytest.raises(ValueError):
+        loaded.apply(uxds)
+
+    out = uxds.remap.apply_weights(loaded, destination_grid=dest)
+    assert isinstance(out, UxDataset)
+    nt.assert_allclose(out["v1"].values, weights.apply(uxds)["v1"].values)
+
+
+def test_weights_grid_mismatch_raises():
+    """Weights refuse data or destination grids they were not built for."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    other = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(mpasfile_QU)
+
+    weights = ux.RemapWeights.nearest_neighbor(
+        uxds.uxgrid, dest, source_dim="n_node", remap_to="faces"
+    )
+    with pytest.raises(ValueError):
+        weights.apply(other["latVertex"])
+    with pytest.raises(ValueError):
+        weights.apply(uxds, destination_grid=uxds.uxgrid)
+
+
+# ------------------------------------------------------------
+# Conservative tests
+# ------------------------------------------------------------
+def test_conservative_preserves_integral():
+    """Conservative remapping preserves the area integral of a field."""
+    uxds = ux.open_dataset(outCSne30, outCSne30_var2)
+    dest = ux.open_grid(mpasfile_QU)
+
+    out = uxds["var2"].remap.conservative(destination_grid=dest)
+
+    assert isinstance(out, UxDataArray)
+    assert "n_face" in out.dims
+    src_integral = (uxds["var2"].values * uxds.uxgrid.face_areas.values).sum()
+    dst_integral = (out.values * dest.face_areas.values).sum()
+    nt.assert_allclose(dst_integral, src_integral, rtol=1e-6)
+
+
+def test_conservative_constant_field():
+    """A constant field stays constant and the weights are cached on the destination."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(outCSne30)
+
+    ones = uxds["latCell"] * 0.0 + 1.0
+    out = ones.remap.conservative(destination_grid=dest)
+    nt.assert_allclose(out.values, 1.0)
+
+    weights = ux.RemapWeights.conservative(uxds.uxgrid, dest)
+    assert ux.RemapWeights.conservative(uxds.uxgrid, dest) is weights
+
+    # replacing the destination geometry invalidates the cached weights
+    dest.node_lon = dest.node_lon + 1.0
+    updated = ux.RemapWeights.conservative(uxds.uxgrid, dest)
+    assert updated is not weights
+    assert updated.destination_fingerprint != weights.destination_fingerprint
+
+
+def test_conservative_value_errors():
+    """Conservative remapping requires face-centered data remapped to faces."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(gridfile_geoflow)
+
+    with pytest.raises(ValueError):
+        uxds["latVertex"].remap.conservative(destination_grid=dest)
+    with pytest.raises(ValueError):
+        uxds["latCell"].remap.conservative(destination_grid=dest, remap_to="nodes")
+
+
+def test_conservative_concave_destination():
+    """Concave destination faces are rejected instead of producing wrong weights."""
+    source = ux.open_grid(mpasfile_QU)
+    # the third node makes the quadrilateral concave
+    dest = ux.Grid.from_topology(
+        np.array([0.0, 10.0, 3.0, 0.0]),
+        np.array([0.0, 0.0, 3.0, 10.0]),
+        np.array([[0, 1, 2, 3]]),
+    )
+
+    with pytest.raises(ValueError, match="convex"):
+        ux.RemapWeights.conservative(source, dest)
+
+
+def test_conservative_candidates_within_caps():
+    """Candidate pairs are sorted per destination face and lie within the search
+    radius given by the largest faces of both grids."""
+    from uxarray.remap.conservative import _candidate_face_pairs
+
+    source = ux.open_grid(mpasfile_QU)
+    dest = ux.open_grid(outCSne30)
+
+    offsets, candidates = _candidate_face_pairs(source, dest)
+    assert offsets[-1] == candidates.shape[0]
+    for i in range(dest.n_face):
+        row = candidates[offsets[i] : offsets[i + 1]]
+        assert np.all(np.diff(row) > 0)
+
+    radius = (source.max_face_radius + dest.max_face_radius) * 1.05 + 1e-6
+    centers = np.column_stack([dest.face_x, dest.face_y, dest.face_z])
+    tree = source._get_scipy_kd_tree(coordinates="face")
+    within = {
+        (i, j)
+        for i, hits in enumerate(tree.query_ball_point(centers, r=radius))
+        for j in hits
+    }
+    rows = np.repeat(np.arange(dest.n_face), np.diff(offsets))
+    assert set(zip(rows.tolist(), candidates.tolist())) < within
+
+
+# ------------------------------------------------------------
+# Batched multi-variable remapping
+# ------------------------------------------------------------
+@pytest.mark.parametrize("method", ["nearest_neighbor", "inverse_distance_weighted", "bilinear"])
+def test_remap_dataset_matches_per_variable(method):
+    """Remapping a dataset with variables of different shapes and dtypes matches
+    remapping each variable on its own."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(gridfile_geoflow)
+    rng = np.random.default_rng(0)
+
+    ds = ux.UxDataset(
+        {
+            "a": (("time", "n_face"), rng.random((3, uxds.uxgrid.n_face))),
+            "b": ("n_face", rng.random(uxds.uxgrid.n_face)),
+            "c": (("n_face", "lev"), rng.random((uxds.uxgrid.n_face, 2)).astype(np.float32)),
+            "d": ("n_face", np.arange(uxds.uxgrid.n_face)),
+            "e": ("time", np.arange(3)),
+        },
+        uxgrid=uxds.uxgrid,
+    )
+
+    out = getattr(ds.remap, method)(destination_grid=dest)
+
+    assert list(out.data_vars) == list(ds.data_vars)
+    assert out["c"].dims == ("n_face", "lev")
+    nt.assert_array_equal(out["e"].values, ds["e"].values)
+    for name in ["a", "b", "c", "d"]:
+        expected = getattr(ds[name].remap, method)(destination_grid=dest)
+        assert out[name].dtype == expected.dtype
+        nt.assert_allclose(out[name].values, expected.values, rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "method", ["nearest_neighbor", "inverse_distance_weighted", "bilinear", "conservative"]
+)
+def test_remap_float32(method):
+    """With dtype=float32, float32 data is remapped in float32."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(outCSne30)
+    source = UxDataArray(uxds["latCell"].astype(np.float32), uxgrid=uxds.uxgrid)
+
+    out = getattr(source.remap, method)(destination_grid=dest, dtype=np.float32)
+    expected = getattr(source.remap, method)(destination_grid=dest)
+
+    assert out.dtype == np.float32
+    if method == "nearest_neighbor":
+        # Neighbors are always found with float64 query points
+        nt.assert_array_equal(out.values, expected.values)
+    else:
+        nt.assert_allclose(out.values, expected.values, rtol=1e-5)
+
+
+def test_weights_astype():
+    """Weights cast to float32 keep their structure and metadata."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    dest = ux.open_grid(gridfile_geoflow)
+
+    weights = ux.RemapWeights.inverse_distance_weighted(uxds.uxgrid, dest, dtype="float32")
+
+    assert weights.dtype == np.float32
+    assert weights.astype(np.float64).dtype == np.float64
+    assert weights.astype(np.float64).source_fingerprint == weights.source_fingerprint
+    source = UxDataArray(uxds["latCell"].astype(np.float32), uxgrid=uxds.uxgrid)
+    assert weights.apply(source).dtype == np.float32
+
+
+def test_grid_fingerprint_cached():
+    """The grid fingerprint is computed once and reset when the grid changes."""
+    from uxarray.grid.utils import _compute_grid_fingerprint, _grid_fingerprint
+
+    grid = ux.open_grid(outCSne30)
+    fingerprint = _grid_fingerprint(grid)
+    assert grid._fingerprint == fingerprint
+
+    grid.node_lon = grid.node_lon + 1.0
+    assert grid._fingerprint is None
+    assert _grid_fingerprint(grid) == _compute_grid_fingerprint(grid) != fingerprint
+
+
+# ------------------------------------------------------------
+# Blocked remapping
+# ------------------------------------------------------------
+@pytest.mark.parametrize("method", ["nearest_neighbor", "inverse_distance_weighted"])
+@pytest.mark.parametrize("options", [{"chunk_size": 100}, {"max_memory": "1MB"}])
+def test_remap_blocked_matches_unblocked(method, options):
+    """Remapping destination points in blocks gives the same result."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    dest = ux.open_grid(mpasfile_QU)
+
+    expected = getattr(uxds["v1"].remap, method)(destination_grid=dest)
+    out = getattr(uxds["v1"].remap, method)(destination_grid=dest, **options)
+
+    assert out.dims == expected.dims
+    nt.assert_array_equal(out.values, expected.values)
+
+
+def test_remap_blocked_invalid_chunk_size():
+    """A non-positive chunk size raises a ValueError."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    dest = ux.open_grid(mpasfile_QU)
+
+    with pytest.raises(ValueError):
+        uxds["v1"].remap.nearest_neighbor(destination_grid=dest, chunk_size=0)
+
+
+# ------------------------------------------------------------
+# Dask tests
+# ------------------------------------------------------------
+@pytest.mark.parametrize("method", ["nearest_neighbor", "inverse_distance_weighted"])
+def test_remap_dask_lazy(method):
+    """Remapping chunked data stays lazy, keeps non-spatial chunks and matches eager results."""
+    import dask.array as da
+
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    dest = ux.open_grid(mpasfile_QU)
+
+    chunked = uxds["v1"].chunk({"meshLayers": 5, "n_node": 1000})
+    out = getattr(chunked.remap, method)(destination_grid=dest, remap_to="faces")
+
+    assert isinstance(out.data, da.Array)
+    assert out.dims == ("time", "meshLayers", "n_face")
+    assert out.data.chunks[1] == chunked.data.chunks[1]
+    assert out.data.chunks[2] == (dest.n_face,)
+
+    expected = getattr(uxds["v1"].remap, method)(destination_grid=dest, remap_to="faces")
+    nt.assert_allclose(out.values, expected.values)
+
+
+def test_remap_preserves_dim_order():
+    """The destination dimension replaces the source dimension in place."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    dest = ux.open_grid(mpasfile_QU)
+
+    out = uxds["v1"].transpose("n_node", ...).remap.nearest_neighbor(destination_grid=dest)
+    assert out.dims == ("n_face", "time", "meshLayers")
+
+
+# ------------------------------------------------------------
+# Remapping to regular lat-lon grids
+# ------------------------------------------------------------
+@pytest.mark.parametrize("method", ["nearest_neighbor", "inverse_distance_weighted", "bilinear"])
+def test_to_latlon_matches_structured_grid(method):
+    """Remapping to lat-lon coordinates matches remapping to a grid whose nodes
+    are the same points."""
+    uxds = ux.open_dataset(mpasfile_QU, mpasfile_QU)
+    lon = np.arange(-175.0, 180.0, 10.0)
+    lat = np.arange(-85.0, 90.0, 10.0)
+    lon_2d, lat_2d = np.meshgrid(lon, lat)
+    dest = ux.Grid.from_points((lon_2d.ravel(), lat_2d.ravel()))
+
+    out = uxds["latCell"].remap.to_latlon(lon, lat, method=method)
+    expected = getattr(uxds["latCell"].remap, method)(
+        destination_grid=dest, remap_to="nodes"
+    )
+
+    assert isinstance(out, xr.DataArray) and not isinstance(out, UxDataArray)
+    assert out.dims == ("lat", "lon")
+    nt.assert_array_equal(out["lon"].values, lon)
+    nt.assert_array_equal(out["lat"].values, lat)
+    nt.assert_allclose(out.values.ravel(), expected.values)
+
+
+def test_to_latlon_dataset_dims():
+    """Remapping a dataset to lat-lon returns a plain Dataset with (lat, lon) in place."""
+    uxds = ux.open_dataset(gridfile_geoflow, dsfiles_geoflow[0])
+    lon = np.linspace(-180.0, 180.0, 13)
+    lat = np.linspace(-90.0, 90.0, 7)
+
+    out = uxds.remap.to_latlon(lon, lat)
+
+    assert isinstance(out, xr.Dataset) and not isinstance(out, UxDataset)
+    assert out["v1"].dims == ("time", "meshLayers", "lat", "lon")
+    assert out["v1"].shape[-2:] == (7, 13)
+
+    with pytest.raises(ValueError):
+        uxds.remap.to_latlon(lon, lat, method="conservative")
+    with pytest.raises(ValueError):
+        uxds.remap.to_latlon(lon, lat, method="bilinear")
+
+
+# ------------------------------------------------------------
+# Remapping from structured sources
+# ------------------------------------------------------------
+def _structured_dataset(lon, lat):
+    lon_2d, lat_2d = np.meshgrid(lon, lat)
+    return xr.Dataset(
+        {
+            "t": (("time", "lat", "lon"), np.stack([lat_2d, np.cos(np.deg2rad(lon_2d))])),
+            "lat_bnds": (("lat", "bnds"), np.zeros((lat.size, 2))),
+        },
+        coords={"lon": lon, "lat": lat, "time": [0, 1]},
+    )
+
+
+def test_remap_structured_bilinear():
+    """Bilinear remapping from a global lat-lon grid reproduces linear fields,
+    including across the periodic longitude boundary and with descending latitudes."""
+    ds = _structured_dataset(np.arange(0.0, 360.0, 1.0), np.arange(89.5, -90.0, -1.0))
+    dest = ux.open_grid(outCSne30)
+
+    out = ux.remap_structured(ds, dest)
+
+    assert isinstance(out, UxDataset)
+    assert out.uxgrid == dest
+    assert out["t"].dims == ("time", "n_face")
+    assert "lat_bnds" not in out
+
+    face_lat = dest.face_lat.values
+    interior = np.abs(face_lat) < 89.5
+    nt.assert_allclose(out["t"].values[0, interior], face_lat[interior], atol=1e-10)
+    nt.assert_allclose(
+        out["t"].values[1], np.cos(np.deg2rad(dest.face_lon.values)), atol=1e-4
+    )
+
+
+def test_remap_structured_nearest_neighbor():
+    """Nearest-neighbor remapping picks the closest source cell along each axis."""
+    lon = np.arange(-179.5, 180.0, 1.0)
+    lat = np.arange(-89.5, 90.0, 1.0)
+    lon_2d, lat_2d = np.meshgrid(lon, lat)
+    da = xr.DataArray(
+        lon_2d * 1000 + lat_2d, dims=("lat", "lon"), coords={"lon": lon, "lat": lat}
+    )
+    dest = ux.open_grid(mpasfile_QU)
+
+    out = ux.remap_structured(da, dest, method="nearest_neighbor", remap_to="nodes")
+
+    assert isinstance(out, UxDataArray)
+    expected_lon = np.clip(np.floor(dest.node_lon.values) + 0.5, -179.5, 179.5)
+    expected_lat = np.clip(np.floor(dest.node_lat.values) + 0.5, -89.5, 89.5)
+    nt.assert_allclose(out.values, expected_lon * 1000 + expected_lat)
+
+
+def test_remap_structured_regional():
+    """Destination points outside a regional source are set to NaN."""
+    ds = _structured_dataset(np.arange(200.5, 300.0, 1.0), np.arange(10.5, 40.0, 1.0))
+    dest = ux.open_grid(outCSne30)
+
+    out = ux.remap_structured(ds["t"], dest)
+
+    face_lon = dest.face_lon.values % 360
+    face_lat = dest.face_lat.values
+    inside = (face_lon > 201) & (face_lon < 299) & (face_lat > 11) & (face_lat < 39)
+    outside = (face_lon < 199) | (face_lon > 301) | (face_lat < 9) | (face_lat > 41)
+
+    assert not np.isnan(out.values[:, inside]).any()
+    assert np.isnan(out.values[:, outside]).all()
+    nt.assert_allclose(out.values[0, inside], face_lat[inside], atol=1e-10)
+
+
+def test_remap_structured_dask_lazy():
+    """Remapping a Dask-backed structured source stays lazy."""
+    import dask.array as da
+
+    ds = _structured_dataset(np.arange(0.0, 360.0, 2.0), np.arange(-89.0, 90.0, 2.0))
+    dest = ux.open_grid(mpasfile_QU)
+
+    expected = ux.remap_structured(ds, dest)
+    out = ux.remap_structured(ds.chunk({"time": 1}), dest)
+
+    assert isinstance(out["t"].data, da.Array)
+    nt.assert_allclose(out["t"].values, expected["t"].values)
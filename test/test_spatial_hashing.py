@@ -141,3 +141,73 @@ def test_list_of_coords_mpas_primal():
     assert bcoords.shape[0] == num_particles
     assert bcoords.shape[1] == 6 # max sides of an element
     assert np.all(face_ids >= 0) # All particles should be inside an element
+
+
+def test_hash_table_csr():
+    """Verifies that every face is stored in the hash cells covering its bounding box"""
+    uxgrid = ux.open_grid(gridfile_mpas)
+    spatial_hash = uxgrid.get_spatial_hash(layout="latlon")
+    offsets, face_ids = spatial_hash._face_hash_table
+
+    assert offsets.shape[0] == spatial_hash._nx * spatial_hash._ny + 1
+    assert offsets[-1] == face_ids.shape[0]
+    assert np.all(np.diff(offsets) >= 0)
+
+    # each face is found in the hash cells at the corners of its bounding box
+    lon_bounds = np.sort(uxgrid.face_bounds_lon.values, axis=1)
+    lat_bounds = uxgrid.face_bounds_lat.values
+    for lon_index, lat_index in [(0, 0), (1, 1)]:
+        corners = np.column_stack((lon_bounds[:, lon_index], lat_bounds[:, lat_index]))
+        cells = spatial_hash._hash_index(np.deg2rad(corners))
+        for face_id, cell in enumerate(cells):
+            assert face_id in face_ids[offsets[cell]:offsets[cell + 1]]
+
+
+def test_query_many_points():
+    """Verifies that a large batch of face centers is located in parallel"""
+    uxgrid = ux.Grid.from_structured(lon=np.linspace(0, 40, 81), lat=np.linspace(-20, 20, 81))
+    expected = np.arange(uxgrid.n_face)
+
+    coords = np.column_stack((uxgrid.face_lon.values, uxgrid.face_lat.values))
+    face_ids, bcoords = uxgrid.get_spatial_hash().query(coords)
+
+    np.testing.assert_array_equal(face_ids, expected)
+    np.testing.assert_allclose(bcoords.sum(axis=1), 1.0)
+
+
+@pytest.mark.parametrize("grid_file", [gridfile_CSne30, gridfile_mpas, gridfile_RLL1deg])
+def test_cubed_sphere_face_centers(grid_file):
+    """Verifies that the cubed-sphere layout locates every face center of a global grid, including
+    faces crossing the antimeridian or containing a pole"""
+    uxgrid = ux.open_grid(grid_file)
+    assert uxgrid.get_spatial_hash()._layout == "latlon"
+    spatial_hash = uxgrid.get_spatial_hash(layout="cubed_sphere")
+    assert spatial_hash._layout == "cubed_sphere"
+
+    coords = np.column_stack((uxgrid.face_lon.values, uxgrid.face_lat.values))
+    face_ids, bcoords = spatial_hash.query(coords)
+
+    np.testing.assert_array_equal(face_ids, np.arange(uxgrid.n_face))
+    np.testing.assert_allclose(bcoords.sum(axis=1), 1.0)
+
+
+def test_cubed_sphere_matches_point_in_face():
+    """Verifies that the cubed-sphere layout agrees with the winding-number search on random points"""
+    uxgrid = ux.open_grid(gridfile_CSne30)
+
+    rng = np.random.default_rng(0)
+    coords = np.column_stack((rng.uniform(-180, 180, 2000), rng.uniform(-90, 90, 2000)))
+    coords = np.vstack([coords, [[0.0, 90.0], [0.0, -90.0], [180.0, 0.0], [-180.0, 45.0]]])
+
+    face_ids, _ = uxgrid.get_spatial_hash(layout="cubed_sphere").query(coords)
+    expected = uxgrid.get_faces_containing_point(coords, return_counts=False)
+
+    assert np.all(face_ids >= 0)
+    for face_id, faces in zip(face_ids, expected):
+        assert face_id in faces
+
+
+def test_invalid_layout():
+    uxgrid = ux.open_grid(gridfile_CSne30)
+    with pytest.raises(ValueError):
+        uxgrid.get_spatial_hash(layout="healpix")
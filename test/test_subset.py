@@ -1,4 +1,5 @@
 import uxarray as ux
+import numpy as np
 import os
 
 import pytest
@@ -30,12 +31,14 @@ def test_repr():
     assert "bounding_box" in grid_repr
     assert "bounding_circle" in grid_repr
     assert "nearest_neighbor" in grid_repr
+    assert "polygon" in grid_repr
 
     # data array repr
     da_repr = uxds['t2m'].subset.__repr__()
     assert "bounding_box" in da_repr
     assert "bounding_circle" in da_repr
     assert "nearest_neighbor" in da_repr
+    assert "polygon" in da_repr
 
 
 def test_grid_face_isel():
@@ -175,6 +178,85 @@ def test_inverse_indices():
     assert subset.inverse_indices.face.values == 1
 
 
+def test_isel_remaps_connectivity():
+    """The connectivity of a subset refers to the same elements as the parent
+    grid, through the original indices kept on the subset."""
+    grid = ux.open_grid(GRID_PATHS[2])
+    grid.face_edge_connectivity
+    grid.node_face_connectivity
+
+    subsets = [
+        grid.isel(n_face=np.arange(0, grid.n_face, 7)),
+        grid.isel(n_node=np.arange(0, grid.n_node, 11)),
+        grid.isel(n_edge=np.arange(0, grid.n_edge, 13)),
+    ]
+    for subset in subsets:
+        face_indices = subset._ds["subgrid_face_indices"].values
+        node_indices = subset._ds["subgrid_node_indices"].values
+        edge_indices = subset._ds["subgrid_edge_indices"].values
+
+        for name, indices in [("face_node", node_indices), ("face_edge", edge_indices)]:
+            sub_conn = subset._ds[f"{name}_connectivity"].values
+            parent_conn = grid._ds[f"{name}_connectivity"].values[face_indices]
+            valid = sub_conn != ux.INT_FILL_VALUE
+            np.testing.assert_array_equal(valid, parent_conn != ux.INT_FILL_VALUE)
+            np.testing.assert_array_equal(indices[sub_conn[valid]], parent_conn[valid])
+
+
+def test_isel_carries_derived_quantities():
+    """Derived quantities populated on the parent grid are sliced into the
+    subset and match the values computed on the subset itself."""
+    grid = ux.open_grid(GRID_PATHS[2])
+    names = ["face_areas", "bounds", "face_x", "edge_x", "edge_face_distances",
+             "face_jacobian", "antimeridian_face_indices"]
+    for name in names:
+        getattr(grid, name)
+    grid.max_face_radius
+    grid.boundary_edge_indices
+
+    face_indices = np.arange(0, grid.n_face, 3)
+    subset = grid.isel(n_face=face_indices)
+    for name in ["face_areas", "bounds", "face_x", "edge_x", "edge_face_distances"]:
+        assert name in subset._ds
+
+    expected = ux.open_grid(GRID_PATHS[2])
+    expected.face_edge_connectivity
+    expected = expected.isel(n_face=face_indices)
+    for name in names:
+        np.testing.assert_allclose(
+            np.asarray(getattr(subset, name)), np.asarray(getattr(expected, name))
+        )
+    assert subset.max_face_radius == expected.max_face_radius
+    np.testing.assert_array_equal(
+        subset.boundary_edge_indices, expected.boundary_edge_indices
+    )
+    assert subset.boundary_edge_indices.size > 0
+
+
+def test_compact_subset_indices():
+    uxds = ux.open_dataset(quad_hex_grid_path, quad_hex_data_path)
+
+    with ux.set_options(compact_indices=True):
+        subset = uxds.uxgrid.isel(n_face=[1, 3], inverse_indices=(["face", "node"], True))
+        sub_da = uxds["t2m"].isel(n_face=[1, 3])
+
+    assert subset._ds["subgrid_face_indices"].dtype == np.int32
+    assert subset.inverse_indices.face.dtype == np.int32
+    np.testing.assert_array_equal(subset.inverse_indices.face, [1, 3])
+    np.testing.assert_array_equal(sub_da.values, uxds["t2m"].values[[1, 3]])
+
+    # the remapped connectivity is stored in the compact type as well
+    expected = uxds.uxgrid.isel(n_face=[1, 3])
+    assert subset.face_node_connectivity.dtype == np.int32
+    np.testing.assert_array_equal(
+        subset.face_node_connectivity, expected.face_node_connectivity
+    )
+
+    # indices keep the default type outside of the context
+    subset = uxds.uxgrid.isel(n_face=[1, 3])
+    assert subset._ds["subgrid_face_indices"].dtype == ux.INT_DTYPE
+
+
 def test_da_subset():
     uxds = ux.open_dataset(quad_hex_grid_path, quad_hex_data_path)
 
@@ -183,3 +265,65 @@ def test_da_subset():
     res3 = uxds['t2m'].subset.nearest_neighbor(center_coord=(0, 0), k=4)
 
     assert len(res1) == len(res2) == len(res3) == 4
+
+
+def test_polygon_subset():
+    from shapely.geometry import Polygon
+
+    uxgrid = ux.open_grid(GRID_PATHS[2])
+    basin = Polygon([(-80, 10), (-10, 12), (-15, 60), (-70, 55)])
+
+    intersects = uxgrid.subset.polygon(basin, return_mask=True)
+    within = uxgrid.subset.polygon(basin, predicate="within", return_mask=True)
+    assert intersects.shape == (uxgrid.n_face,)
+    assert 0 < within.sum() < intersects.sum()
+    assert not np.any(within & ~intersects)
+
+    # faces crossed by the boundary of the polygon intersect it, but are not within it
+    boundary, _, _ = uxgrid.get_faces_along_path(np.vstack([basin.exterior.coords]))
+    assert np.all(intersects[boundary])
+    assert not np.any(within[boundary])
+
+    # faces with their center inside the polygon intersect it
+    lon, lat = uxgrid.face_lon.values, uxgrid.face_lat.values
+    inside = (lon > -60) & (lon < -30) & (lat > 25) & (lat < 45)
+    assert np.all(intersects[inside])
+    assert not np.any(intersects[(lon > 0) & (lon < 90)])
+
+    subset = uxgrid.subset.polygon(basin, inverse_indices=True)
+    np.testing.assert_array_equal(subset.inverse_indices.face.values, np.flatnonzero(intersects))
+
+
+def test_polygon_subset_hole():
+    from shapely.geometry import Polygon
+
+    uxgrid = ux.open_grid(GRID_PATHS[2])
+    outer = [(-40, -40), (40, -40), (40, 40), (-40, 40)]
+    hole = [(-10, -10), (10, -10), (10, 10), (-10, 10)]
+
+    mask = uxgrid.subset.polygon(Polygon(outer, [hole]), predicate="within", return_mask=True)
+    full = uxgrid.subset.polygon(np.array(outer), predicate="within", return_mask=True)
+
+    lon, lat = uxgrid.face_lon.values, uxgrid.face_lat.values
+    in_hole = (np.abs(lon) < 5) & (np.abs(lat) < 5)
+    assert np.all(full[in_hole])
+    assert not np.any(mask[in_hole])
+    assert not np.any(mask & ~full)
+
+
+def test_polygon_subset_invalid():
+    uxgrid = ux.open_grid(quad_hex_grid_path)
+
+    with pytest.raises(ValueError):
+        uxgrid.subset.polygon([(0, 0), (10, 0), (10, 10)], predicate="touches")
+    with pytest.raises(ValueError):
+        uxgrid.subset.polygon([(0, 0), (10, 0)])
+    with pytest.raises(ValueError):
+        uxgrid.subset.polygon([(0, 0), (120, 0), (240, 0)])
+
+
+def test_da_polygon_subset():
+    uxds = ux.open_dataset(quad_hex_grid_path, quad_hex_data_path)
+
+    res = uxds['t2m'].subset.polygon([(-10, -10), (10, -10), (10, 10), (-10, 10)])
+    assert len(res) == 4
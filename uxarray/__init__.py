@@ -3,6 +3,8 @@ from .core.api import concat, open_dataset, open_grid, open_mfdataset
 from .core.dataarray import UxDataArray
 from .core.dataset import UxDataset
 from .grid import Grid
+from .options import set_options
+from .remap import RemapWeights, remap_structured
 
 try:
     from importlib.metadata import version as _version
@@ -26,4 +28,7 @@ __all__ = (
     "INT_DTYPE",
     "INT_FILL_VALUE",
     "Grid",
+    "RemapWeights",
+    "remap_structured",
+    "set_options",
 )
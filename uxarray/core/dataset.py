@@ -17,7 +17,6 @@ from uxarray.core.dataarray import UxDataArray
 from uxarray.core.utils import _map_dims_to_ugrid
 from uxarray.formatting_html import dataset_repr
 from uxarray.grid import Grid
-from uxarray.grid.dual import construct_dual
 from uxarray.grid.validation import _check_duplicate_nodes_indices
 from uxarray.io._healpix import get_zoom_from_cells
 from uxarray.plot.accessor import UxDatasetPlotAccessor
@@ -482,15 +481,8 @@ class UxDataset(xr.Dataset):
                 Warning,
             )
 
-        # Get dual mesh node face connectivity
-        dual_node_face_conn = construct_dual(grid=self.uxgrid)
-
         # Construct dual mesh
-        dual = self.uxgrid.from_topology(
-            self.uxgrid.face_lon.values,
-            self.uxgrid.face_lat.values,
-            dual_node_face_conn,
-        )
+        dual = self.uxgrid.get_dual()
 
         # Initialize new dataset
         dataset = uxarray.UxDataset(uxgrid=dual)
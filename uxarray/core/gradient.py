@@ -2,7 +2,7 @@ from typing import Optional
 
 import numpy as np
 
-from uxarray.constants import INT_FILL_VALUE
+from uxarray.options import _fill_value
 
 
 def _calculate_edge_face_difference(d_var, edge_faces, n_edge):
@@ -16,7 +16,7 @@ def _calculate_edge_face_difference(d_var, edge_faces, n_edge):
 
     edge_face_diff = np.zeros(dims)
 
-    saddle_mask = edge_faces[:, 1] != INT_FILL_VALUE
+    saddle_mask = edge_faces[:, 1] != _fill_value(edge_faces.dtype)
 
     edge_face_diff[..., saddle_mask] = (
         d_var[..., edge_faces[saddle_mask, 0]] - d_var[..., edge_faces[saddle_mask, 1]]
@@ -47,7 +47,7 @@ def _calculate_grad_on_edge_from_faces(
     """
 
     # obtain all edges that saddle two faces
-    saddle_mask = edge_faces[:, 1] != INT_FILL_VALUE
+    saddle_mask = edge_faces[:, 1] != _fill_value(edge_faces.dtype)
 
     grad = _calculate_edge_face_difference(d_var, edge_faces, n_edge)
 
@@ -34,8 +34,10 @@ def _compute_non_conservative_zonal_mean(uxda, latitudes, use_robust_weights=Fal
 
     bounds = uxgrid.bounds.values
 
+    offsets, faces = uxgrid.get_faces_at_constant_latitudes(latitudes)
+
     for i, lat in enumerate(latitudes):
-        face_indices = uxda.uxgrid.get_faces_at_constant_latitude(lat)
+        face_indices = faces[offsets[i] : offsets[i + 1]]
         z = np.sin(np.deg2rad(lat))
 
         fe = faces_edge_nodes_xyz[face_indices]
@@ -3,7 +3,7 @@ import pandas as pd
 import xarray as xr
 from numba import njit, prange
 
-from uxarray.constants import ERROR_TOLERANCE, INT_FILL_VALUE
+from uxarray.constants import ERROR_TOLERANCE, INT_DTYPE, INT_FILL_VALUE
 from uxarray.grid.arcs import (
     extreme_gca_latitude,
     point_within_gca,
@@ -557,3 +557,199 @@ def _get_latlonbox_width(latlonbox_rad):
     else:
         # Adjust for periodicity
         return 2 * np.pi - lon0 + lon1
+
+
+class _FaceBoundsIndex:
+    """Sorted interval index over the latitude and longitude bounds of each face.
+
+    The bounds are sorted by their lower endpoint, and two implicit binary trees
+    hold the maximum and minimum upper endpoint below each node. A line of
+    constant latitude or longitude then intersects the faces whose lower endpoint
+    lies in a sorted prefix and whose upper endpoint is large enough, and a band
+    contains the faces in a sorted suffix whose upper endpoint is small enough,
+    so that both queries cost O(log n + hits).
+
+    Faces whose longitude bounds cross the antimeridian (``min > max``) are split
+    into ``[min, 180]`` and ``[-180, max]`` for line queries, and kept apart for
+    band queries.
+
+    Parameters
+    ----------
+    face_bounds_lat : np.ndarray
+        Latitude bounds of each face, in degrees, with shape (n_face, 2).
+    face_bounds_lon : np.ndarray
+        Longitude bounds of each face, in degrees, with shape (n_face, 2).
+    """
+
+    def __init__(self, face_bounds_lat: np.ndarray, face_bounds_lon: np.ndarray):
+        faces = np.arange(face_bounds_lat.shape[0], dtype=INT_DTYPE)
+        self._lat = _SortedIntervals(
+            face_bounds_lat[:, 0], face_bounds_lat[:, 1], faces
+        )
+
+        lon_min, lon_max = face_bounds_lon[:, 0], face_bounds_lon[:, 1]
+        wraps = ~(lon_min < lon_max)
+        self._lon = _SortedIntervals(lon_min[~wraps], lon_max[~wraps], faces[~wraps])
+        self._lon_wrapped = _SortedIntervals(
+            lon_min[wraps], lon_max[wraps], faces[wraps]
+        )
+        n_wraps = np.count_nonzero(wraps)
+        self._lon_split = _SortedIntervals(
+            np.concatenate([lon_min[~wraps], lon_min[wraps], np.full(n_wraps, -180.0)]),
+            np.concatenate([lon_max[~wraps], np.full(n_wraps, 180.0), lon_max[wraps]]),
+            np.concatenate([faces[~wraps], faces[wraps], faces[wraps]]),
+        )
+
+    def faces_at_latitude(self, lat: float) -> np.ndarray:
+        """Indices of the faces whose latitude bounds contain ``lat``."""
+        offsets, faces = self._lat.stab(np.array([lat], dtype=np.float64))
+        return faces
+
+    def faces_at_latitudes(self, lats) -> tuple[np.ndarray, np.ndarray]:
+        """CSR ``(offsets, faces)`` of the faces whose latitude bounds contain each
+        of ``lats``, where the faces of ``lats[i]`` are
+        ``faces[offsets[i]:offsets[i + 1]]``."""
+        return self._lat.stab(np.asarray(lats, dtype=np.float64).ravel())
+
+    def faces_at_longitude(self, lon: float) -> np.ndarray:
+        """Indices of the faces whose longitude bounds contain ``lon``."""
+        offsets, faces = self._lon_split.stab(np.array([lon], dtype=np.float64))
+        # a face is split in two only if it wraps, so it may be hit twice at most
+        return np.unique(faces)
+
+    def faces_between_latitudes(self, lats) -> np.ndarray:
+        """Indices of the faces whose latitude bounds lie within ``lats``."""
+        min_lat, max_lat = lats
+        return self._lat.within(min_lat, max_lat)
+
+    def faces_between_longitudes(self, lons) -> np.ndarray:
+        """Indices of the faces whose longitude bounds lie within ``lons``, which
+        crosses the antimeridian when ``lons[0] > lons[1]``."""
+        min_lon, max_lon = lons
+        if min_lon <= max_lon:
+            return self._lon.within(min_lon, max_lon)
+
+        faces = np.concatenate(
+            [
+                self._lon.within(min_lon, 180.0),
+                self._lon.within(-180.0, max_lon),
+                self._lon_wrapped.within(min_lon, max_lon),
+            ]
+        )
+        return np.unique(faces)
+
+
+class _SortedIntervals:
+    """Closed intervals sorted by their lower endpoint, with max and min trees over
+    their upper endpoints. Used by ``_FaceBoundsIndex``."""
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray, ids: np.ndarray):
+        order = np.argsort(lower, kind="stable")
+        self.lower = np.ascontiguousarray(lower[order], dtype=np.float64)
+        self.ids = np.ascontiguousarray(ids[order], dtype=INT_DTYPE)
+        upper = np.ascontiguousarray(upper[order], dtype=np.float64)
+        self.upper_max = _build_extremum_tree(upper, True)
+        self.upper_min = _build_extremum_tree(upper, False)
+
+    def stab(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """CSR ``(offsets, ids)`` of the intervals containing each value."""
+        ends = np.searchsorted(self.lower, values, side="right")
+        return _stab_intervals(self.upper_max, self.ids, ends, values)
+
+    def within(self, low: float, high: float) -> np.ndarray:
+        """Ids of the intervals contained in ``[low, high]``."""
+        start = np.searchsorted(self.lower, low, side="left")
+        out = np.empty(self.ids.shape[0] - start, dtype=INT_DTYPE)
+        count = _report_leaves(
+            self.upper_min, start, self.ids.shape[0], high, False, out
+        )
+        return np.sort(self.ids[out[:count]])
+
+
+def _build_extremum_tree(values: np.ndarray, use_max: bool) -> np.ndarray:
+    """Builds an implicit binary tree of shape (2 * size,), whose leaves
+    ``size + i`` hold ``values[i]`` and whose node ``j`` holds the maximum (or
+    minimum) of its children ``2j`` and ``2j + 1``. NaN values are ignored."""
+    size = 1
+    while size < values.shape[0]:
+        size *= 2
+
+    tree = np.full(2 * size, -np.inf if use_max else np.inf, dtype=np.float64)
+    tree[size : size + values.shape[0]] = values
+
+    reduce = np.fmax if use_max else np.fmin
+    level = size
+    while level > 1:
+        tree[level // 2 : level] = reduce(
+            tree[level : 2 * level : 2], tree[level + 1 : 2 * level : 2]
+        )
+        level //= 2
+    return tree
+
+
+@njit(cache=True)
+def _report_leaves(tree, start, end, threshold, use_max, out):
+    """Stores in ``out`` the leaves in ``[start, end)`` whose value is at least
+    (``use_max``) or at most ``threshold``, and returns how many were found.
+    Nothing is stored when ``out`` is empty."""
+    size = tree.shape[0] // 2
+    if start >= end or size == 0:
+        return 0
+
+    # each level pops one node and pushes at most two
+    stack_node = np.empty(2 * 64, dtype=np.int64)
+    stack_lo = np.empty(2 * 64, dtype=np.int64)
+    stack_hi = np.empty(2 * 64, dtype=np.int64)
+    stack_node[0], stack_lo[0], stack_hi[0] = 1, 0, size
+    top = 1
+    count = 0
+
+    while top > 0:
+        top -= 1
+        node, lo, hi = stack_node[top], stack_lo[top], stack_hi[top]
+        if hi <= start or lo >= end:
+            continue
+
+        value = tree[node]
+        if use_max:
+            if not value >= threshold:
+                continue
+        elif not value <= threshold:
+            continue
+
+        if node >= size:
+            if out.shape[0] > 0:
+                out[count] = node - size
+            count += 1
+            continue
+
+        mid = (lo + hi) // 2
+        stack_node[top], stack_lo[top], stack_hi[top] = 2 * node + 1, mid, hi
+        stack_node[top + 1], stack_lo[top + 1], stack_hi[top + 1] = 2 * node, lo, mid
+        top += 2
+
+    return count
+
+
+@njit(cache=True, parallel=True)
+def _stab_intervals(upper_max, ids, ends, values):
+    """Returns CSR ``(offsets, ids)`` of the intervals containing each value, where
+    the candidates of ``values[i]`` are the sorted intervals ``[0, ends[i])``."""
+    n = values.shape[0]
+    empty = np.empty(0, dtype=np.int64)
+
+    counts = np.zeros(n, dtype=np.int64)
+    for i in prange(n):
+        counts[i] = _report_leaves(upper_max, 0, ends[i], values[i], True, empty)
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+
+    hits = np.empty(offsets[n], dtype=ids.dtype)
+    for i in prange(n):
+        leaves = np.empty(counts[i], dtype=np.int64)
+        if counts[i] > 0:
+            _report_leaves(upper_max, 0, ends[i], values[i], True, leaves)
+        hits[offsets[i] : offsets[i + 1]] = np.sort(ids[leaves])
+
+    return offsets, hits
@@ -4,6 +4,11 @@ from numba import njit
 
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 from uxarray.conventions import ugrid
+from uxarray.options import OPTIONS, _as_index_array, _fill_value
+
+CSR_CONNECTIVITY_NAMES = tuple(
+    name.removesuffix("_connectivity") for name in ugrid.CONNECTIVITY_NAMES
+)
 
 
 def close_face_nodes(face_node_connectivity, n_face, n_max_face_nodes):
@@ -34,14 +39,18 @@ def close_face_nodes(face_node_connectivity, n_face, n_max_face_nodes):
         [4, 5, 6, 7, 8, 4]
     """
 
+    fill_value = _fill_value(face_node_connectivity.dtype)
+
     # padding to shape [n_face, n_max_face_nodes + 1]
-    closed = np.ones((n_face, n_max_face_nodes + 1), dtype=INT_DTYPE) * INT_FILL_VALUE
+    closed = np.full(
+        (n_face, n_max_face_nodes + 1), fill_value, dtype=face_node_connectivity.dtype
+    )
 
     # set all non-paded values to original face nodee values
     closed[:, :-1] = face_node_connectivity.copy()
 
     # instance of first fill value
-    first_fv_idx_2d = np.argmax(closed == INT_FILL_VALUE, axis=1)
+    first_fv_idx_2d = np.argmax(closed == fill_value, axis=1)
 
     # 2d to 1d index for np.put()
     first_fv_idx_1d = first_fv_idx_2d + ((n_max_face_nodes + 1) * np.arange(0, n_face))
@@ -120,6 +129,41 @@ def _replace_fill_values(grid_var, original_fill, new_fill, new_dtype=None):
     return grid_var
 
 
+def _connectivity_array(values, n_elements, dims, attrs):
+    """Wraps a padded connectivity array, whose values are smaller than
+    ``n_elements``, in a ``xr.DataArray`` with the index type returned by
+    ``_index_dtype`` and a ``_FillValue`` attribute matching that type."""
+    values = _as_index_array(values, n_elements)
+    return xr.DataArray(
+        data=values,
+        dims=dims,
+        attrs={**attrs, "_FillValue": _fill_value(values.dtype)},
+    )
+
+
+def _compact_connectivity(grid_ds):
+    """Returns a grid dataset with its connectivity variables stored as
+    ``int32`` when the ``compact_indices`` option is set and the element counts
+    allow it, keeping their fill values."""
+    if not OPTIONS["compact_indices"]:
+        return grid_ds
+
+    compacted = {}
+    for name in ugrid.CONNECTIVITY_NAMES:
+        if name not in grid_ds:
+            continue
+        conn = grid_ds[name]
+        n_elements = grid_ds.sizes.get(f"n_{name.split('_')[1]}")
+        if n_elements is None:
+            n_elements = int(conn.max()) + 1
+        values = _as_index_array(conn.values, n_elements)
+        if values.dtype != conn.dtype:
+            compacted[name] = conn.copy(data=values)
+            if "_FillValue" in conn.attrs:
+                compacted[name].attrs["_FillValue"] = _fill_value(values.dtype)
+    return grid_ds.assign(compacted) if compacted else grid_ds
+
+
 def _populate_n_nodes_per_face(grid):
     """Constructs the connectivity variable (``n_nodes_per_face``) and stores
     it within the internal (``Grid._ds``) and through the attribute
@@ -147,11 +191,12 @@ def _build_n_nodes_per_face(face_nodes, n_face, n_max_face_nodes):
     value nodes for each face in ``face_node_connectivity``"""
 
     n_face, n_max_face_nodes = face_nodes.shape
+    fill_value = _fill_value(face_nodes.dtype)
     n_nodes_per_face = np.empty(n_face, dtype=INT_DTYPE)
     for i in range(n_face):
         c = 0
         for j in range(n_max_face_nodes):
-            if face_nodes[i, j] != INT_FILL_VALUE:
+            if face_nodes[i, j] != fill_value:
                 c += 1
         n_nodes_per_face[i] = c
     return n_nodes_per_face
@@ -166,12 +211,16 @@ def _populate_edge_node_connectivity(grid):
         grid.face_node_connectivity.values, grid.n_face, grid.n_max_face_nodes
     )
 
-    edge_node_attrs = ugrid.EDGE_NODE_CONNECTIVITY_ATTRS
-    edge_node_attrs["inverse_indices"] = inverse_indices
+    edge_node_attrs = {
+        **ugrid.EDGE_NODE_CONNECTIVITY_ATTRS,
+        "inverse_indices": _as_index_array(inverse_indices, edge_nodes.shape[0]),
+    }
 
     # add edge_node_connectivity to internal dataset
     grid._ds["edge_node_connectivity"] = xr.DataArray(
-        edge_nodes, dims=ugrid.EDGE_NODE_CONNECTIVITY_DIMS, attrs=edge_node_attrs
+        _as_index_array(edge_nodes, grid.n_node),
+        dims=ugrid.EDGE_NODE_CONNECTIVITY_DIMS,
+        attrs=edge_node_attrs,
     )
 
 
@@ -184,53 +233,59 @@ def _build_edge_node_connectivity(face_nodes, n_face, n_max_face_nodes):
     (``fill_value_mask``) are stored for constructing other
     connectivity variables.
 
+    Edges are deduplicated by encoding each sorted node pair as a single 64-bit
+    key, which avoids a row-wise ``np.unique`` over the pairs. The edge nodes
+    are stored with the index type of ``face_nodes``.
+
     Parameters
     ----------
-    repopulate : bool, optional
-        Flag used to indicate if we want to overwrite the existed `edge_node_connectivity` and generate a new
-        inverse_indices, default is False
+    face_nodes : np.ndarray
+        Face node connectivity
+    n_face : int
+        Number of faces
+    n_max_face_nodes : int
+        Max number of nodes that compose a face
+
+    Returns
+    -------
+    edge_nodes : np.ndarray
+        Unique edges, sorted by their (smallest, largest) node indices
+    inverse_indices : np.ndarray
+        Edge of every (face, side) slot, with fill values for padded slots
+    fill_value_mask : np.ndarray
+        Whether each (face, side) slot is padded
     """
 
     padded_face_nodes = close_face_nodes(face_nodes, n_face, n_max_face_nodes)
 
-    # array of empty edge nodes where each entry is a pair of indices
-    edge_nodes = np.empty((n_face * n_max_face_nodes, 2), dtype=INT_DTYPE)
-
-    # first index includes starting node up to non-padded value
-    edge_nodes[:, 0] = padded_face_nodes[:, :-1].ravel()
-
-    # second index includes second node up to padded value
-    edge_nodes[:, 1] = padded_face_nodes[:, 1:].ravel()
+    # start and end node of every (possibly padded) edge slot, smallest first
+    first_nodes = padded_face_nodes[:, :-1].ravel()
+    second_nodes = padded_face_nodes[:, 1:].ravel()
+    lower = np.minimum(first_nodes, second_nodes)
+    upper = np.maximum(first_nodes, second_nodes)
 
-    # sorted edge nodes
-    edge_nodes.sort(axis=1)
-
-    # unique edge nodes
-    edge_nodes_unique, inverse_indices = np.unique(
-        edge_nodes, return_inverse=True, axis=0
-    )
-    # find all edge nodes that contain a fill value
+    # edge slots that contain a fill value
+    fill_value = _fill_value(face_nodes.dtype)
     fill_value_mask = np.logical_or(
-        edge_nodes_unique[:, 0] == INT_FILL_VALUE,
-        edge_nodes_unique[:, 1] == INT_FILL_VALUE,
+        first_nodes == fill_value, second_nodes == fill_value
     )
-
-    # all edge nodes that do not contain a fill value
     non_fill_value_mask = np.logical_not(fill_value_mask)
-    edge_nodes_unique = edge_nodes_unique[non_fill_value_mask]
 
-    # Update inverse_indices accordingly
-    indices_to_update = np.where(fill_value_mask)[0]
+    # encode each (lower, upper) pair as a single 64-bit key, which preserves the
+    # lexicographic order of the pairs, and deduplicate the one-dimensional keys
+    n_node = int(upper[non_fill_value_mask].max(initial=-1)) + 1
+    keys = lower[non_fill_value_mask].astype(np.int64) * n_node + upper[
+        non_fill_value_mask
+    ].astype(np.int64)
+    unique_keys, unique_inverse = np.unique(keys, return_inverse=True)
 
-    remove_mask = np.isin(inverse_indices, indices_to_update)
-    inverse_indices[remove_mask] = INT_FILL_VALUE
+    edge_nodes_unique = np.empty((unique_keys.size, 2), dtype=face_nodes.dtype)
+    edge_nodes_unique[:, 0] = unique_keys // n_node
+    edge_nodes_unique[:, 1] = unique_keys % n_node
 
-    # Compute the indices where inverse_indices exceeds the values in indices_to_update
-    indexes = np.searchsorted(indices_to_update, inverse_indices, side="right")
-    # subtract the corresponding indexes from `inverse_indices`
-    for i in range(len(inverse_indices)):
-        if inverse_indices[i] != INT_FILL_VALUE:
-            inverse_indices[i] -= indexes[i]
+    # padded edge slots map to the fill value
+    inverse_indices = np.full(first_nodes.size, INT_FILL_VALUE, dtype=INT_DTYPE)
+    inverse_indices[non_fill_value_mask] = unique_inverse.ravel()
 
     return edge_nodes_unique, inverse_indices, fill_value_mask
 
@@ -243,17 +298,19 @@ def _populate_edge_face_connectivity(grid):
         grid.face_edge_connectivity.values, grid.n_nodes_per_face.values, grid.n_edge
     )
 
-    grid._ds["edge_face_connectivity"] = xr.DataArray(
-        data=edge_faces,
-        dims=ugrid.EDGE_FACE_CONNECTIVITY_DIMS,
-        attrs=ugrid.EDGE_FACE_CONNECTIVITY_ATTRS,
+    grid._ds["edge_face_connectivity"] = _connectivity_array(
+        edge_faces,
+        grid.n_face,
+        ugrid.EDGE_FACE_CONNECTIVITY_DIMS,
+        ugrid.EDGE_FACE_CONNECTIVITY_ATTRS,
     )
 
 
 @njit(cache=True)
 def _build_edge_face_connectivity(face_edges, n_nodes_per_face, n_edge):
     """Helper for (``edge_face_connectivity``) construction."""
-    edge_faces = np.ones(shape=(n_edge, 2), dtype=face_edges.dtype) * INT_FILL_VALUE
+    fill_value = _fill_value(face_edges.dtype)
+    edge_faces = np.full((n_edge, 2), fill_value, dtype=face_edges.dtype)
 
     for face_idx, (cur_face_edges, n_edges) in enumerate(
         zip(face_edges, n_nodes_per_face)
@@ -261,7 +318,7 @@ def _build_edge_face_connectivity(face_edges, n_nodes_per_face, n_edge):
         # obtain all the edges that make up a face (excluding fill values)
         edges = cur_face_edges[:n_edges]
         for edge_idx in edges:
-            if edge_faces[edge_idx, 0] == INT_FILL_VALUE:
+            if edge_faces[edge_idx, 0] == fill_value:
                 edge_faces[edge_idx, 0] = face_idx
             else:
                 edge_faces[edge_idx, 1] = face_idx
@@ -286,10 +343,11 @@ def _populate_face_edge_connectivity(grid):
         grid.n_max_face_nodes,
     )
 
-    grid._ds["face_edge_connectivity"] = xr.DataArray(
-        data=face_edges,
-        dims=ugrid.FACE_EDGE_CONNECTIVITY_DIMS,
-        attrs=ugrid.FACE_EDGE_CONNECTIVITY_ATTRS,
+    grid._ds["face_edge_connectivity"] = _connectivity_array(
+        face_edges,
+        grid.n_edge,
+        ugrid.FACE_EDGE_CONNECTIVITY_DIMS,
+        ugrid.FACE_EDGE_CONNECTIVITY_ATTRS,
     )
 
 
@@ -304,51 +362,166 @@ def _populate_node_face_connectivity(grid):
     and stores it within the internal (``Grid._ds``) and through the attribute
     (``Grid.node_face_connectivity``)."""
 
-    node_faces, n_max_faces_per_node = _build_node_faces_connectivity(
-        grid.face_node_connectivity.values, grid.n_node
-    )
+    offsets, faces = _cached_or_built_csr(grid, "node_face")
+    node_faces = _csr_to_padded(offsets, faces, _max_row_length(offsets))
 
-    grid._ds["node_face_connectivity"] = xr.DataArray(
+    grid._ds["node_face_connectivity"] = _connectivity_array(
         node_faces,
-        dims=ugrid.NODE_FACE_CONNECTIVITY_DIMS,
-        attrs=ugrid.NODE_FACE_CONNECTIVITY_ATTRS,
+        grid.n_face,
+        ugrid.NODE_FACE_CONNECTIVITY_DIMS,
+        ugrid.NODE_FACE_CONNECTIVITY_ATTRS,
     )
 
 
-def _build_node_faces_connectivity(face_nodes, n_node):
-    """Builds the `Grid.node_faces_connectivity`: integer DataArray of size
-    (n_node, n_max_faces_per_node) (optional) A DataArray of indices indicating
-    faces that are neighboring each node.
+@njit(cache=True)
+def _build_node_face_csr(face_nodes, n_node):
+    """Builds the faces of each node in CSR form with a counting sort over
+    ``face_node_connectivity``, in two passes.
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Array of shape (n_node + 1,), where the faces of node ``i`` are
+        ``faces[offsets[i]:offsets[i + 1]]``
+    faces : np.ndarray
+        Face indices, in ascending order for each node
+    """
+    n_face, n_max_face_nodes = face_nodes.shape
+    fill_value = _fill_value(face_nodes.dtype)
+
+    offsets = np.zeros(n_node + 1, dtype=INT_DTYPE)
+    for face_i in range(n_face):
+        for j in range(n_max_face_nodes):
+            node_i = face_nodes[face_i, j]
+            if node_i != fill_value:
+                offsets[node_i + 1] += 1
+    for node_i in range(n_node):
+        offsets[node_i + 1] += offsets[node_i]
+
+    faces = np.empty(offsets[n_node], dtype=INT_DTYPE)
+    position = offsets[:-1].copy()
+    for face_i in range(n_face):
+        for j in range(n_max_face_nodes):
+            node_i = face_nodes[face_i, j]
+            if node_i != fill_value:
+                faces[position[node_i]] = face_i
+                position[node_i] += 1
+
+    return offsets, faces
 
-    This function converts the face-node connectivity data into a sparse matrix, and then constructs the node-face
-    connectivity by iterating over each node in the mesh and retrieving the set of neighboring faces.
 
-    Raises
-    ------
-    RuntimeError
-        If the Mesh object does not contain a 'face_node_connectivity' variable.
+@njit(cache=True)
+def _group_by_row(rows, values, n_rows):
+    """Groups ``values`` by their row in CSR form with a stable counting sort,
+    keeping the original order of the values within each row.
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Array of shape (n_rows + 1,), where the values of row ``i`` are
+        ``grouped[offsets[i]:offsets[i + 1]]``
+    grouped : np.ndarray
+        The values, grouped by row
     """
+    offsets = np.zeros(n_rows + 1, dtype=INT_DTYPE)
+    for k in range(rows.shape[0]):
+        offsets[rows[k] + 1] += 1
+    for i in range(n_rows):
+        offsets[i + 1] += offsets[i]
 
-    node_face_conn = {node_i: [] for node_i in range(n_node)}
-    for face_i, face_nodes in enumerate(face_nodes):
-        for node_i in face_nodes:
-            if node_i != INT_FILL_VALUE:
-                node_face_conn[node_i].append(face_i)
+    grouped = np.empty(rows.shape[0], dtype=values.dtype)
+    position = offsets[:-1].copy()
+    for k in range(rows.shape[0]):
+        grouped[position[rows[k]]] = values[k]
+        position[rows[k]] += 1
 
-    n_max_node_faces = -1
-    for face_indicies in node_face_conn.values():
-        if len(face_indicies) > n_max_node_faces:
-            n_max_node_faces = len(face_indicies)
+    return offsets, grouped
 
-    node_face_connectivity = np.full(
-        (n_node, n_max_node_faces), INT_FILL_VALUE, dtype=INT_DTYPE
-    )
 
-    for node_idx, face_indices in enumerate(node_face_conn.values()):
-        n_faces = len(face_indices)
-        node_face_connectivity[node_idx, 0:n_faces] = face_indices
+def _max_row_length(offsets):
+    """Returns the length of the longest row of a CSR array."""
+    return int(np.diff(offsets).max()) if offsets.shape[0] > 1 else 0
+
+
+@njit(cache=True)
+def _csr_to_padded(offsets, values, n_cols):
+    """Converts a CSR array into a dense array of shape (n_rows, n_cols), with one
+    row per CSR row padded with the fill value of the type of ``values``."""
+    n_rows = offsets.shape[0] - 1
+    fill_value = _fill_value(values.dtype)
+    padded = np.empty((n_rows, n_cols), dtype=values.dtype)
+    for i in range(n_rows):
+        start = offsets[i]
+        n = offsets[i + 1] - start
+        for k in range(n):
+            padded[i, k] = values[start + k]
+        for k in range(n, n_cols):
+            padded[i, k] = fill_value
+    return padded
+
+
+def _cached_or_built_csr(grid, name):
+    """Returns the CSR form of a connectivity variable, reusing the one cached by
+    ``Grid.connectivity_csr`` if present, without caching a newly built one."""
+    if name in grid._connectivity_csr:
+        return grid._connectivity_csr[name]
+    return _build_connectivity_csr(grid, name)
+
+
+def _padded_to_csr(padded):
+    """Converts a dense array padded with the fill value of its type into CSR
+    form, keeping the order of the values within each row.
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Array of shape (n_rows + 1,), where the values of row ``i`` are
+        ``values[offsets[i]:offsets[i + 1]]``
+    values : np.ndarray
+        The non-fill values of each row
+    """
+    valid = padded != _fill_value(padded.dtype)
+    offsets = np.zeros(padded.shape[0] + 1, dtype=INT_DTYPE)
+    np.cumsum(valid.sum(axis=1), out=offsets[1:])
+    return offsets, padded[valid]
+
 
-    return node_face_connectivity, n_max_node_faces
+def _build_connectivity_csr(grid, name):
+    """Builds the CSR form of the connectivity variable ``{name}_connectivity``.
+
+    ``node_face`` and ``node_edge`` are built directly from
+    ``face_node_connectivity`` and ``edge_node_connectivity`` when their padded
+    arrays have not been constructed, so that high-valence nodes do not require
+    a wide padded array. All other connectivity variables are converted from
+    their padded arrays. Both arrays are stored as ``int32`` when the
+    ``compact_indices`` option is set and the element counts allow it.
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Array of shape (n_rows + 1,), where the indices of element ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``
+    indices : np.ndarray
+        The connected element indices
+    """
+    if name not in CSR_CONNECTIVITY_NAMES:
+        raise ValueError(
+            f"Invalid connectivity: {name!r}. Expected one of {CSR_CONNECTIVITY_NAMES}"
+        )
+
+    if name == "node_face" and "node_face_connectivity" not in grid._ds:
+        offsets, indices = _build_node_face_csr(
+            grid.face_node_connectivity.values, grid.n_node
+        )
+    elif name == "node_edge" and "node_edge_connectivity" not in grid._ds:
+        offsets, indices = _build_node_edge_csr(
+            grid.edge_node_connectivity.values, grid.n_node
+        )
+    else:
+        offsets, indices = _padded_to_csr(getattr(grid, f"{name}_connectivity").values)
+
+    n_elements = getattr(grid, f"n_{name.split('_')[1]}")
+    return _as_index_array(offsets, indices.size), _as_index_array(indices, n_elements)
 
 
 def _face_nodes_to_sparse_matrix(dense_matrix: np.ndarray) -> tuple:
@@ -386,7 +559,7 @@ def _face_nodes_to_sparse_matrix(dense_matrix: np.ndarray) -> tuple:
     """
     n_rows, n_cols = dense_matrix.shape
     flattened_matrix = dense_matrix.ravel()
-    valid_node_mask = flattened_matrix != INT_FILL_VALUE
+    valid_node_mask = flattened_matrix != _fill_value(dense_matrix.dtype)
     face_indices = np.repeat(np.arange(n_rows), n_cols)[valid_node_mask]
     node_indices = flattened_matrix[valid_node_mask]
     non_filled_element_flags = np.ones(len(node_indices))
@@ -421,85 +594,54 @@ def _populate_face_face_connectivity(grid):
     (``Grid.face_face_connectivity``)."""
     face_face = _build_face_face_connectivity(grid)
 
-    grid._ds["face_face_connectivity"] = xr.DataArray(
-        data=face_face,
-        dims=ugrid.FACE_FACE_CONNECTIVITY_DIMS,
-        attrs=ugrid.FACE_FACE_CONNECTIVITY_ATTRS,
+    grid._ds["face_face_connectivity"] = _connectivity_array(
+        face_face,
+        grid.n_face,
+        ugrid.FACE_FACE_CONNECTIVITY_DIMS,
+        ugrid.FACE_FACE_CONNECTIVITY_ATTRS,
     )
 
 
 def _build_face_face_connectivity(grid):
-    """Returns face-face connectivity."""
-
-    # Dictionary to store each faces adjacent faces
-    face_neighbors = {i: [] for i in range(grid.n_face)}
-
-    # Loop through each edge_face and add to the dictionary every face that shares an edge
-    for edge_face in grid.edge_face_connectivity.values:
-        face1, face2 = edge_face
-        if face1 != INT_FILL_VALUE and face2 != INT_FILL_VALUE:
-            # Append to each face's dictionary index the opposite face index
-            face_neighbors[face1].append(face2)
-            face_neighbors[face2].append(face1)
-
-    # Convert to an array and pad it with fill values
-    face_face_conn = list(face_neighbors.values())
-    face_face_connectivity = [
-        np.pad(
-            arr, (0, grid.n_max_face_edges - len(arr)), constant_values=INT_FILL_VALUE
-        )
-        for arr in face_face_conn
-    ]
+    """Returns face-face connectivity.
+
+    Both directions of each interior edge are scattered as (face, neighbor)
+    pairs, which are grouped by face with a stable counting sort, so that the
+    neighbors of each face are ordered by edge index.
+    """
+    edge_faces = _as_index_array(grid.edge_face_connectivity.values, grid.n_face)
+    interior = np.all(edge_faces != _fill_value(edge_faces.dtype), axis=1)
 
-    return face_face_connectivity
+    # (face1, face2) and (face2, face1) for each interior edge, in edge order
+    faces = edge_faces[interior].ravel()
+    neighbors = edge_faces[interior][:, ::-1].ravel()
+
+    offsets, neighbors = _group_by_row(faces, neighbors, grid.n_face)
+    n_cols = max(grid.n_max_face_edges, _max_row_length(offsets))
+    return _csr_to_padded(offsets, neighbors, n_cols)
 
 
 def _populate_node_edge_connectivity(grid):
     """Constructs the UGRID connectivity variable (``edge_node_connectivity``)
     and stores it within the internal (``Grid._ds``) and through the attribute
     (``Grid.edge_node_connectivity``)."""
-    node_edge_connectivity = _build_node_edge_connectivity(
-        grid.edge_node_connectivity.values, grid.n_node
-    )
-
-    grid._ds["node_edge_connectivity"] = xr.DataArray(
-        data=node_edge_connectivity,
-        dims=ugrid.NODE_EDGE_CONNECTIVITY_DIMS,
-        attrs=ugrid.NODE_EDGE_CONNECTIVITY_ATTRS,
+    offsets, edges = _cached_or_built_csr(grid, "node_edge")
+    node_edge_connectivity = _csr_to_padded(offsets, edges, _max_row_length(offsets))
+
+    grid._ds["node_edge_connectivity"] = _connectivity_array(
+        node_edge_connectivity,
+        grid.n_edge,
+        ugrid.NODE_EDGE_CONNECTIVITY_DIMS,
+        ugrid.NODE_EDGE_CONNECTIVITY_ATTRS,
     )
 
 
-@njit
-def _build_node_edge_connectivity(edge_nodes, n_node):
-    """Constructs the Node Edge Connectivity, which stores the indices of the edges that are shared by each node."""
+def _build_node_edge_csr(edge_nodes, n_node):
+    """Builds the edges of each node in CSR form, with the edges of each node in
+    ascending order."""
     n_edge, nodes_per_edge = edge_nodes.shape
+    nodes = edge_nodes.ravel()
+    edges = np.repeat(np.arange(n_edge, dtype=INT_DTYPE), nodes_per_edge)
 
-    # count how many edges touch each node
-    counts = np.zeros(n_node, dtype=INT_DTYPE)
-    for e in range(n_edge):
-        for j in range(nodes_per_edge):
-            node = edge_nodes[e, j]
-            if node != INT_FILL_VALUE:
-                counts[node] += 1
-
-    # find the maximum
-    max_edges = 0
-    for i in range(n_node):
-        if counts[i] > max_edges:
-            max_edges = counts[i]
-
-    # allocate output, pad with fill
-    node_edge = np.full((n_node, max_edges), INT_FILL_VALUE, dtype=INT_DTYPE)
-
-    ptr = np.zeros(n_node, dtype=INT_DTYPE)
-
-    # fill in
-    for e in range(n_edge):
-        for j in range(nodes_per_edge):
-            node = edge_nodes[e, j]
-            if node != INT_FILL_VALUE:
-                idx = ptr[node]
-                node_edge[node, idx] = e
-                ptr[node] += 1
-
-    return node_edge
+    valid = nodes != _fill_value(nodes.dtype)
+    return _group_by_row(nodes[valid], edges[valid], n_node)
@@ -1,7 +1,7 @@
 import numpy as np
 from numba import njit, prange
 
-from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
+from uxarray.options import _fill_value
 
 
 def construct_dual(grid):
@@ -29,18 +29,19 @@ def construct_dual(grid):
     node_x = grid.node_x.values
     node_y = grid.node_y.values
     node_z = grid.node_z.values
-    node_face_connectivity = grid.node_face_connectivity.values
+    node_face_offsets, node_faces = grid.connectivity_csr("node_face")
 
     # Get an array with the number of edges for each face
-    n_edges_mask = node_face_connectivity != INT_FILL_VALUE
-    n_edges = np.sum(n_edges_mask, axis=1)
-    max_edges = node_face_connectivity.shape[1]
+    n_edges = np.diff(node_face_offsets)
+    max_edges = int(n_edges.max()) if n_edges.size else 0
 
     # Only nodes with 3+ edges can form valid dual faces
     valid_node_indices = np.where(n_edges >= 3)[0]
 
     construct_node_face_connectivity = np.full(
-        (len(valid_node_indices), max_edges), INT_FILL_VALUE, dtype=INT_DTYPE
+        (len(valid_node_indices), max_edges),
+        _fill_value(node_faces.dtype),
+        dtype=node_faces.dtype,
     )
 
     # Construct and return the faces
@@ -50,7 +51,8 @@ def construct_dual(grid):
         dual_node_x,
         dual_node_y,
         dual_node_z,
-        node_face_connectivity,
+        node_face_offsets,
+        node_faces,
         node_x,
         node_y,
         node_z,
@@ -68,15 +70,16 @@ def construct_faces(
     dual_node_x,
     dual_node_y,
     dual_node_z,
-    node_face_connectivity,
+    node_face_offsets,
+    node_faces,
     node_x,
     node_y,
     node_z,
     construct_node_face_connectivity,
     max_edges,
 ):
-    """Construct the faces of the dual mesh based on a given
-    node_face_connectivity.
+    """Construct the faces of the dual mesh based on the faces around each node
+    of the primal mesh, in CSR form.
 
     Parameters
     ----------
@@ -90,8 +93,10 @@ def construct_faces(
         y coordinates for the dual mesh nodes (face centers of primal mesh)
     dual_node_z: np.ndarray
         z coordinates for the dual mesh nodes (face centers of primal mesh)
-    node_face_connectivity: np.ndarray
-        Node-to-face connectivity of the primal mesh
+    node_face_offsets: np.ndarray
+        Offsets of the faces of each primal node in ``node_faces``
+    node_faces: np.ndarray
+        Faces of each primal node, as returned by ``Grid.connectivity_csr("node_face")``
     node_x: np.ndarray
         x coordinates of nodes from the primal mesh
     node_y: np.ndarray
@@ -117,21 +122,21 @@ def construct_faces(
     the nodes of the dual mesh faces.
     """
     n_valid = valid_node_indices.shape[0]
+    fill_value = _fill_value(node_faces.dtype)
 
     for out_idx in prange(n_valid):
         i = valid_node_indices[out_idx]
 
         # Construct temporary face to hold unordered face nodes
-        temp_face = np.array(
-            [INT_FILL_VALUE for _ in range(n_edges[i])], dtype=INT_DTYPE
-        )
+        temp_face = np.full(n_edges[i], fill_value, dtype=node_faces.dtype)
 
         # Get the face indices this node connects to (these become dual face nodes)
-        connected_faces = node_face_connectivity[i][0 : n_edges[i]]
+        start = node_face_offsets[i]
+        connected_faces = node_faces[start : start + n_edges[i]]
 
         # Connect the face centers around the node to make dual face
         for index, node_idx in enumerate(connected_faces):
-            if node_idx != INT_FILL_VALUE:
+            if node_idx != fill_value:
                 temp_face[index] = node_idx
 
         # Order the nodes using the angles so the faces have nodes in counter-clockwise sequence
@@ -145,7 +150,7 @@ def construct_faces(
         )
 
         # Order the face nodes properly in a counter-clockwise fashion
-        if temp_face[0] != INT_FILL_VALUE:
+        if temp_face[0] != fill_value:
             _face = _order_nodes(
                 temp_face,
                 node_0,
@@ -199,26 +204,28 @@ def _order_nodes(
     final_face : np.ndarray
         The face in proper counter-clockwise order
     """
+    fill_value = _fill_value(temp_face.dtype)
+
     # Add numerical stability check for degenerate cases
     if n_edges < 3:
-        return np.full(max_edges, INT_FILL_VALUE, dtype=INT_DTYPE)
+        return np.full(max_edges, fill_value, dtype=temp_face.dtype)
 
     node_zero = node_0 - node_central
     node_zero_mag = np.linalg.norm(node_zero)
 
     # Check for numerical stability
     if node_zero_mag < 1e-15:
-        return np.full(max_edges, INT_FILL_VALUE, dtype=INT_DTYPE)
+        return np.full(max_edges, fill_value, dtype=temp_face.dtype)
 
     node_cross = np.cross(node_0, node_central)
 
     d_angles = np.zeros(n_edges, dtype=np.float64)
     d_angles[0] = 0.0
-    final_face = np.array([INT_FILL_VALUE for _ in range(max_edges)], dtype=INT_DTYPE)
+    final_face = np.full(max_edges, fill_value, dtype=temp_face.dtype)
     for j in range(1, n_edges):
         _cur_face_temp_idx = temp_face[j]
 
-        if _cur_face_temp_idx is not INT_FILL_VALUE:
+        if _cur_face_temp_idx != fill_value:
             sub = np.array(
                 [
                     dual_node_x[_cur_face_temp_idx],
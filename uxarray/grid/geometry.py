@@ -6,15 +6,15 @@ from numba import njit, prange
 from uxarray.constants import (
     ERROR_TOLERANCE,
     INT_DTYPE,
-    INT_FILL_VALUE,
     MACHINE_EPSILON,
 )
-from uxarray.grid.coordinates import _xyz_to_lonlat_rad
+from uxarray.grid.coordinates import _lonlat_rad_to_xyz, _xyz_to_lonlat_rad
 from uxarray.grid.intersections import (
     gca_gca_intersection,
 )
 from uxarray.grid.point_in_face import _face_contains_point
 from uxarray.grid.utils import _get_cartesian_face_edge_nodes
+from uxarray.options import _fill_value
 
 POLE_POINTS_XYZ = {
     "North": np.array([0.0, 0.0, 1.0]),
@@ -29,6 +29,9 @@ POLE_POINTS_LONLAT = {
     "South": np.array([0.0, -np.pi / 2]),
 }
 
+# predicates supported when selecting the faces of a polygon
+POLYGON_PREDICATES = ("intersects", "within")
+
 # number of faces/polygons before raising a warning for performance
 GDF_POLYGON_THRESHOLD = 100000
 
@@ -926,7 +929,8 @@ def _construct_boundary_edge_indices(edge_face_connectivity):
     of the grid that is not covered by any geometry."""
 
     # If an edge only has one face saddling it than the mesh has holes in it
-    edge_with_holes = np.where(edge_face_connectivity[:, 1] == INT_FILL_VALUE)[0]
+    fill_value = _fill_value(edge_face_connectivity.dtype)
+    edge_with_holes = np.where(edge_face_connectivity[:, 1] == fill_value)[0]
     return edge_with_holes
 
 
@@ -1049,7 +1053,7 @@ def _populate_max_face_radius(grid):
 
 
 @njit(cache=True, parallel=True)
-def calculate_max_face_radius(
+def calculate_face_radii(
     face_node_connectivity: np.ndarray,
     node_x: np.ndarray,
     node_y: np.ndarray,
@@ -1057,10 +1061,12 @@ def calculate_max_face_radius(
     face_x: np.ndarray,
     face_y: np.ndarray,
     face_z: np.ndarray,
-) -> float:
+) -> np.ndarray:
+    """Computes the radius of each face, defined as the largest Cartesian (chord)
+    distance between the face center and any of its nodes."""
     n_faces, n_max_nodes = face_node_connectivity.shape
-    # workspace to hold the max squared-distance for each face
-    max2_per_face = np.empty(n_faces, dtype=np.float64)
+    fill_value = _fill_value(face_node_connectivity.dtype)
+    radii = np.empty(n_faces, dtype=np.float64)
 
     # parallel outer loop
     for i in prange(n_faces):
@@ -1074,7 +1080,7 @@ def calculate_max_face_radius(
         # loop over all possible node slots
         for j in range(n_max_nodes):
             idx = face_node_connectivity[i, j]
-            if idx == INT_FILL_VALUE:
+            if idx == fill_value:
                 continue
             dx = node_x[idx] - fx
             dy = node_y[idx] - fy
@@ -1083,16 +1089,32 @@ def calculate_max_face_radius(
             if d2 > face_max2:
                 face_max2 = d2
 
-        max2_per_face[i] = face_max2
+        radii[i] = math.sqrt(face_max2)
 
-    # now do a simple serial reduction
-    global_max2 = 0.0
-    for i in range(n_faces):
-        if max2_per_face[i] > global_max2:
-            global_max2 = max2_per_face[i]
+    return radii
 
-    # one sqrt at the end
-    return math.sqrt(global_max2)
+
+@njit(cache=True)
+def calculate_max_face_radius(
+    face_node_connectivity: np.ndarray,
+    node_x: np.ndarray,
+    node_y: np.ndarray,
+    node_z: np.ndarray,
+    face_x: np.ndarray,
+    face_y: np.ndarray,
+    face_z: np.ndarray,
+) -> float:
+    radii = calculate_face_radii(
+        face_node_connectivity, node_x, node_y, node_z, face_x, face_y, face_z
+    )
+
+    # simple serial reduction
+    max_radius = 0.0
+    for i in range(radii.shape[0]):
+        if radii[i] > max_radius:
+            max_radius = radii[i]
+
+    return max_radius
 
 
 @njit(cache=True)
@@ -1453,3 +1475,144 @@ def _newton_quadrilateral(quadrilateral, point, max_iterations=150):
             weights[i] -= delta[i]
 
     return weights
+
+
+def _polygon_rings_xyz(geometry):
+    """Returns the Cartesian vertices of each ring (exterior and holes) of a
+    polygon, given as a shapely (Multi)Polygon or an array of (lon, lat) vertices
+    in degrees."""
+    if hasattr(geometry, "geom_type"):
+        if geometry.geom_type == "MultiPolygon":
+            rings = [
+                ring for part in geometry.geoms for ring in _polygon_rings_xyz(part)
+            ]
+            return rings
+        if geometry.geom_type != "Polygon":
+            raise ValueError(
+                f"Expected a Polygon or MultiPolygon, got a {geometry.geom_type}"
+            )
+        coords = [np.asarray(geometry.exterior.coords)] + [
+            np.asarray(interior.coords) for interior in geometry.interiors
+        ]
+    else:
+        coords = [np.asarray(geometry, dtype=np.float64)]
+
+    rings = []
+    for ring in coords:
+        if ring.ndim != 2 or ring.shape[1] != 2:
+            raise ValueError("Polygon vertices must be given as (lon, lat) pairs")
+        if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+            ring = ring[:-1]
+        if len(ring) < 3:
+            raise ValueError("A polygon ring needs at least three vertices")
+        x, y, z = _lonlat_rad_to_xyz(np.deg2rad(ring[:, 0]), np.deg2rad(ring[:, 1]))
+        rings.append(np.column_stack([x, y, z]))
+    return rings
+
+
+def _polygon_face_mask(grid, geometry, predicate="intersects"):
+    """
+    Classify the faces of a grid against a spherical polygon whose edges are
+    great-circle arcs.
+
+    Boundary faces are those crossed by the rings of the polygon, found by walking
+    each ring with ``Grid.get_faces_along_path``. The remaining faces lie either
+    fully inside or fully outside the polygon, which is decided from their
+    centers: the centers within the bounding cap of the polygon are projected with
+    a gnomonic projection, which maps great-circle arcs to straight lines, and
+    tested against the projected rings with the even-odd rule.
+
+    Parameters
+    ----------
+    grid : Grid
+        The grid whose faces are classified.
+    geometry : shapely.Polygon, shapely.MultiPolygon or array_like of shape (n, 2)
+        The polygon, with vertices in degrees. Holes are supported. It must lie
+        within a hemisphere.
+    predicate : {'intersects', 'within'}, default='intersects'
+        Whether to select the faces that intersect the polygon, or only those
+        that lie within it.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of shape (n_face,) of the selected faces.
+    """
+    if predicate not in POLYGON_PREDICATES:
+        raise ValueError(
+            f"Invalid predicate: {predicate!r}. Expected one of {POLYGON_PREDICATES}"
+        )
+
+    rings = _polygon_rings_xyz(geometry)
+    vertices = np.concatenate(rings)
+
+    center = vertices.mean(axis=0)
+    center_norm = np.linalg.norm(center)
+    if center_norm < ERROR_TOLERANCE:
+        raise ValueError("The polygon must lie within a hemisphere")
+    center = center / center_norm
+    cos_radius = np.min(vertices @ center)
+    if cos_radius <= ERROR_TOLERANCE:
+        raise ValueError("The polygon must lie within a hemisphere")
+
+    # prefilter the face centers with the bounding cap of the polygon
+    grid.normalize_cartesian_coordinates()
+    tree = grid._get_scipy_kd_tree(coordinates="face")
+    chord = np.sqrt(2.0 * (1.0 - cos_radius)) + ERROR_TOLERANCE
+    candidates = np.asarray(tree.query_ball_point(center, r=chord), dtype=INT_DTYPE)
+
+    # gnomonic projection onto the plane tangent at the center of the polygon
+    axis = np.array([0.0, 0.0, 1.0]) if abs(center[2]) < 0.9 else np.eye(3)[0]
+    e1 = np.cross(axis, center)
+    e1 /= np.linalg.norm(e1)
+    e2 = np.cross(center, e1)
+    basis = np.stack([e1, e2, center])
+
+    starts = np.concatenate([_gnomonic(ring, basis) for ring in rings])
+    ends = np.concatenate(
+        [_gnomonic(np.roll(ring, -1, axis=0), basis) for ring in rings]
+    )
+
+    face_xyz = np.column_stack(
+        [
+            grid.face_x.values[candidates],
+            grid.face_y.values[candidates],
+            grid.face_z.values[candidates],
+        ]
+    )
+    inside = _points_in_planar_polygon(_gnomonic(face_xyz, basis), starts, ends)
+
+    mask = np.zeros(grid.n_face, dtype=bool)
+    mask[candidates[inside]] = True
+
+    boundary = np.concatenate(
+        [grid.get_faces_along_path(np.vstack([ring, ring[:1]]))[0] for ring in rings]
+    )
+    mask[boundary] = predicate == "intersects"
+    return mask
+
+
+def _gnomonic(points_xyz, basis):
+    """Projects points onto the plane tangent to the sphere at ``basis[2]``, with
+    ``basis[0]`` and ``basis[1]`` as its axes."""
+    local = points_xyz @ basis.T
+    return np.ascontiguousarray(local[:, :2] / local[:, 2:3])
+
+
+@njit(cache=True, parallel=True)
+def _points_in_planar_polygon(points, starts, ends):
+    """Even-odd test of each point against the polygon edges from ``starts[i]`` to
+    ``ends[i]``, which may make up several rings."""
+    inside = np.zeros(points.shape[0], dtype=np.bool_)
+    for i in prange(points.shape[0]):
+        x = points[i, 0]
+        y = points[i, 1]
+        result = False
+        for e in range(starts.shape[0]):
+            x1, y1 = starts[e, 0], starts[e, 1]
+            x2, y2 = ends[e, 0], ends[e, 1]
+            if (y1 > y) != (y2 > y):
+                if x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    result = not result
+        inside[i] = result
+    return inside
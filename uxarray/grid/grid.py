@@ -16,13 +16,14 @@ import xarray as xr
 from xarray.core.options import OPTIONS
 from xarray.core.utils import UncachedAccessor
 
-from uxarray.constants import INT_FILL_VALUE
 from uxarray.conventions import ugrid
 from uxarray.cross_sections import GridCrossSectionAccessor
 from uxarray.formatting_html import grid_repr
 from uxarray.grid.area import get_all_face_area_from_coords
-from uxarray.grid.bounds import _populate_face_bounds
+from uxarray.grid.bounds import _FaceBoundsIndex, _populate_face_bounds
 from uxarray.grid.connectivity import (
+    _build_connectivity_csr,
+    _compact_connectivity,
     _populate_edge_face_connectivity,
     _populate_edge_node_connectivity,
     _populate_face_edge_connectivity,
@@ -51,12 +52,8 @@ from uxarray.grid.geometry import (
     _populate_max_face_radius,
 )
 from uxarray.grid.intersections import (
-    constant_lat_intersections_face_bounds,
     constant_lat_intersections_no_extreme,
-    constant_lon_intersections_face_bounds,
     constant_lon_intersections_no_extreme,
-    faces_within_lat_bounds,
-    faces_within_lon_bounds,
 )
 from uxarray.grid.neighbors import (
     BallTree,
@@ -64,9 +61,15 @@ from uxarray.grid.neighbors import (
     SpatialHash,
     _populate_edge_face_distances,
     _populate_edge_node_distances,
+    _TreeCache,
 )
-from uxarray.grid.point_in_face import _point_in_face_query
-from uxarray.grid.utils import make_setter
+from uxarray.grid.point_in_face import (
+    _build_face_bvh,
+    _path_query,
+    _point_in_face_query,
+    _walk_query,
+)
+from uxarray.grid.utils import _grid_fingerprint, make_setter
 from uxarray.grid.validation import (
     _check_area,
     _check_connectivity,
@@ -99,6 +102,7 @@ from uxarray.io._ugrid import (
 from uxarray.io._vertices import _read_face_vertices
 from uxarray.io._voronoi import _spherical_voronoi_from_points
 from uxarray.io.utils import _parse_grid_type
+from uxarray.options import _fill_value
 from uxarray.plot.accessor import GridPlotAccessor
 from uxarray.subset import GridSubsetAccessor
 
@@ -183,7 +187,7 @@ class Grid:
         self.source_grid_spec = source_grid_spec
 
         # internal xarray dataset for storing grid variables
-        self._ds = grid_ds
+        self._ds = _compact_connectivity(grid_ds)
 
         # source grid specification (i.e. UGRID, MPAS, SCRIP, etc.)
         self.source_grid_spec = source_grid_spec
@@ -191,6 +195,7 @@ class Grid:
 
         # initialize attributes
         self._antimeridian_face_indices = None
+        self._face_jacobian = None
         self._ds.assign_attrs({"source_grid_spec": self.source_grid_spec})
         self._is_subset = is_subset
 
@@ -213,8 +218,26 @@ class Grid:
 
         self._raster_data_id = None
 
-        # Cache for KDTrees
-        self._kdtrees = {}
+        # Cache of spatial trees, keyed by element, coordinate system and metric
+        self._trees = _TreeCache()
+
+        # Cache for remapping weights onto this grid
+        self._remap_weights = {}
+
+        # Cached dual mesh
+        self._dual = None
+
+        # Cached bounding-cap hierarchy used by point-in-face queries
+        self._face_bvh = None
+
+        # Cached interval index over the latitude and longitude bounds of each face
+        self._face_bounds_index = None
+
+        # Cached (offsets, indices) form of connectivity variables
+        self._connectivity_csr = {}
+
+        # Cached digest of the node coordinates and face-node connectivity
+        self._fingerprint = None
 
         # initialize cached data structures (nearest neighbor operations)
         self._ball_tree = None
@@ -1200,7 +1223,8 @@ class Grid:
         Each row (i.e., each face) contains at least three node indices and up to a maximum of
         :py:attr:`~uxarray.Grid.n_max_face_nodes`. In grids with a mix of geometries (e.g., triangles and hexagons),
         rows containing fewer than :py:attr:`~uxarray.Grid.n_max_face_nodes` indices are padded with the fill value defined in
-        :py:attr:`~uxarray.constants.INT_FILL_VALUE`. The node indices are stored in counter-clockwise order.
+        :py:attr:`~uxarray.constants.INT_FILL_VALUE`, or with ``np.iinfo(np.int32).min`` when the connectivity is stored
+        as ``int32`` under ``ux.set_options(compact_indices=True)``. The node indices are stored in counter-clockwise order.
 
         Returns
         -------
@@ -1419,6 +1443,46 @@ class Grid:
         make_setter("node_face_connectivity")
     )
 
+    def connectivity_csr(self, name: str):
+        """Ragged (CSR) form of a connectivity variable, built on first use and
+        cached.
+
+        Unlike the padded connectivity variables, each row only stores its
+        valid indices, which avoids padding every row to the length of the
+        longest one on grids with a few high-valence elements. ``node_face``
+        and ``node_edge`` are built without constructing their padded arrays.
+
+        Parameters
+        ----------
+        name : str
+            Connectivity to return, such as ``"node_face"`` for
+            :py:attr:`~uxarray.Grid.node_face_connectivity`.
+
+        Returns
+        -------
+        offsets : np.ndarray
+            Array of shape (n_rows + 1,), where the indices of element ``i`` are
+            ``indices[offsets[i]:offsets[i + 1]]``
+        indices : np.ndarray
+            The connected element indices, in the same order as the padded
+            connectivity variable
+
+        Notes
+        -----
+        When the ``compact_indices`` option is set (see
+        :py:func:`~uxarray.set_options`) at the time the arrays are first built,
+        they are stored as ``int32`` if the element counts allow it.
+
+        Examples
+        --------
+        >>> offsets, faces = grid.connectivity_csr("node_face")
+        >>> faces[offsets[0] : offsets[1]]  # faces that share node 0
+        """
+        name = name.removesuffix("_connectivity")
+        if name not in self._connectivity_csr:
+            self._connectivity_csr[name] = _build_connectivity_csr(self, name)
+        return self._connectivity_csr[name]
+
     # ==================================================================================================================
     # Descriptor Properties
     # ==================================================================================================================
@@ -1580,7 +1644,7 @@ class Grid:
                     self.boundary_node_indices.values
                 ].data.ravel()
             )
-            boundaries = boundaries[boundaries != INT_FILL_VALUE]
+            boundaries = boundaries[boundaries != _fill_value(boundaries.dtype)]
             self._ds["boundary_face_indices"] = xr.DataArray(data=boundaries)
 
         return self._ds["boundary_face_indices"]
@@ -1733,7 +1797,12 @@ class Grid:
             BallTree instance
         """
 
-        if self._ball_tree is None or reconstruct:
+        if (
+            self._ball_tree is None
+            or reconstruct
+            or coordinate_system != self._ball_tree.coordinate_system
+            or distance_metric != self._ball_tree.distance_metric
+        ):
             self._ball_tree = BallTree(
                 self,
                 coordinates=coordinates,
@@ -1777,7 +1846,8 @@ class Grid:
 
         Notes
         -----
-        - Trees are cached per-coordinate-set in `self._kdtrees` to avoid repeated construction.
+        - Trees are stored in the tree cache of the grid (see ``tree_cache_max_memory``) to avoid repeated
+          construction.
         - The tree uses the (x, y, z) Cartesian values stored on each grid element.
         """
         from scipy.spatial import KDTree as SPKDTree
@@ -1788,16 +1858,42 @@ class Grid:
                 "must be 'node', 'edge', or 'face'."
             )
 
-        if reconstruct or coordinates not in self._kdtrees:
+        def _build():
             self.normalize_cartesian_coordinates()
             x = getattr(self, f"{coordinates}_x").values
             y = getattr(self, f"{coordinates}_y").values
             z = getattr(self, f"{coordinates}_z").values
 
             points = np.vstack([x, y, z]).T
-            self._kdtrees[coordinates] = SPKDTree(points)
+            return SPKDTree(points)
+
+        return self._trees.get(
+            ("scipy", coordinates, "cartesian", "euclidean"),
+            _build,
+            reconstruct=reconstruct,
+        )
+
+    def _get_face_bvh(self, reconstruct: bool = False):
+        """Return the bounding volume hierarchy over the bounding caps of each face,
+        building and caching it on first use.
 
-        return self._kdtrees[coordinates]
+        See ``uxarray.grid.point_in_face._build_face_bvh`` for its layout.
+        """
+        if reconstruct or self._face_bvh is None:
+            self._face_bvh = _build_face_bvh(self)
+        return self._face_bvh
+
+    def _get_face_bounds_index(self, reconstruct: bool = False):
+        """Return the sorted interval index over ``face_bounds_lat`` and
+        ``face_bounds_lon``, building and caching it on first use.
+
+        See ``uxarray.grid.bounds._FaceBoundsIndex``.
+        """
+        if reconstruct or self._face_bounds_index is None:
+            self._face_bounds_index = _FaceBoundsIndex(
+                self.face_bounds_lat.values, self.face_bounds_lon.values
+            )
+        return self._face_bounds_index
 
     def get_kd_tree(
         self,
@@ -1833,7 +1929,12 @@ class Grid:
             KDTree instance
         """
 
-        if self._kd_tree is None or reconstruct:
+        if (
+            self._kd_tree is None
+            or reconstruct
+            or coordinate_system != self._kd_tree.coordinate_system
+            or distance_metric != self._kd_tree.distance_metric
+        ):
             self._kd_tree = KDTree(
                 self,
                 coordinates=coordinates,
@@ -1848,9 +1949,27 @@ class Grid:
 
         return self._kd_tree
 
+    @property
+    def tree_cache_max_memory(self) -> Optional[int]:
+        """Memory budget, in bytes, of the spatial trees cached on this grid.
+
+        Trees built by ``get_kd_tree``, ``get_ball_tree`` and the remapping and
+        point search routines are cached per element, coordinate system and
+        distance metric, so alternating between them does not rebuild them. When a
+        budget is set (as a number of bytes or a string such as ``"2GB"``), the
+        least recently used trees are evicted once the cached trees exceed it.
+        Unbounded (``None``) by default.
+        """
+        return self._trees.max_memory
+
+    @tree_cache_max_memory.setter
+    def tree_cache_max_memory(self, value: Optional[int | str]):
+        self._trees.max_memory = value
+
     def get_spatial_hash(
         self,
         reconstruct: bool = False,
+        layout: str = "latlon",
     ):
         """Get the SpatialHash data structure of this Grid that allows for
         fast face search queries. Face searches are used to find the faces that
@@ -1860,16 +1979,16 @@ class Grid:
         ----------
         reconstruct : bool, default=False
             If true, reconstructs the spatial hash
+        layout : {"latlon", "cubed_sphere"}, default="latlon"
+            Layout of the hash grid. The ``"latlon"`` layout only covers the longitude-latitude bounding box of the
+            grid. The opt-in ``"cubed_sphere"`` layout covers the whole globe and supports faces crossing the
+            antimeridian or containing a pole.
 
         Returns
         -------
         self._spatialhash : grid.Neighbors.SpatialHash
             SpatialHash instance
 
-        Note
-        ----
-        Does not currently support queries on periodic elements.
-
         Examples
         --------
         Open a grid from a file path:
@@ -1885,11 +2004,108 @@ class Grid:
 
         >>> face_ids, bcoords = spatial_hash.query([0.0, 0.0])
         """
-        if self._spatialhash is None or reconstruct:
-            self._spatialhash = SpatialHash(self, reconstruct)
+        if (
+            self._spatialhash is None
+            or reconstruct
+            or layout != self._spatialhash._layout
+        ):
+            self._spatialhash = SpatialHash(self, reconstruct, layout)
 
         return self._spatialhash
 
+    def save_index(self, path: str | os.PathLike):
+        """Writes the spatial indices built so far for this grid to a file, so that
+        other processes working on the same grid can load them with ``load_index``
+        instead of rebuilding them.
+
+        The cached KD-trees and ball trees, spatial hash and point-in-face hierarchy
+        that have been constructed are stored together with a fingerprint of the grid's node
+        coordinates and connectivity.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the index file to write. If ``path`` is an existing directory,
+            the file is named after the grid fingerprint inside it, so that a single
+            directory can hold the indices of several grids.
+
+        Notes
+        -----
+        The indices are written with ``joblib``, which pickles them. See
+        ``load_index`` for the security implications of sharing these files.
+
+        Examples
+        --------
+        >>> uxgrid.get_ball_tree()
+        >>> uxgrid.save_index("/scratch/indices")
+        """
+        import joblib
+
+        fingerprint = _grid_fingerprint(self)
+
+        index = {
+            "fingerprint": fingerprint,
+            "trees": dict(self._trees.items()),
+            "ball_tree": _detach_from_grid(self._ball_tree),
+            "kd_tree": _detach_from_grid(self._kd_tree),
+            "spatial_hash": _detach_from_grid(self._spatialhash),
+            "face_bvh": self._face_bvh,
+        }
+        joblib.dump(index, _index_path(path, fingerprint))
+
+    def load_index(self, path: str | os.PathLike, mmap: bool = True):
+        """Loads spatial indices previously written with ``save_index``.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the index file, or of the directory it was saved in.
+        mmap : bool, default=True
+            If True, the arrays of the indices are memory-mapped from the file
+            instead of being read into memory, so that processes on the same node
+            share a single page-cached copy.
+
+        Raises
+        ------
+        ValueError
+            If the indices were built for a different grid.
+
+        Notes
+        -----
+        The index file is read with ``joblib.load``, which unpickles its content
+        and can execute arbitrary code. Only load index files from trusted paths,
+        for example a directory that only you or your group can write to.
+
+        Examples
+        --------
+        >>> uxgrid = ux.open_grid("x1.2621442.grid.nc")
+        >>> uxgrid.load_index("/scratch/indices")
+        """
+        import joblib
+
+        fingerprint = _grid_fingerprint(self)
+        index = joblib.load(
+            _index_path(path, fingerprint), mmap_mode="r" if mmap else None
+        )
+
+        if index["fingerprint"] != fingerprint:
+            raise ValueError(
+                "The spatial indices were built for a different grid. Expected "
+                f"fingerprint {fingerprint}, got {index['fingerprint']}."
+            )
+
+        self._trees.update(index["trees"])
+        for attr, key in (
+            ("_ball_tree", "ball_tree"),
+            ("_kd_tree", "kd_tree"),
+            ("_spatialhash", "spatial_hash"),
+        ):
+            if index[key] is not None:
+                index[key]._source_grid = self
+                setattr(self, attr, index[key])
+        if index["face_bvh"] is not None:
+            self._face_bvh = index["face_bvh"]
+
     def copy(self):
         """Returns a deep copy of this grid."""
 
@@ -2268,6 +2484,10 @@ class Grid:
         of the dual, and the face centers of the primal become the nodes of the
         dual. Returns a new `Grid` object.
 
+        The dual connectivity is computed once and cached on the grid, but each
+        call returns a separate `Grid`, so modifying it does not affect later
+        calls.
+
         Returns
         --------
         dual : Grid
@@ -2279,15 +2499,29 @@ class Grid:
                 # TODO: This is very slow
                 raise RuntimeError("Duplicate nodes found, cannot construct dual")
 
-        # Get dual mesh node face connectivity
-        dual_node_face_conn = construct_dual(grid=self)
-
-        # Construct dual mesh
-        dual = self.from_topology(
-            self.face_lon.values, self.face_lat.values, dual_node_face_conn
+        return self.from_topology(
+            self.face_lon.values,
+            self.face_lat.values,
+            self._get_dual().face_node_connectivity.values.copy(),
         )
 
-        return dual
+    def _get_dual(self, reconstruct: bool = False):
+        """Returns the dual mesh of this grid, building it on first use.
+
+        The returned `Grid` is shared by all internal callers (e.g. bilinear
+        remapping, which reuses its spatial trees) and must not be modified. It
+        is discarded when the face centers, nodes or face-node connectivity of
+        this grid are replaced.
+        """
+        if reconstruct or self._dual is None:
+            # Get dual mesh node face connectivity
+            dual_node_face_conn = construct_dual(grid=self)
+
+            # Construct dual mesh
+            self._dual = self.from_topology(
+                self.face_lon.values, self.face_lat.values, dual_node_face_conn
+            )
+        return self._dual
 
     def isel(
         self, inverse_indices: Union[List[str], Set[str], bool] = False, **dim_kwargs
@@ -2400,11 +2634,34 @@ class Grid:
                 f"Latitude must be between -90 and 90 degrees. Received {lat}"
             )
 
-        faces = constant_lat_intersections_face_bounds(
-            lat=lat,
-            face_bounds_lat=self.face_bounds_lat.values,
-        )
-        return faces
+        return self._get_face_bounds_index().faces_at_latitude(lat)
+
+    def get_faces_at_constant_latitudes(self, lats):
+        """
+        Identifies the indices of faces that intersect with each of several lines of
+        constant latitude.
+
+        Parameters
+        ----------
+        lats : array_like
+            The latitudes at which to extract the cross-sections, in degrees.
+            Must be between -90.0 and 90.0
+
+        Returns
+        -------
+        offsets : numpy.ndarray
+            An array of shape (len(lats) + 1,) delimiting the faces of each latitude.
+        faces : numpy.ndarray
+            The face indices that intersect each latitude, where
+            ``faces[offsets[i]:offsets[i + 1]]`` intersect ``lats[i]``.
+        """
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        if np.any(lats > 90.0) or np.any(lats < -90.0):
+            raise ValueError(
+                f"Latitudes must be between -90 and 90 degrees. Received {lats}"
+            )
+
+        return self._get_face_bounds_index().faces_at_latitudes(lats)
 
     def get_edges_at_constant_longitude(
         self, lon: float, use_face_bounds: bool = False
@@ -2465,8 +2722,7 @@ class Grid:
                 f"Longitude must be between -180 and 180 degrees. Received {lon}"
             )
 
-        faces = constant_lon_intersections_face_bounds(lon, self.face_bounds_lon.values)
-        return faces
+        return self._get_face_bounds_index().faces_at_longitude(lon)
 
     def get_faces_between_longitudes(self, lons: Tuple[float, float]):
         """Identifies the indices of faces that are strictly between two lines of constant longitude.
@@ -2482,7 +2738,7 @@ class Grid:
             An array of face indices that are strictly between two lines of constant longitude.
 
         """
-        return faces_within_lon_bounds(lons, self.face_bounds_lon.values)
+        return self._get_face_bounds_index().faces_between_longitudes(lons)
 
     def get_faces_between_latitudes(self, lats: Tuple[float, float]):
         """Identifies the indices of faces that are strictly between two lines of constant latitude.
@@ -2498,7 +2754,7 @@ class Grid:
             An array of face indices that are strictly between two lines of constant latitude.
 
         """
-        return faces_within_lat_bounds(lats, self.face_bounds_lat.values)
+        return self._get_face_bounds_index().faces_between_latitudes(lats)
 
     def get_faces_containing_point(
         self,
@@ -2586,3 +2842,126 @@ class Grid:
             face_indices = face_indices[:, None]
 
         return face_indices, counts
+
+    def locate_points(
+        self,
+        points: Sequence[float] | np.ndarray,
+        method: str = "tree",
+        hint: Optional[int | Sequence[int] | np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Find a single face containing each of the given point(s).
+
+        Parameters
+        ----------
+        points : array_like, shape (N, 2) or (2,) or shape (N, 3) or (3,)
+            Query point(s) to locate on the grid.
+            - If last dimension is 2, interpreted as (longitude, latitude) in **degrees**.
+            - If last dimension is 3, interpreted as Cartesian coordinates on the unit sphere: (x, y, z).
+        method : {'tree', 'walk'}, default='tree'
+            - ``'tree'`` searches each point independently with a spatial tree over the faces.
+            - ``'walk'`` starts from a known face and walks across ``face_face_connectivity`` towards each point,
+              falling back to the tree when a walk fails. Its cost per point is nearly constant when consecutive
+              points are close to each other, such as along particle trajectories or satellite tracks.
+        hint : int or array_like of shape (N,), optional
+            Starting face(s) for ``method='walk'``. A single face (or None) starts the walk of the first point, and
+            every following walk starts from the face of the previous point. An array gives the starting face of
+            each point (e.g. the faces of the previous time step of a set of particles), in which case the points
+            are located in parallel.
+
+        Returns
+        -------
+        face_indices : np.ndarray, shape (N,)
+            Index of a face containing each point, or ``INT_FILL_VALUE`` if no face contains it. Points lying on an
+            edge or node shared by several faces are assigned to any one of them.
+
+        Examples
+        --------
+        Follow a trajectory, starting each search from the previous hit
+
+        >>> lon = np.linspace(0.0, 90.0, 1000)
+        >>> lat = np.linspace(-30.0, 30.0, 1000)
+        >>> faces = uxgrid.locate_points(np.column_stack([lon, lat]), method="walk")
+
+        Advance a set of particles, starting from their previous faces
+
+        >>> faces = uxgrid.locate_points(new_positions, method="walk", hint=faces)
+        """
+        if method not in ("tree", "walk"):
+            raise ValueError(
+                f"Invalid method: {method!r}. Expected one of ('tree', 'walk')"
+            )
+
+        points_xyz = points_atleast_2d_xyz(points)
+
+        if method == "walk":
+            self.normalize_cartesian_coordinates()
+            return _walk_query(self, points_xyz, hint=hint)
+
+        face_indices, _ = _point_in_face_query(source_grid=self, points=points_xyz)
+        return face_indices[:, 0]
+
+    def get_faces_along_path(
+        self, points: Sequence[float] | np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the faces crossed by a path made of great-circle arcs, such as a ship
+        track or a flight path.
+
+        The path is followed from face to face across ``face_face_connectivity``,
+        intersecting it with the edges of each face, so the cost grows with the
+        number of faces crossed rather than with the size of the grid.
+
+        Parameters
+        ----------
+        points : array_like, shape (N, 2) or shape (N, 3)
+            Vertices of the path, joined by great-circle arcs.
+            - If last dimension is 2, interpreted as (longitude, latitude) in **degrees**.
+            - If last dimension is 3, interpreted as Cartesian coordinates on the unit sphere: (x, y, z).
+
+        Returns
+        -------
+        faces : np.ndarray, shape (M,)
+            Indices of the faces crossed by the path, in the order they are crossed. A face that the path leaves
+            and later re-enters appears once per visit.
+        entry_distance : np.ndarray, shape (M,)
+            Great-circle distance along the path, in radians, at which it enters each face.
+        exit_distance : np.ndarray, shape (M,)
+            Great-circle distance along the path, in radians, at which it exits each face.
+
+        Notes
+        -----
+        Parts of the path that lie outside the grid (e.g. over the land of an ocean mesh) are skipped. When the walk
+        leaves the grid, the rest of the arc is sampled every half of the median face radius, and the walk re-enters
+        the grid at the first sample that lies in a face, stepping back to the face where the arc crosses into the
+        grid. Parts of the grid narrower than this step, such as a thin channel crossed between two samples, may be
+        missed.
+
+        Examples
+        --------
+        >>> track = np.array([[-70.0, 40.0], [-40.0, 45.0], [-10.0, 50.0]])
+        >>> faces, entry, exit = uxgrid.get_faces_along_path(track)
+        >>> section = uxda.isel(n_face=faces)
+        """
+        points_xyz = points_atleast_2d_xyz(points)
+
+        self.normalize_cartesian_coordinates()
+        return _path_query(self, points_xyz)
+
+
+def _detach_from_grid(index):
+    """Returns a shallow copy of a spatial index without its reference to the
+    source grid, which is not serialized by ``Grid.save_index``."""
+    if index is None:
+        return None
+    detached = copy.copy(index)
+    detached._source_grid = None
+    return detached
+
+
+def _index_path(path, fingerprint):
+    """Resolves the file used by ``Grid.save_index`` and ``Grid.load_index``,
+    naming it after the grid fingerprint when ``path`` is a directory."""
+    if os.path.isdir(path):
+        return os.path.join(path, f"{fingerprint}.uxindex")
+    return path
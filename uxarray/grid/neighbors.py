@@ -1,14 +1,141 @@
-from typing import Optional, Union
+import math
+from collections import OrderedDict
+from typing import Callable, Optional, Union
 
 import numpy as np
 import xarray as xr
-from numba import njit
+from numba import njit, prange
 from numpy import deg2rad
 
-from uxarray.constants import ERROR_TOLERANCE, INT_DTYPE, INT_FILL_VALUE
+from uxarray.constants import ERROR_TOLERANCE, INT_DTYPE
+from uxarray.options import _fill_value
 
+SPATIAL_HASH_LAYOUTS = ("latlon", "cubed_sphere")
 
-class KDTree:
+
+class _TreeCache:
+    """Least-recently-used cache of the spatial trees built for a grid.
+
+    Trees are keyed by ``(kind, element, coordinate_system, distance_metric)``, so
+    that trees on different elements or with different metrics are built once and
+    kept side by side. When ``max_memory`` is set, the least recently used trees
+    are evicted once the cached trees exceed it; the most recently used tree is
+    always kept.
+
+    Parameters
+    ----------
+    max_memory : int or str, optional
+        Memory budget of the cached trees, in bytes or as a string such as
+        ``"2GB"``. Unbounded by default.
+    """
+
+    def __init__(self, max_memory: Optional[Union[int, str]] = None):
+        self._trees = OrderedDict()
+        self.max_memory = max_memory
+
+    @property
+    def max_memory(self) -> Optional[int]:
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, value):
+        from dask.utils import parse_bytes
+
+        self._max_memory = None if value is None else parse_bytes(value)
+        self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the cached trees, in bytes."""
+        return sum(_tree_nbytes(tree) for tree in self._trees.values())
+
+    def get(self, key: tuple, build: Callable, reconstruct: bool = False):
+        """Returns the tree stored under ``key``, calling ``build`` to construct
+        it if it is not cached or if ``reconstruct`` is True."""
+        if reconstruct or key not in self._trees:
+            self._trees[key] = build()
+        self._trees.move_to_end(key)
+        self._evict()
+        return self._trees[key]
+
+    def update(self, trees: dict):
+        """Adds already constructed trees to the cache."""
+        for key, tree in trees.items():
+            self._trees[key] = tree
+            self._trees.move_to_end(key)
+        self._evict()
+
+    def items(self):
+        return self._trees.items()
+
+    def clear(self):
+        self._trees.clear()
+
+    def __contains__(self, key):
+        return key in self._trees
+
+    def __len__(self):
+        return len(self._trees)
+
+    def _evict(self):
+        if self._max_memory is None:
+            return
+        while len(self._trees) > 1 and self.nbytes > self._max_memory:
+            self._trees.popitem(last=False)
+
+
+def _tree_nbytes(tree) -> int:
+    """Approximate memory used by a SciPy or scikit-learn tree, in bytes."""
+    if hasattr(tree, "get_arrays"):
+        # scikit-learn trees expose their data, index and node arrays
+        return sum(array.nbytes for array in tree.get_arrays() if array is not None)
+    # SciPy trees store their data and indices, plus a fixed-size record per node
+    return tree.data.nbytes + tree.indices.nbytes + 64 * tree.size
+
+
+class _GridTree:
+    """Shared behavior of the ``KDTree`` and ``BallTree`` wrappers, whose trees are
+    stored in the tree cache of their source grid rather than on the wrapper."""
+
+    def _current_tree(self, reconstruct: bool = False):
+        """Returns the tree for the current coordinates from the tree cache of the
+        source grid, building it if it is not cached."""
+        builders = {
+            "nodes": self._build_from_nodes,
+            "face centers": self._build_from_face_centers,
+            "edge centers": self._build_from_edge_centers,
+        }
+        if self._coordinates not in builders:
+            raise ValueError(
+                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
+                f"or 'edge centers'"
+            )
+
+        key = (
+            type(self).__name__,
+            self._coordinates,
+            self.coordinate_system,
+            self.distance_metric,
+        )
+        return self._source_grid._trees.get(
+            key, builders[self._coordinates], reconstruct=reconstruct
+        )
+
+    def _count_elements(self):
+        """Number of elements for the current coordinates."""
+        if self._coordinates == "nodes":
+            return self._source_grid.n_node
+        elif self._coordinates == "face centers":
+            return self._source_grid.n_face
+        elif self._coordinates == "edge centers":
+            return self._source_grid.n_edge
+        raise ValueError(
+            f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
+            f"or 'edge centers'"
+        )
+
+
+class KDTree(_GridTree):
     """Custom KDTree data structure written around the
     ``sklearn.neighbors.KDTree`` implementation for use with corner
     (``node_x``, ``node_y``, ``node_z``) and (``node_lon``, ``node_lat``), edge
@@ -52,154 +179,111 @@ class KDTree:
         self.distance_metric = distance_metric
         self.reconstruct = reconstruct
 
-        self._tree_from_nodes = None
-        self._tree_from_face_centers = None
-        self._tree_from_edge_centers = None
-
-        # Build the tree based on nodes, face centers, or edge centers
-        if coordinates == "nodes":
-            self._tree_from_nodes = self._build_from_nodes()
-            self._n_elements = self._source_grid.n_node
-        elif coordinates == "face centers":
-            self._tree_from_face_centers = self._build_from_face_centers()
-            self._n_elements = self._source_grid.n_face
-        elif coordinates == "edge centers":
-            self._tree_from_edge_centers = self._build_from_edge_centers()
-            self._n_elements = self._source_grid.n_edge
-        else:
-            raise ValueError(
-                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
-                f"or 'edge centers'"
-            )
+        # the trees themselves are stored in the tree cache of the source grid
+        self._n_elements = self._count_elements()
+        self._current_tree(reconstruct=reconstruct)
 
     def _build_from_nodes(self):
         """Internal``sklearn.neighbors.KDTree`` constructed from corner
         nodes."""
         from sklearn.neighbors import KDTree as SKKDTree
 
-        if self._tree_from_nodes is None or self.reconstruct:
-            # Sets which values to use for the tree based on the coordinate_system
-            if self.coordinate_system == "cartesian":
-                coords = np.stack(
-                    (
-                        self._source_grid.node_x.values,
-                        self._source_grid.node_y.values,
-                        self._source_grid.node_z.values,
-                    ),
-                    axis=-1,
-                )
+        # Sets which values to use for the tree based on the coordinate_system
+        if self.coordinate_system == "cartesian":
+            coords = np.stack(
+                (
+                    self._source_grid.node_x.values,
+                    self._source_grid.node_y.values,
+                    self._source_grid.node_z.values,
+                ),
+                axis=-1,
+            )
 
-            elif self.coordinate_system == "spherical":
-                coords = np.vstack(
-                    (
-                        deg2rad(self._source_grid.node_lat.values),
-                        deg2rad(self._source_grid.node_lon.values),
-                    )
-                ).T
-
-            else:
-                raise TypeError(
-                    f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
-                    f"'spherical'"
+        elif self.coordinate_system == "spherical":
+            coords = np.vstack(
+                (
+                    deg2rad(self._source_grid.node_lat.values),
+                    deg2rad(self._source_grid.node_lon.values),
                 )
+            ).T
 
-            self._tree_from_nodes = SKKDTree(coords, metric=self.distance_metric)
+        else:
+            raise TypeError(
+                f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
+                f"'spherical'"
+            )
 
-        return self._tree_from_nodes
+        return SKKDTree(coords, metric=self.distance_metric)
 
     def _build_from_face_centers(self):
         """Internal``sklearn.neighbors.KDTree`` constructed from face
         centers."""
         from sklearn.neighbors import KDTree as SKKDTree
 
-        if self._tree_from_face_centers is None or self.reconstruct:
-            # Sets which values to use for the tree based on the coordinate_system
-            if self.coordinate_system == "cartesian":
-                coords = np.stack(
-                    (
-                        self._source_grid.face_x.values,
-                        self._source_grid.face_y.values,
-                        self._source_grid.face_z.values,
-                    ),
-                    axis=-1,
-                )
+        # Sets which values to use for the tree based on the coordinate_system
+        if self.coordinate_system == "cartesian":
+            coords = np.stack(
+                (
+                    self._source_grid.face_x.values,
+                    self._source_grid.face_y.values,
+                    self._source_grid.face_z.values,
+                ),
+                axis=-1,
+            )
 
-            elif self.coordinate_system == "spherical":
-                coords = np.vstack(
-                    (
-                        deg2rad(self._source_grid.face_lat.values),
-                        deg2rad(self._source_grid.face_lon.values),
-                    )
-                ).T
-
-            else:
-                raise ValueError(
-                    f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
-                    f"'spherical'"
+        elif self.coordinate_system == "spherical":
+            coords = np.vstack(
+                (
+                    deg2rad(self._source_grid.face_lat.values),
+                    deg2rad(self._source_grid.face_lon.values),
                 )
+            ).T
 
-            self._tree_from_face_centers = SKKDTree(coords, metric=self.distance_metric)
+        else:
+            raise ValueError(
+                f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
+                f"'spherical'"
+            )
 
-        return self._tree_from_face_centers
+        return SKKDTree(coords, metric=self.distance_metric)
 
     def _build_from_edge_centers(self):
         """Internal``sklearn.neighbors.KDTree`` constructed from edge
         centers."""
         from sklearn.neighbors import KDTree as SKKDTree
 
-        if self._tree_from_edge_centers is None or self.reconstruct:
-            # Sets which values to use for the tree based on the coordinate_system
-            if self.coordinate_system == "cartesian":
-                if self._source_grid.edge_x is None:
-                    raise ValueError("edge_x isn't populated")
-
-                coords = np.stack(
-                    (
-                        self._source_grid.edge_x.values,
-                        self._source_grid.edge_y.values,
-                        self._source_grid.edge_z.values,
-                    ),
-                    axis=-1,
-                )
-
-            elif self.coordinate_system == "spherical":
-                if self._source_grid.edge_lat is None:
-                    raise ValueError("edge_lat isn't populated")
-
-                coords = np.vstack(
-                    (
-                        deg2rad(self._source_grid.edge_lat.values),
-                        deg2rad(self._source_grid.edge_lon.values),
-                    )
-                ).T
-
-            else:
-                raise ValueError(
-                    f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
-                    f"'spherical'"
-                )
+        # Sets which values to use for the tree based on the coordinate_system
+        if self.coordinate_system == "cartesian":
+            if self._source_grid.edge_x is None:
+                raise ValueError("edge_x isn't populated")
 
-            self._tree_from_edge_centers = SKKDTree(coords, metric=self.distance_metric)
+            coords = np.stack(
+                (
+                    self._source_grid.edge_x.values,
+                    self._source_grid.edge_y.values,
+                    self._source_grid.edge_z.values,
+                ),
+                axis=-1,
+            )
 
-        return self._tree_from_edge_centers
+        elif self.coordinate_system == "spherical":
+            if self._source_grid.edge_lat is None:
+                raise ValueError("edge_lat isn't populated")
 
-    def _current_tree(self):
-        """Creates and returns the current tree."""
-        _tree = None
+            coords = np.vstack(
+                (
+                    deg2rad(self._source_grid.edge_lat.values),
+                    deg2rad(self._source_grid.edge_lon.values),
+                )
+            ).T
 
-        if self._coordinates == "nodes":
-            _tree = self._tree_from_nodes
-        elif self._coordinates == "face centers":
-            _tree = self._tree_from_face_centers
-        elif self._coordinates == "edge centers":
-            _tree = self._tree_from_edge_centers
         else:
-            raise TypeError(
-                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
-                f"or 'edge centers'"
+            raise ValueError(
+                f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
+                f"'spherical'"
             )
 
-        return _tree
+        return SKKDTree(coords, metric=self.distance_metric)
 
     def query(
         self,
@@ -383,26 +467,11 @@ class KDTree:
         self._coordinates = value
 
         # set up appropriate reference to tree
-        if self._coordinates == "nodes":
-            if self._tree_from_nodes is None or self.reconstruct:
-                self._tree_from_nodes = self._build_from_nodes()
-            self._n_elements = self._source_grid.n_node
-        elif self._coordinates == "face centers":
-            if self._tree_from_face_centers is None or self.reconstruct:
-                self._tree_from_face_centers = self._build_from_face_centers()
-            self._n_elements = self._source_grid.n_face
-        elif self._coordinates == "edge centers":
-            if self._tree_from_edge_centers is None or self.reconstruct:
-                self._tree_from_edge_centers = self._build_from_edge_centers()
-            self._n_elements = self._source_grid.n_edge
-        else:
-            raise ValueError(
-                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
-                f"or 'edge centers'"
-            )
+        self._n_elements = self._count_elements()
+        self._current_tree()
 
 
-class BallTree:
+class BallTree(_GridTree):
     """Custom BallTree data structure written around the
     ``sklearn.neighbors.BallTree`` implementation for use with either the
     (``node_x``, ``node_y``, ``node_z``) and (``node_lon``, ``node_lat``), edge
@@ -444,148 +513,102 @@ class BallTree:
         self.coordinate_system = coordinate_system
         self.reconstruct = reconstruct
 
-        self._tree_from_nodes = None
-        self._tree_from_face_centers = None
-        self._tree_from_edge_centers = None
-
-        # set up appropriate reference to tree
-        if coordinates == "nodes":
-            self._tree_from_nodes = self._build_from_nodes()
-            self._n_elements = self._source_grid.n_node
-        elif coordinates == "face centers":
-            self._tree_from_face_centers = self._build_from_face_centers()
-            self._n_elements = self._source_grid.n_face
-        elif coordinates == "edge centers":
-            self._tree_from_edge_centers = self._build_from_edge_centers()
-            self._n_elements = self._source_grid.n_edge
-        else:
-            raise ValueError(
-                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
-                f"or 'edge centers'"
-            )
+        # the trees themselves are stored in the tree cache of the source grid
+        self._n_elements = self._count_elements()
+        self._current_tree(reconstruct=reconstruct)
 
     def _build_from_face_centers(self):
         """Internal``sklearn.neighbors.BallTree`` constructed from face
         centers."""
         from sklearn.neighbors import BallTree as SKBallTree
 
-        if self._tree_from_face_centers is None or self.reconstruct:
-            # Sets which values to use for the tree based on the coordinate_system
-            if self.coordinate_system == "spherical":
-                coords = np.vstack(
-                    (
-                        deg2rad(self._source_grid.face_lat.values),
-                        deg2rad(self._source_grid.face_lon.values),
-                    )
-                ).T
-
-            elif self.coordinate_system == "cartesian":
-                coords = np.stack(
-                    (
-                        self._source_grid.face_x.values,
-                        self._source_grid.face_y.values,
-                        self._source_grid.face_z.values,
-                    ),
-                    axis=-1,
-                )
-            else:
-                raise ValueError(
-                    f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
-                    f"'spherical'"
+        # Sets which values to use for the tree based on the coordinate_system
+        if self.coordinate_system == "spherical":
+            coords = np.vstack(
+                (
+                    deg2rad(self._source_grid.face_lat.values),
+                    deg2rad(self._source_grid.face_lon.values),
                 )
+            ).T
 
-            self._tree_from_face_centers = SKBallTree(
-                coords, metric=self.distance_metric
+        elif self.coordinate_system == "cartesian":
+            coords = np.stack(
+                (
+                    self._source_grid.face_x.values,
+                    self._source_grid.face_y.values,
+                    self._source_grid.face_z.values,
+                ),
+                axis=-1,
+            )
+        else:
+            raise ValueError(
+                f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
+                f"'spherical'"
             )
 
-        return self._tree_from_face_centers
+        return SKBallTree(coords, metric=self.distance_metric)
 
     def _build_from_nodes(self):
         """Internal``sklearn.neighbors.BallTree`` constructed from corner
         nodes."""
         from sklearn.neighbors import BallTree as SKBallTree
 
-        if self._tree_from_nodes is None or self.reconstruct:
-            # Sets which values to use for the tree based on the coordinate_system
-            if self.coordinate_system == "spherical":
-                coords = np.vstack(
-                    (
-                        deg2rad(self._source_grid.node_lat.values),
-                        deg2rad(self._source_grid.node_lon.values),
-                    )
-                ).T
-
-            if self.coordinate_system == "cartesian":
-                coords = np.stack(
-                    (
-                        self._source_grid.node_x.values,
-                        self._source_grid.node_y.values,
-                        self._source_grid.node_z.values,
-                    ),
-                    axis=-1,
+        # Sets which values to use for the tree based on the coordinate_system
+        if self.coordinate_system == "spherical":
+            coords = np.vstack(
+                (
+                    deg2rad(self._source_grid.node_lat.values),
+                    deg2rad(self._source_grid.node_lon.values),
                 )
-            self._tree_from_nodes = SKBallTree(coords, metric=self.distance_metric)
+            ).T
 
-        return self._tree_from_nodes
+        if self.coordinate_system == "cartesian":
+            coords = np.stack(
+                (
+                    self._source_grid.node_x.values,
+                    self._source_grid.node_y.values,
+                    self._source_grid.node_z.values,
+                ),
+                axis=-1,
+            )
+        return SKBallTree(coords, metric=self.distance_metric)
 
     def _build_from_edge_centers(self):
         """Internal``sklearn.neighbors.BallTree`` constructed from edge
         centers."""
         from sklearn.neighbors import BallTree as SKBallTree
 
-        if self._tree_from_edge_centers is None or self.reconstruct:
-            # Sets which values to use for the tree based on the coordinate_system
-            if self.coordinate_system == "spherical":
-                if self._source_grid.edge_lat is None:
-                    raise ValueError("edge_lat isn't populated")
-
-                coords = np.vstack(
-                    (
-                        deg2rad(self._source_grid.edge_lat.values),
-                        deg2rad(self._source_grid.edge_lon.values),
-                    )
-                ).T
-
-            elif self.coordinate_system == "cartesian":
-                if self._source_grid.edge_x is None:
-                    raise ValueError("edge_x isn't populated")
-
-                coords = np.stack(
-                    (
-                        self._source_grid.edge_x.values,
-                        self._source_grid.edge_y.values,
-                        self._source_grid.edge_z.values,
-                    ),
-                    axis=-1,
-                )
-            else:
-                raise ValueError(
-                    f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
-                    f"'spherical'"
-                )
-
-            self._tree_from_edge_centers = SKBallTree(
-                coords, metric=self.distance_metric
-            )
+        # Sets which values to use for the tree based on the coordinate_system
+        if self.coordinate_system == "spherical":
+            if self._source_grid.edge_lat is None:
+                raise ValueError("edge_lat isn't populated")
 
-        return self._tree_from_edge_centers
+            coords = np.vstack(
+                (
+                    deg2rad(self._source_grid.edge_lat.values),
+                    deg2rad(self._source_grid.edge_lon.values),
+                )
+            ).T
 
-    def _current_tree(self):
-        _tree = None
+        elif self.coordinate_system == "cartesian":
+            if self._source_grid.edge_x is None:
+                raise ValueError("edge_x isn't populated")
 
-        if self._coordinates == "nodes":
-            _tree = self._tree_from_nodes
-        elif self._coordinates == "face centers":
-            _tree = self._tree_from_face_centers
-        elif self._coordinates == "edge centers":
-            _tree = self._tree_from_edge_centers
+            coords = np.stack(
+                (
+                    self._source_grid.edge_x.values,
+                    self._source_grid.edge_y.values,
+                    self._source_grid.edge_z.values,
+                ),
+                axis=-1,
+            )
         else:
-            raise TypeError(
-                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
-                f"or 'edge centers'"
+            raise ValueError(
+                f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
+                f"'spherical'"
             )
 
-        return _tree
+        return SKBallTree(coords, metric=self.distance_metric)
 
     def query(
         self,
@@ -765,23 +788,8 @@ class BallTree:
         self._coordinates = value
 
         # set up appropriate reference to tree
-        if self._coordinates == "nodes":
-            if self._tree_from_nodes is None or self.reconstruct:
-                self._tree_from_nodes = self._build_from_nodes()
-            self._n_elements = self._source_grid.n_node
-        elif self._coordinates == "face centers":
-            if self._tree_from_face_centers is None or self.reconstruct:
-                self._tree_from_face_centers = self._build_from_face_centers()
-            self._n_elements = self._source_grid.n_face
-        elif self._coordinates == "edge centers":
-            if self._tree_from_edge_centers is None or self.reconstruct:
-                self._tree_from_edge_centers = self._build_from_edge_centers()
-            self._n_elements = self._source_grid.n_edge
-        else:
-            raise ValueError(
-                f"Unknown coordinates location, {self._coordinates}, use either 'nodes', 'face centers', "
-                f"or 'edge centers'"
-            )
+        self._n_elements = self._count_elements()
+        self._current_tree()
 
 
 class SpatialHash:
@@ -789,48 +797,67 @@ class SpatialHash:
     uniformly spaced structured grid, called the "hash grid" on top an unstructured grid. Faces in the unstructured grid are related
     to the cells in the hash grid by determining the hash cells the bounding box of the unstructured face cells overlap with.
 
+    Two hash grid layouts are available:
+
+    * ``"latlon"`` covers the longitude-latitude bounding box of the grid with square cells. Faces crossing the
+      antimeridian or containing a pole are not supported.
+    * ``"cubed_sphere"`` covers the whole globe with the equiangular cells of the six faces of a cube projected onto the
+      sphere. Faces are bounded in the gnomonic projection of each cube face, where their edges are straight lines, so
+      faces crossing the antimeridian or containing a pole are hashed correctly. Barycentric coordinates are computed in
+      the plane tangent to the sphere at each queried point.
+
     Parameters
     ----------
     grid : ux.Grid
         Source grid used to construct the hash grid and hash table
     reconstruct : bool, default=False
         If true, reconstructs the spatial hash
-
-    Note
-    ----
-    Does not currently support queries on periodic elements.
+    layout : {"latlon", "cubed_sphere"}, default="latlon"
+        Layout of the hash grid. Pass ``"cubed_sphere"`` for global grids with faces crossing the antimeridian or
+        containing a pole.
     """
 
     def __init__(
         self,
         grid,
         reconstruct: bool = False,
+        layout: str = "latlon",
     ):
         self._source_grid = grid
         self._nelements = self._source_grid.n_face
 
         self.reconstruct = reconstruct
 
+        if layout not in SPATIAL_HASH_LAYOUTS:
+            raise ValueError(
+                f"Invalid layout: {layout!r}. Expected one of {SPATIAL_HASH_LAYOUTS}"
+            )
+        self._layout = layout
+
         # Hash grid size
         self._dh = self._hash_cell_size()
 
-        # Lower left corner of the hash grid
-        lon_min = np.deg2rad(self._source_grid.node_lon.min().to_numpy())
-        lat_min = np.deg2rad(self._source_grid.node_lat.min().to_numpy())
-        lon_max = np.deg2rad(self._source_grid.node_lon.max().to_numpy())
-        lat_max = np.deg2rad(self._source_grid.node_lat.max().to_numpy())
-
-        self._xmin = lon_min - self._dh
-        self._ymin = lat_min - self._dh
-        self._xmax = lon_max + self._dh
-        self._ymax = lat_max + self._dh
-
-        # Number of x points in the hash grid; used for
-        # array flattening
-        Lx = self._xmax - self._xmin
-        Ly = self._ymax - self._ymin
-        self._nx = int(np.ceil(Lx / self._dh))
-        self._ny = int(np.ceil(Ly / self._dh))
+        if self._layout == "cubed_sphere":
+            # Number of hash cells along each side of a cube face, which spans pi / 2 radians
+            self._n_side = max(int(np.ceil(0.5 * np.pi / self._dh)), 1)
+        else:
+            # Lower left corner of the hash grid
+            lon_min = np.deg2rad(self._source_grid.node_lon.min().to_numpy())
+            lat_min = np.deg2rad(self._source_grid.node_lat.min().to_numpy())
+            lon_max = np.deg2rad(self._source_grid.node_lon.max().to_numpy())
+            lat_max = np.deg2rad(self._source_grid.node_lat.max().to_numpy())
+
+            self._xmin = lon_min - self._dh
+            self._ymin = lat_min - self._dh
+            self._xmax = lon_max + self._dh
+            self._ymax = lat_max + self._dh
+
+            # Number of x points in the hash grid; used for
+            # array flattening
+            Lx = self._xmax - self._xmin
+            Ly = self._ymax - self._ymin
+            self._nx = int(np.ceil(Lx / self._dh))
+            self._ny = int(np.ceil(Ly / self._dh))
 
         # Generate the mapping from the hash indices to unstructured grid elements
         self._face_hash_table = None
@@ -858,10 +885,21 @@ class SpatialHash:
 
     def _initialize_face_hash_table(self):
         """Create a mapping that relates unstructured grid faces to hash indices by determining
-        which faces overlap with which hash cells"""
+        which faces overlap with which hash cells.
+
+        The mapping is stored in compressed sparse row (CSR) form as a tuple ``(offsets, face_ids)``,
+        where the faces overlapping the hash cell ``h`` are ``face_ids[offsets[h]:offsets[h + 1]]``.
+        """
 
         if self._face_hash_table is None or self.reconstruct:
-            index_to_face = [[] for i in range(self._nx * self._ny)]
+            if self._layout == "cubed_sphere":
+                return _build_cubed_sphere_hash_table(
+                    self._source_grid.face_node_connectivity.to_numpy(),
+                    self._source_grid.n_nodes_per_face.to_numpy(),
+                    *self._node_xyz(),
+                    self._n_side,
+                )
+
             lon_bounds = np.sort(self._source_grid.face_bounds_lon.to_numpy(), 1)
             lat_bounds = self._source_grid.face_bounds_lat.to_numpy()
 
@@ -880,17 +918,7 @@ class SpatialHash:
             )
             i2, j2 = self._hash_index2d(coords)
 
-            try:
-                for eid in range(self._source_grid.n_face):
-                    for j in range(j1[eid], j2[eid] + 1):
-                        for i in range(i1[eid], i2[eid] + 1):
-                            index_to_face[i + self._nx * j].append(eid)
-            except IndexError:
-                raise IndexError(
-                    "list index out of range. This may indicate incorrect `edge_node_distances` values."
-                )
-
-            return index_to_face
+            return _build_face_hash_table(i1, j1, i2, j2, self._nx, self._ny)
 
     def query(
         self,
@@ -918,41 +946,372 @@ class SpatialHash:
         """
 
         coords = _prepare_xy_for_query(coords, in_radians, distance_metric=None)
-        num_coords = coords.shape[0]
-        max_nodes = self._source_grid.n_max_face_nodes
-
-        # Preallocate results
-        bcoords = np.zeros((num_coords, max_nodes), dtype=np.double)
-        faces = np.full(num_coords, -1, dtype=INT_DTYPE)
-
-        # Get grid variables
-        n_nodes_per_face = self._source_grid.n_nodes_per_face.to_numpy()
-        face_node_connectivity = self._source_grid.face_node_connectivity.to_numpy()
-
-        # Precompute radian values for node coordinates:
-        node_lon = np.deg2rad(self._source_grid.node_lon.to_numpy())
-        node_lat = np.deg2rad(self._source_grid.node_lat.to_numpy())
-
-        # Get the list of candidate faces for each coordinate
-        candidate_faces = [
-            self._face_hash_table[pid] for pid in self._hash_index(coords)
-        ]
-
-        for i, (coord, candidates) in enumerate(zip(coords, candidate_faces)):
-            for face_id in candidates:
-                n_nodes = n_nodes_per_face[face_id]
-                node_ids = face_node_connectivity[face_id, :n_nodes]
-                nodes = np.column_stack((node_lon[node_ids], node_lat[node_ids]))
-                bcoord = np.asarray(_barycentric_coordinates(nodes, coord))
-                err = abs(np.dot(bcoord, nodes[:, 0]) - coord[0]) + abs(
-                    np.dot(bcoord, nodes[:, 1]) - coord[1]
-                )
-                if (bcoord >= 0).all() and err < tol:
-                    faces[i] = face_id
-                    bcoords[i, :n_nodes] = bcoord[:n_nodes]
-                    break
+        offsets, face_ids = self._face_hash_table
+
+        if self._layout == "cubed_sphere":
+            lon, lat = coords[:, 0], coords[:, 1]
+            points = np.column_stack(
+                (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat))
+            )
+            return _query_cubed_sphere_hash_table(
+                points,
+                self._n_side,
+                offsets,
+                face_ids,
+                self._source_grid.face_node_connectivity.to_numpy(),
+                self._source_grid.n_nodes_per_face.to_numpy(),
+                *self._node_xyz(),
+                tol,
+            )
+
+        return _query_face_hash_table(
+            np.ascontiguousarray(coords, dtype=np.float64),
+            self._xmin,
+            self._ymin,
+            self._dh,
+            self._nx,
+            self._ny,
+            offsets,
+            face_ids,
+            self._source_grid.face_node_connectivity.to_numpy(),
+            self._source_grid.n_nodes_per_face.to_numpy(),
+            np.deg2rad(self._source_grid.node_lon.to_numpy()).astype(np.float64),
+            np.deg2rad(self._source_grid.node_lat.to_numpy()).astype(np.float64),
+            tol,
+        )
+
+    def _node_xyz(self):
+        """Returns the Cartesian coordinates of the nodes, projected onto the unit sphere."""
+        lon = np.deg2rad(self._source_grid.node_lon.to_numpy().astype(np.float64))
+        lat = np.deg2rad(self._source_grid.node_lat.to_numpy().astype(np.float64))
+        return np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)
+
 
-        return faces, bcoords
+@njit(cache=True)
+def _build_face_hash_table(i1, j1, i2, j2, nx, ny):
+    """Builds the CSR hash table of ``SpatialHash`` in two passes, first counting the faces
+    overlapping each hash cell and then filling in their ids. The ranges of hash cells
+    ``[i1, i2] x [j1, j2]`` covered by each face are clipped to the hash grid."""
+    n_faces = i1.shape[0]
+
+    counts = np.zeros(nx * ny, dtype=INT_DTYPE)
+    for eid in range(n_faces):
+        for j in range(max(j1[eid], 0), min(j2[eid], ny - 1) + 1):
+            for i in range(max(i1[eid], 0), min(i2[eid], nx - 1) + 1):
+                counts[i + nx * j] += 1
+
+    offsets = np.zeros(nx * ny + 1, dtype=INT_DTYPE)
+    offsets[1:] = np.cumsum(counts)
+
+    # faces are visited in increasing order, so the faces of each cell stay sorted
+    face_ids = np.empty(offsets[-1], dtype=INT_DTYPE)
+    cursor = offsets[:-1].copy()
+    for eid in range(n_faces):
+        for j in range(max(j1[eid], 0), min(j2[eid], ny - 1) + 1):
+            for i in range(max(i1[eid], 0), min(i2[eid], nx - 1) + 1):
+                h = i + nx * j
+                face_ids[cursor[h]] = eid
+                cursor[h] += 1
+
+    return offsets, face_ids
+
+
+@njit(cache=True, parallel=True)
+def _query_face_hash_table(
+    coords,
+    xmin,
+    ymin,
+    dh,
+    nx,
+    ny,
+    offsets,
+    face_ids,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_lon,
+    node_lat,
+    tol,
+):
+    """Locates each (lon, lat) coordinate, in radians, by testing the faces of its hash cell
+    in parallel. Returns the face id (``-1`` if not found) and barycentric coordinates of each
+    coordinate, as described in ``SpatialHash.query``."""
+    num_coords = coords.shape[0]
+    max_nodes = face_node_connectivity.shape[1]
+
+    faces = np.full(num_coords, -1, dtype=INT_DTYPE)
+    bcoords = np.zeros((num_coords, max_nodes), dtype=np.double)
+
+    for p in prange(num_coords):
+        x = coords[p, 0]
+        y = coords[p, 1]
+
+        # coordinates outside the hash grid (or NaN) have no candidates
+        fi = (x - xmin) / dh
+        fj = (y - ymin) / dh
+        if not (fi >= 0.0 and fi < nx and fj >= 0.0 and fj < ny):
+            continue
+        h = int(math.floor(fi)) + nx * int(math.floor(fj))
+
+        for k in range(offsets[h], offsets[h + 1]):
+            face_id = face_ids[k]
+            n_nodes = n_nodes_per_face[face_id]
+            nodes = np.empty((n_nodes, 2), dtype=np.float64)
+            for m in range(n_nodes):
+                nodes[m, 0] = node_lon[face_node_connectivity[face_id, m]]
+                nodes[m, 1] = node_lat[face_node_connectivity[face_id, m]]
+
+            bcoord = _barycentric_coordinates(nodes, coords[p])
+            err = abs(np.dot(bcoord, nodes[:, 0]) - x) + abs(
+                np.dot(bcoord, nodes[:, 1]) - y
+            )
+            if np.all(bcoord >= 0) and err < tol:
+                faces[p] = face_id
+                bcoords[p, :n_nodes] = bcoord
+                break
+
+    return faces, bcoords
+
+
+@njit(cache=True)
+def _cube_face_cell(point, n_side):
+    """Returns the flattened hash index of the equiangular cubed-sphere cell containing a point on
+    the unit sphere."""
+    axis = 0
+    for d in range(1, 3):
+        if abs(point[d]) > abs(point[axis]):
+            axis = d
+    cube_face = 2 * axis + (0 if point[axis] >= 0.0 else 1)
+
+    depth = abs(point[axis])
+    cell_size = 0.5 * np.pi / n_side
+    i = int((math.atan(point[(axis + 1) % 3] / depth) + 0.25 * np.pi) / cell_size)
+    j = int((math.atan(point[(axis + 2) % 3] / depth) + 0.25 * np.pi) / cell_size)
+    i = min(max(i, 0), n_side - 1)
+    j = min(max(j, 0), n_side - 1)
+
+    return cube_face * n_side * n_side + j * n_side + i
+
+
+@njit(cache=True)
+def _cube_face_cell_range(
+    face_id, cube_face, face_node_connectivity, n_nodes_per_face, x, y, z, n_side
+):
+    """Returns the range of cells ``(i0, i1, j0, j1)`` of a cube face overlapped by a grid face,
+    with ``i0 > i1`` if they do not overlap.
+
+    The nodes of the face are projected onto the plane of the cube face with a gnomonic
+    projection, which maps great-circle edges to straight lines, so the bounding box of the
+    projected nodes bounds the whole face. Faces reaching the horizon of the cube face cannot be
+    projected; they conservatively cover the whole cube face, unless the cap bounding their nodes
+    lies outside of it."""
+    axis = cube_face // 2
+    sign = 1.0 if cube_face % 2 == 0 else -1.0
+
+    u_min, u_max, v_min, v_max = np.inf, -np.inf, np.inf, -np.inf
+    visible = False
+    projectable = True
+    for m in range(n_nodes_per_face[face_id]):
+        node = face_node_connectivity[face_id, m]
+        p = (x[node], y[node], z[node])
+        depth = sign * p[axis]
+        if depth > 0.0:
+            visible = True
+        if depth <= ERROR_TOLERANCE:
+            projectable = False
+            continue
+        u = p[(axis + 1) % 3] / depth
+        v = p[(axis + 2) % 3] / depth
+        u_min, u_max = min(u_min, u), max(u_max, u)
+        v_min, v_max = min(v_min, v), max(v_max, v)
+
+    if not visible:
+        return 1, 0, 1, 0
+    if not projectable:
+        if _node_cap_reaches_cube_face(
+            face_id, axis, sign, face_node_connectivity, n_nodes_per_face, x, y, z
+        ):
+            return 0, n_side - 1, 0, n_side - 1
+        return 1, 0, 1, 0
+
+    # allow for round-off in the cell of points on the edges of the face
+    u_min, u_max = u_min - ERROR_TOLERANCE, u_max + ERROR_TOLERANCE
+    v_min, v_max = v_min - ERROR_TOLERANCE, v_max + ERROR_TOLERANCE
+    if u_max < -1.0 or u_min > 1.0 or v_max < -1.0 or v_min > 1.0:
+        return 1, 0, 1, 0
+
+    cell_size = 0.5 * np.pi / n_side
+    i0 = int((math.atan(max(u_min, -1.0)) + 0.25 * np.pi) / cell_size)
+    i1 = int((math.atan(min(u_max, 1.0)) + 0.25 * np.pi) / cell_size)
+    j0 = int((math.atan(max(v_min, -1.0)) + 0.25 * np.pi) / cell_size)
+    j1 = int((math.atan(min(v_max, 1.0)) + 0.25 * np.pi) / cell_size)
+
+    return (
+        max(i0, 0),
+        min(i1, n_side - 1),
+        max(j0, 0),
+        min(j1, n_side - 1),
+    )
+
+
+@njit(cache=True)
+def _node_cap_reaches_cube_face(
+    face_id, axis, sign, face_node_connectivity, n_nodes_per_face, x, y, z
+):
+    """Whether the spherical cap centered on the mean of the nodes of a face and containing all of
+    them reaches the region of a cube face, which lies within ``arccos(1 / sqrt(3))`` of its axis."""
+    n_nodes = n_nodes_per_face[face_id]
+    center = np.zeros(3, dtype=np.float64)
+    for m in range(n_nodes):
+        node = face_node_connectivity[face_id, m]
+        center[0] += x[node]
+        center[1] += y[node]
+        center[2] += z[node]
+    norm = np.linalg.norm(center)
+    if norm < ERROR_TOLERANCE:
+        return True
+    center /= norm
+
+    radius = 0.0
+    for m in range(n_nodes):
+        node = face_node_connectivity[face_id, m]
+        cos_angle = center[0] * x[node] + center[1] * y[node] + center[2] * z[node]
+        radius = max(radius, math.acos(min(max(cos_angle, -1.0), 1.0)))
+
+    center_angle = math.acos(min(max(sign * center[axis], -1.0), 1.0))
+    return center_angle - radius <= math.acos(1.0 / math.sqrt(3.0)) + ERROR_TOLERANCE
+
+
+@njit(cache=True)
+def _build_cubed_sphere_hash_table(
+    face_node_connectivity, n_nodes_per_face, x, y, z, n_side
+):
+    """Builds the CSR hash table of the ``"cubed_sphere"`` layout of ``SpatialHash`` in two passes,
+    first counting the faces overlapping each hash cell and then filling in their ids."""
+    n_faces = face_node_connectivity.shape[0]
+    n_cells = 6 * n_side * n_side
+
+    counts = np.zeros(n_cells, dtype=INT_DTYPE)
+    for eid in range(n_faces):
+        for cube_face in range(6):
+            i0, i1, j0, j1 = _cube_face_cell_range(
+                eid,
+                cube_face,
+                face_node_connectivity,
+                n_nodes_per_face,
+                x,
+                y,
+                z,
+                n_side,
+            )
+            for j in range(j0, j1 + 1):
+                for i in range(i0, i1 + 1):
+                    counts[cube_face * n_side * n_side + j * n_side + i] += 1
+
+    offsets = np.zeros(n_cells + 1, dtype=INT_DTYPE)
+    offsets[1:] = np.cumsum(counts)
+
+    face_ids = np.empty(offsets[-1], dtype=INT_DTYPE)
+    cursor = offsets[:-1].copy()
+    for eid in range(n_faces):
+        for cube_face in range(6):
+            i0, i1, j0, j1 = _cube_face_cell_range(
+                eid,
+                cube_face,
+                face_node_connectivity,
+                n_nodes_per_face,
+                x,
+                y,
+                z,
+                n_side,
+            )
+            for j in range(j0, j1 + 1):
+                for i in range(i0, i1 + 1):
+                    h = cube_face * n_side * n_side + j * n_side + i
+                    face_ids[cursor[h]] = eid
+                    cursor[h] += 1
+
+    return offsets, face_ids
+
+
+@njit(cache=True, parallel=True)
+def _query_cubed_sphere_hash_table(
+    points,
+    n_side,
+    offsets,
+    face_ids,
+    face_node_connectivity,
+    n_nodes_per_face,
+    x,
+    y,
+    z,
+    tol,
+):
+    """Locates each point on the unit sphere by testing the faces of its cubed-sphere hash cell in
+    parallel. Candidate faces are projected onto the plane tangent to the sphere at the point, where
+    their edges are straight lines, before computing barycentric coordinates."""
+    num_points = points.shape[0]
+    max_nodes = face_node_connectivity.shape[1]
+
+    faces = np.full(num_points, -1, dtype=INT_DTYPE)
+    bcoords = np.zeros((num_points, max_nodes), dtype=np.double)
+    origin = np.zeros(2, dtype=np.float64)
+
+    for p in prange(num_points):
+        point = points[p]
+        if not np.all(np.isfinite(point)):
+            continue
+        h = _cube_face_cell(point, n_side)
+
+        # orthonormal basis of the tangent plane at the point
+        helper = np.array([1.0, 0.0, 0.0])
+        if abs(point[0]) > 0.9:
+            helper = np.array([0.0, 1.0, 0.0])
+        e1 = np.cross(point, helper)
+        e1 /= np.linalg.norm(e1)
+        e2 = np.cross(point, e1)
+
+        for k in range(offsets[h], offsets[h + 1]):
+            face_id = face_ids[k]
+            n_nodes = n_nodes_per_face[face_id]
+            nodes = np.empty((n_nodes, 2), dtype=np.float64)
+            in_front = True
+            for m in range(n_nodes):
+                node = face_node_connectivity[face_id, m]
+                depth = x[node] * point[0] + y[node] * point[1] + z[node] * point[2]
+                if depth <= 0.0:
+                    in_front = False
+                    break
+                nodes[m, 0] = (
+                    x[node] * e1[0] + y[node] * e1[1] + z[node] * e1[2]
+                ) / depth
+                nodes[m, 1] = (
+                    x[node] * e2[0] + y[node] * e2[1] + z[node] * e2[2]
+                ) / depth
+            if not in_front:
+                continue
+
+            # rescale the face to unit size so that the area tolerance of the barycentric
+            # coordinates does not depend on the grid resolution
+            scale = 0.0
+            for m in range(n_nodes):
+                scale = max(scale, abs(nodes[m, 0]), abs(nodes[m, 1]))
+            if scale == 0.0:
+                scale = 1.0
+            nodes /= scale
+
+            bcoord = _barycentric_coordinates(nodes, origin)
+            err_u = 0.0
+            err_v = 0.0
+            for m in range(n_nodes):
+                err_u += bcoord[m] * nodes[m, 0]
+                err_v += bcoord[m] * nodes[m, 1]
+            err = scale * (abs(err_u) + abs(err_v))
+            if np.all(bcoord >= 0) and err < tol:
+                faces[p] = face_id
+                bcoords[p, :n_nodes] = bcoord
+                break
+
+    return faces, bcoords
 
 
 @njit(cache=True)
@@ -983,8 +1342,8 @@ def _barycentric_coordinates(nodes, point):
 
     """
     n = len(nodes)
-    sum_wi = 0
-    w = []
+    sum_wi = 0.0
+    w = np.empty(n, dtype=np.float64)
 
     for i in range(0, n):
         vim1 = nodes[i - 1]
@@ -993,11 +1352,10 @@ def _barycentric_coordinates(nodes, point):
         a0 = _triangle_area(vim1, vi, vi1)
         a1 = max(_triangle_area(point, vim1, vi), ERROR_TOLERANCE)
         a2 = max(_triangle_area(point, vi, vi1), ERROR_TOLERANCE)
-        sum_wi += a0 / (a1 * a2)
-        w.append(a0 / (a1 * a2))
-    barycentric_coords = [w_i / sum_wi for w_i in w]
+        w[i] = a0 / (a1 * a2)
+        sum_wi += w[i]
 
-    return barycentric_coords
+    return w / sum_wi
 
 
 def _prepare_xy_for_query(xy, use_radians, distance_metric):
@@ -1114,7 +1472,7 @@ def _construct_edge_face_distances(face_lon, face_lat, edge_faces):
     """Helper for computing the arc-distance between faces that saddle a given
     edge."""
 
-    saddle_mask = edge_faces[:, 1] != INT_FILL_VALUE
+    saddle_mask = edge_faces[:, 1] != _fill_value(edge_faces.dtype)
 
     edge_face_distances = np.zeros(edge_faces.shape[0])
 
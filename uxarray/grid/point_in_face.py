@@ -8,6 +8,7 @@ from numba import njit, prange
 from uxarray.constants import ERROR_TOLERANCE, INT_DTYPE, INT_FILL_VALUE
 from uxarray.grid.arcs import point_within_gca
 from uxarray.grid.utils import _get_cartesian_face_edge_nodes, _small_angle_of_2_vectors
+from uxarray.options import _fill_value
 
 if TYPE_CHECKING:
     from numpy.typing import ArrayLike
@@ -15,6 +16,42 @@ if TYPE_CHECKING:
     from uxarray.grid.grid import Grid
 
 
+@njit(cache=True)
+def _strictly_inside_face(face_edges: np.ndarray, point: np.ndarray) -> bool:
+    """
+    Cheap sufficient test for a point lying strictly inside a face.
+
+    The point is inside if it lies in the hemisphere of every node and strictly on
+    the same side of the great circle through every edge. Points close to an edge
+    or to the great circle of an edge are left to the winding-number test.
+    """
+    n = face_edges.shape[0]
+    if n < 3:
+        return False
+
+    side = 0.0
+    for e in range(n):
+        a = face_edges[e, 0]
+        b = face_edges[e, 1]
+        if a[0] * point[0] + a[1] * point[1] + a[2] * point[2] <= 0.0:
+            return False
+
+        # triple product point . (a x b)
+        t = (
+            point[0] * (a[1] * b[2] - a[2] * b[1])
+            + point[1] * (a[2] * b[0] - a[0] * b[2])
+            + point[2] * (a[0] * b[1] - a[1] * b[0])
+        )
+        if abs(t) <= ERROR_TOLERANCE:
+            return False
+        if side == 0.0:
+            side = t
+        elif (t > 0.0) != (side > 0.0):
+            return False
+
+    return True
+
+
 @njit(cache=True)
 def _face_contains_point(face_edges: np.ndarray, point: np.ndarray) -> bool:
     """
@@ -37,6 +74,10 @@ def _face_contains_point(face_edges: np.ndarray, point: np.ndarray) -> bool:
     inside : bool
         True if the point is inside the face or lies exactly on a node/edge; False otherwise.
     """
+    # Points strictly inside the face need no further checks
+    if _strictly_inside_face(face_edges, point):
+        return True
+
     # Check for an exact hit with any of the corner nodes
     for e in range(face_edges.shape[0]):
         if np.allclose(
@@ -120,11 +161,269 @@ def _get_faces_containing_point(
     return hit_buf[:count]
 
 
+# Number of faces stored in each leaf of the bounding-cap hierarchy
+_BVH_LEAF_SIZE = 8
+
+# Bounding caps are inflated slightly so that points on a face's nodes or edges
+# are never culled by round-off
+_BVH_CAP_SCALE = 1.05
+
+
+def _build_face_bvh(source_grid: Grid, leaf_size: int = _BVH_LEAF_SIZE):
+    """
+    Construct a bounding volume hierarchy over the bounding caps of each face.
+
+    The cap of a face is the smallest sphere centered on the face center that
+    contains all of its nodes, so it adapts to the local resolution of the grid,
+    unlike a single search radius shared by every face.
+
+    Parameters
+    ----------
+    source_grid : Grid
+        UXarray Grid object.
+    leaf_size : int, default=8
+        Maximum number of faces stored in each leaf.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(order, lower, upper, children, ranges, centers, radii)``, where each
+        tree node stores an axis-aligned box (``lower``, ``upper``) enclosing the
+        caps below it, the indices of its two ``children`` (``-1`` for leaves) and
+        a ``[start, end)`` range into the face permutation ``order``. ``centers``
+        and ``radii`` describe the (inflated) cap of each face.
+    """
+    centers, radii = _face_caps(source_grid)
+
+    order, lower, upper, children, ranges = _build_cap_hierarchy(
+        centers, radii, leaf_size
+    )
+    return order, lower, upper, children, ranges, centers, radii
+
+
+def _face_caps(grid: Grid):
+    """Returns the ``(centers, radii)`` of the inflated bounding cap of each face
+    of ``grid``, as used by ``_build_face_bvh``."""
+    from uxarray.grid.geometry import calculate_face_radii
+
+    grid.normalize_cartesian_coordinates()
+
+    centers = np.column_stack(
+        [
+            grid.face_x.values,
+            grid.face_y.values,
+            grid.face_z.values,
+        ]
+    ).astype(np.float64)
+    radii = calculate_face_radii(
+        grid.face_node_connectivity.values,
+        grid.node_x.values.astype(np.float64),
+        grid.node_y.values.astype(np.float64),
+        grid.node_z.values.astype(np.float64),
+        centers[:, 0].copy(),
+        centers[:, 1].copy(),
+        centers[:, 2].copy(),
+    )
+    return centers, radii * _BVH_CAP_SCALE + ERROR_TOLERANCE
+
+
+@njit(cache=True)
+def _build_cap_hierarchy(centers, radii, leaf_size):
+    """Builds the tree of ``_build_face_bvh`` top-down, splitting each node at the
+    median face center along the axis of largest extent."""
+    n = centers.shape[0]
+    max_nodes = max(2 * n - 1, 1)
+
+    order = np.arange(n)
+    lower = np.empty((max_nodes, 3), dtype=np.float64)
+    upper = np.empty((max_nodes, 3), dtype=np.float64)
+    children = np.full((max_nodes, 2), -1, dtype=np.int64)
+    ranges = np.zeros((max_nodes, 2), dtype=np.int64)
+
+    stack = np.empty(max_nodes, dtype=np.int64)
+    ranges[0, 1] = n
+    stack[0] = 0
+    top = 1
+    n_nodes = 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        start, end = ranges[node, 0], ranges[node, 1]
+
+        center_lo = np.full(3, np.inf)
+        center_hi = np.full(3, -np.inf)
+        lower[node] = np.inf
+        upper[node] = -np.inf
+        for k in range(start, end):
+            f = order[k]
+            for d in range(3):
+                c = centers[f, d]
+                center_lo[d] = min(center_lo[d], c)
+                center_hi[d] = max(center_hi[d], c)
+                lower[node, d] = min(lower[node, d], c - radii[f])
+                upper[node, d] = max(upper[node, d], c + radii[f])
+
+        if end - start <= leaf_size:
+            continue
+
+        axis = np.argmax(center_hi - center_lo)
+        members = order[start:end].copy()
+        order[start:end] = members[np.argsort(centers[members, axis])]
+
+        mid = (start + end) // 2
+        left, right = n_nodes, n_nodes + 1
+        n_nodes += 2
+        children[node, 0] = left
+        children[node, 1] = right
+        ranges[left, 0], ranges[left, 1] = start, mid
+        ranges[right, 0], ranges[right, 1] = mid, end
+        stack[top] = left
+        stack[top + 1] = right
+        top += 2
+
+    return (
+        order,
+        lower[:n_nodes].copy(),
+        upper[:n_nodes].copy(),
+        children[:n_nodes].copy(),
+        ranges[:n_nodes].copy(),
+    )
+
+
+@njit(cache=True)
+def _bvh_query_point(
+    p,
+    hits,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """Traverse the bounding-cap hierarchy for a single point, writing the faces
+    containing it into ``hits`` in increasing order and returning their number."""
+    width = hits.shape[0]
+    stack = np.empty(128, dtype=np.int64)
+    stack[0] = 0
+    top = 1
+    count = 0
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if (
+            p[0] < lower[node, 0]
+            or p[0] > upper[node, 0]
+            or p[1] < lower[node, 1]
+            or p[1] > upper[node, 1]
+            or p[2] < lower[node, 2]
+            or p[2] > upper[node, 2]
+        ):
+            continue
+
+        if children[node, 0] >= 0:
+            stack[top] = children[node, 0]
+            stack[top + 1] = children[node, 1]
+            top += 2
+            continue
+
+        for k in range(ranges[node, 0], ranges[node, 1]):
+            f = order[k]
+            dx = p[0] - centers[f, 0]
+            dy = p[1] - centers[f, 1]
+            dz = p[2] - centers[f, 2]
+            if dx * dx + dy * dy + dz * dz > radii[f] * radii[f]:
+                continue
+
+            face_edges = _get_cartesian_face_edge_nodes(
+                f, face_node_connectivity, n_nodes_per_face, node_x, node_y, node_z
+            )
+            if count < width and _face_contains_point(face_edges, p):
+                # insertion sort keeps the hits of each point ordered
+                j = count
+                while j > 0 and hits[j - 1] > f:
+                    hits[j] = hits[j - 1]
+                    j -= 1
+                hits[j] = f
+                count += 1
+
+    return count
+
+
+@njit(cache=True)
+def _bvh_query_cap(
+    center,
+    radius,
+    hits,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+):
+    """Traverse the bounding-cap hierarchy for a single cap, writing the faces
+    whose cap intersects it into ``hits`` and returning their number. Only the
+    number is computed for the faces that do not fit into ``hits``."""
+    width = hits.shape[0]
+    stack = np.empty(128, dtype=np.int64)
+    stack[0] = 0
+    top = 1
+    count = 0
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if (
+            center[0] < lower[node, 0] - radius
+            or center[0] > upper[node, 0] + radius
+            or center[1] < lower[node, 1] - radius
+            or center[1] > upper[node, 1] + radius
+            or center[2] < lower[node, 2] - radius
+            or center[2] > upper[node, 2] + radius
+        ):
+            continue
+
+        if children[node, 0] >= 0:
+            stack[top] = children[node, 0]
+            stack[top + 1] = children[node, 1]
+            top += 2
+            continue
+
+        for k in range(ranges[node, 0], ranges[node, 1]):
+            f = order[k]
+            dx = center[0] - centers[f, 0]
+            dy = center[1] - centers[f, 1]
+            dz = center[2] - centers[f, 2]
+            reach = radius + radii[f]
+            if dx * dx + dy * dy + dz * dz > reach * reach:
+                continue
+            if count < width:
+                hits[count] = f
+            count += 1
+
+    return count
+
+
 @njit(cache=True, parallel=True)
-def _batch_point_in_face(
+def _bvh_point_in_face(
     points: np.ndarray,
-    flat_candidate_indices: np.ndarray,
-    offsets: np.ndarray,
+    order: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    children: np.ndarray,
+    ranges: np.ndarray,
+    centers: np.ndarray,
+    radii: np.ndarray,
     face_node_connectivity: np.ndarray,
     n_nodes_per_face: np.ndarray,
     node_x: np.ndarray,
@@ -132,45 +431,39 @@ def _batch_point_in_face(
     node_z: np.ndarray,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Parallel entry-point: for each point, test all candidate faces in batch.
-
-    Parameters
-    ----------
-    points : np.ndarray, shape (n_points, 3)
-        Cartesian coordinates of query points.
-    flat_candidate_indices : np.ndarray, shape (total_candidates,)
-        Flattened array of all candidate face indices across points.
-    offsets : np.ndarray, shape (n_points + 1,)
-        Offsets into `flat_candidate_indices` marking each point’s slice.
-    face_node_connectivity, n_nodes_per_face, node_x, node_y, node_z
-        As in `_get_faces_containing_point`.
+    Parallel entry-point: for each point, traverse the bounding-cap hierarchy and
+    run the winding-number test on the faces whose cap contains the point.
 
     Returns
     -------
-    results : np.ndarray, shape (n_points, max_candidates)
-        Each row lists face indices containing the corresponding point;
-        unused entries are filled with `INT_FILL_VALUE`.
+    results : np.ndarray, shape (n_points, max_nodes)
+        Each row lists, in increasing order, the face indices containing the
+        corresponding point; unused entries are filled with `INT_FILL_VALUE`.
     counts : np.ndarray, shape (n_points,)
         Number of valid face-hits per point.
     """
-    n_points = offsets.shape[0] - 1
-    results = np.full(
-        (n_points, face_node_connectivity.shape[1]), INT_FILL_VALUE, dtype=INT_DTYPE
-    )
+    n_points = points.shape[0]
+    width = face_node_connectivity.shape[1]
+    results = np.full((n_points, width), INT_FILL_VALUE, dtype=INT_DTYPE)
     counts = np.zeros(n_points, dtype=INT_DTYPE)
 
     for i in prange(n_points):
-        start = offsets[i]
-        end = offsets[i + 1]
-        p = points[i]
-        cands = flat_candidate_indices[start:end]
-
-        hits = _get_faces_containing_point(
-            p, cands, face_node_connectivity, n_nodes_per_face, node_x, node_y, node_z
+        counts[i] = _bvh_query_point(
+            points[i],
+            results[i],
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
         )
-        for j, fi in enumerate(hits):
-            results[i, j] = fi
-        counts[i] = hits.shape[0]
 
     return results, counts
 
@@ -181,16 +474,16 @@ def _point_in_face_query(
     """
     Find grid faces that contain given Cartesian point(s) on the unit sphere.
 
-    This function first uses a SciPy k-d tree (in Cartesian space) to cull
-    candidate faces within the maximum face‐radius, then calls the Numba‐
-    accelerated winding‐number tester in parallel.
+    Candidate faces are culled with a bounding volume hierarchy over the bounding
+    cap of each face, so the number of candidates tested per point depends on the
+    local resolution of the grid rather than on its largest face. The Numba-
+    accelerated winding-number test is then run on the candidates in parallel.
 
     Parameters
     ----------
     source_grid : Grid
         UXarray Grid object, which must provide:
-        - ._get_scipy_kd_tree(): a SciPy cKDTree over node‐centroids,
-        - .max_face_radius: float search radius,
+        - ._get_face_bvh(): the cached bounding-cap hierarchy of its faces,
         - .face_node_connectivity, .n_nodes_per_face, .node_x, .node_y, .node_z
           arrays for reconstructing face edges.
     points : array_like, shape (3,) or (n_points, 3)
@@ -207,23 +500,685 @@ def _point_in_face_query(
     pts = np.asarray(points, dtype=np.float64)
     if pts.ndim == 1:
         pts = pts[np.newaxis, :]
-    # Cull with k-d tree
-    kdt = source_grid._get_scipy_kd_tree()
-    radius = source_grid.max_face_radius * 1.05
-    cand_lists = kdt.query_ball_point(x=pts, r=radius, workers=-1)
-
-    # Prepare flattened candidates and offsets
-    flat_cands = np.concatenate([np.array(lst, dtype=np.int64) for lst in cand_lists])
-    lens = np.array([len(lst) for lst in cand_lists], dtype=np.int64)
-    offs = np.empty(len(lens) + 1, dtype=np.int64)
-    offs[0] = 0
-    np.cumsum(lens, out=offs[1:])
-
-    # Perform the batch winding‐number test
-    return _batch_point_in_face(
+
+    order, lower, upper, children, ranges, centers, radii = source_grid._get_face_bvh()
+
+    return _bvh_point_in_face(
+        np.ascontiguousarray(pts),
+        order,
+        lower,
+        upper,
+        children,
+        ranges,
+        centers,
+        radii,
+        source_grid.face_node_connectivity.values,
+        source_grid.n_nodes_per_face.values,
+        source_grid.node_x.values,
+        source_grid.node_y.values,
+        source_grid.node_z.values,
+    )
+
+
+# Maximum number of faces visited by a single walk before falling back to the
+# bounding-cap hierarchy
+_WALK_MAX_STEPS = 64
+
+
+@njit(cache=True)
+def _walk_to_point(
+    p,
+    start,
+    face_face_connectivity,
+    centers,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """
+    Walk across neighboring faces from ``start`` towards the point ``p``.
+
+    At each step the current face and its neighbors are tested with the
+    winding-number method; if none contains the point, the walk moves to the
+    neighbor whose center is closest to it.
+
+    Returns
+    -------
+    int
+        Index of a face containing the point, or ``INT_FILL_VALUE`` if the walk
+        gets stuck or exceeds ``_WALK_MAX_STEPS`` steps.
+    """
+    current = start
+    for _ in range(_WALK_MAX_STEPS):
+        face_edges = _get_cartesian_face_edge_nodes(
+            current, face_node_connectivity, n_nodes_per_face, node_x, node_y, node_z
+        )
+        if _face_contains_point(face_edges, p):
+            return current
+
+        best = INT_FILL_VALUE
+        best_d2 = (
+            (p[0] - centers[current, 0]) ** 2
+            + (p[1] - centers[current, 1]) ** 2
+            + (p[2] - centers[current, 2]) ** 2
+        )
+        for j in range(face_face_connectivity.shape[1]):
+            neighbor = face_face_connectivity[current, j]
+            if neighbor == _fill_value(face_face_connectivity.dtype):
+                continue
+            face_edges = _get_cartesian_face_edge_nodes(
+                neighbor,
+                face_node_connectivity,
+                n_nodes_per_face,
+                node_x,
+                node_y,
+                node_z,
+            )
+            if _face_contains_point(face_edges, p):
+                return neighbor
+
+            d2 = (
+                (p[0] - centers[neighbor, 0]) ** 2
+                + (p[1] - centers[neighbor, 1]) ** 2
+                + (p[2] - centers[neighbor, 2]) ** 2
+            )
+            if d2 < best_d2:
+                best = neighbor
+                best_d2 = d2
+
+        if best == INT_FILL_VALUE:
+            break
+        current = best
+
+    return INT_FILL_VALUE
+
+
+@njit(cache=True)
+def _locate_point(
+    p,
+    start,
+    face_face_connectivity,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """Locate a single point by walking from ``start`` (if it is a valid face),
+    falling back to the bounding-cap hierarchy when the walk fails."""
+    if 0 <= start < face_node_connectivity.shape[0]:
+        face = _walk_to_point(
+            p,
+            start,
+            face_face_connectivity,
+            centers,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
+        )
+        if face != INT_FILL_VALUE:
+            return face
+
+    hits = np.full(face_node_connectivity.shape[1], INT_FILL_VALUE, dtype=INT_DTYPE)
+    _bvh_query_point(
+        p,
+        hits,
+        order,
+        lower,
+        upper,
+        children,
+        ranges,
+        centers,
+        radii,
+        face_node_connectivity,
+        n_nodes_per_face,
+        node_x,
+        node_y,
+        node_z,
+    )
+    return hits[0]
+
+
+@njit(cache=True)
+def _walk_chain(
+    points,
+    start,
+    face_face_connectivity,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """Locate consecutive points, starting each walk from the face of the
+    previously located point."""
+    faces = np.full(points.shape[0], INT_FILL_VALUE, dtype=INT_DTYPE)
+    for i in range(points.shape[0]):
+        faces[i] = _locate_point(
+            points[i],
+            start,
+            face_face_connectivity,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
+        )
+        if faces[i] != INT_FILL_VALUE:
+            start = faces[i]
+    return faces
+
+
+@njit(cache=True, parallel=True)
+def _walk_from_hints(
+    points,
+    hints,
+    face_face_connectivity,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """Locate each point independently and in parallel, starting each walk from
+    its own hint."""
+    faces = np.full(points.shape[0], INT_FILL_VALUE, dtype=INT_DTYPE)
+    for i in prange(points.shape[0]):
+        faces[i] = _locate_point(
+            points[i],
+            hints[i],
+            face_face_connectivity,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
+        )
+    return faces
+
+
+def _walk_query(source_grid: Grid, points: ArrayLike, hint=None) -> np.ndarray:
+    """
+    Locate Cartesian point(s) by walking across ``face_face_connectivity``.
+
+    Parameters
+    ----------
+    source_grid : Grid
+        UXarray Grid object.
+    points : array_like, shape (n_points, 3)
+        Cartesian coordinates of the query points.
+    hint : int or array_like of shape (n_points,), optional
+        Face from which to start walking. A single face (or None) chains the
+        walks, starting each from the face of the previous point, while an array
+        gives the starting face of every point, which are then located in
+        parallel. Points without a valid start are located with the bounding-cap
+        hierarchy.
+
+    Returns
+    -------
+    np.ndarray, shape (n_points,)
+        Index of a face containing each point, or `INT_FILL_VALUE`.
+    """
+    pts = np.ascontiguousarray(np.atleast_2d(np.asarray(points, dtype=np.float64)))
+
+    order, lower, upper, children, ranges, centers, radii = source_grid._get_face_bvh()
+    args = (
+        source_grid.face_face_connectivity.values,
+        order,
+        lower,
+        upper,
+        children,
+        ranges,
+        centers,
+        radii,
+        source_grid.face_node_connectivity.values,
+        source_grid.n_nodes_per_face.values,
+        source_grid.node_x.values,
+        source_grid.node_y.values,
+        source_grid.node_z.values,
+    )
+
+    if hint is None or np.ndim(hint) == 0:
+        start = INT_FILL_VALUE if hint is None else int(hint)
+        return _walk_chain(pts, start, *args)
+
+    hints = np.asarray(hint, dtype=INT_DTYPE)
+    if hints.shape != (pts.shape[0],):
+        raise ValueError(
+            f"Expected one hint per point, got {hints.size} hints for "
+            f"{pts.shape[0]} points"
+        )
+    return _walk_from_hints(pts, hints, *args)
+
+
+# Angle, in radians, by which a path is advanced past a node or edge to find the
+# face that follows it
+_PATH_NUDGE = 1e-6
+
+
+@njit(cache=True)
+def _point_along_arc(a, b, angle):
+    """Returns the point at ``angle`` radians from ``a`` on the great-circle arc
+    from ``a`` towards ``b``."""
+    direction = b - np.dot(a, b) * a
+    direction = direction / np.linalg.norm(direction)
+    return np.cos(angle) * a + np.sin(angle) * direction
+
+
+@njit(cache=True)
+def _arc_crossing(a, b, normal, u, v):
+    """
+    Returns the angle from ``a`` at which the arc from ``a`` to ``b``, with
+    ``normal = a x b``, crosses the edge from ``u`` to ``v``, or -1 if it does not.
+
+    Unlike ``gca_gca_intersection``, which checks that the intersection lies on
+    both great circles to machine precision, the crossing is found from the side
+    of the arc's plane on which each end of the edge lies, so that arcs passing
+    close to a node are not missed.
+    """
+    su = np.dot(normal, u)
+    sv = np.dot(normal, v)
+    if su * sv > 0.0 or su == sv:
+        return -1.0
+
+    p = u + (v - u) * (su / (su - sv))
+    p = p / np.linalg.norm(p)
+    if (
+        np.dot(np.cross(a, p), normal) < -ERROR_TOLERANCE
+        or np.dot(np.cross(p, b), normal) < -ERROR_TOLERANCE
+    ):
+        return -1.0
+    return np.arctan2(np.linalg.norm(np.cross(a, p)), np.dot(a, p))
+
+
+@njit(cache=True)
+def _face_crossings(face_edges, a, b, normal, after, before, first):
+    """Returns the first (or last, if ``first`` is False) crossing of the arc with
+    the edges of a face within ``(after, before]``, and the crossed edge, or
+    ``(-1, -1)`` if there is none."""
+    best_t = -1.0
+    best_edge = -1
+    for e in range(face_edges.shape[0]):
+        t = _arc_crossing(a, b, normal, face_edges[e, 0], face_edges[e, 1])
+        if t <= after or t > before:
+            continue
+        if best_edge == -1 or (t < best_t if first else t > best_t):
+            best_t = t
+            best_edge = e
+    return best_t, best_edge
+
+
+@njit(cache=True)
+def _face_across_edge(face, edge, face_face_connectivity, face_node_connectivity, n):
+    """Returns the neighbor of ``face`` sharing its edge from node ``edge`` to node
+    ``edge + 1``, or ``INT_FILL_VALUE`` if it is not recorded."""
+    u = face_node_connectivity[face, edge]
+    v = face_node_connectivity[face, (edge + 1) % n]
+    for j in range(face_face_connectivity.shape[1]):
+        neighbor = face_face_connectivity[face, j]
+        if neighbor == _fill_value(face_face_connectivity.dtype):
+            continue
+        has_u = False
+        has_v = False
+        for k in range(face_node_connectivity.shape[1]):
+            node = face_node_connectivity[neighbor, k]
+            has_u |= node == u
+            has_v |= node == v
+        if has_u and has_v:
+            return neighbor
+    return INT_FILL_VALUE
+
+
+@njit(cache=True)
+def _step_along_arc(
+    a,
+    b,
+    t,
+    length,
+    face,
+    face_face_connectivity,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """Returns the face, other than ``face``, containing the point just past
+    ``t`` on the arc from ``a`` to ``b``, or ``INT_FILL_VALUE`` if the arc leaves
+    the grid there."""
+    nudge = _PATH_NUDGE
+    for _ in range(3):
+        if t + nudge > length:
+            break
+        found = _locate_point(
+            _point_along_arc(a, b, t + nudge),
+            face,
+            face_face_connectivity,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
+        )
+        if found != face:
+            return found
+        nudge *= 10.0
+    return INT_FILL_VALUE
+
+
+@njit(cache=True)
+def _enter_grid(
+    a,
+    b,
+    t,
+    length,
+    step,
+    include_start,
+    face_face_connectivity,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """
+    Find where the arc from ``a`` to ``b`` enters the grid after ``t``.
+
+    Points along the arc are located ``step`` radians apart until one lies on the
+    grid, and the walk then steps back across the faces before it to the first
+    face the arc enters.
+
+    Returns
+    -------
+    face, t : int, float
+        The first face entered and the angle from ``a`` at which it is entered,
+        or ``(INT_FILL_VALUE, length)`` if the rest of the arc is off the grid.
+    """
+    normal = np.cross(a, b)
+    face = INT_FILL_VALUE
+    t_sample = t if include_start else min(t + _PATH_NUDGE, length)
+    while True:
+        face = _locate_point(
+            _point_along_arc(a, b, t_sample) if length > 0.0 else a,
+            INT_FILL_VALUE,
+            face_face_connectivity,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
+        )
+        if face != INT_FILL_VALUE or t_sample >= length:
+            break
+        t_sample = min(t_sample + step, length)
+
+    if face == INT_FILL_VALUE:
+        return INT_FILL_VALUE, length
+    if include_start and t_sample == t:
+        return face, t
+
+    # step back to the first face after t
+    t_entry = t_sample
+    for _ in range(face_node_connectivity.shape[0]):
+        face_edges = _get_cartesian_face_edge_nodes(
+            face, face_node_connectivity, n_nodes_per_face, node_x, node_y, node_z
+        )
+        t_cross, _ = _face_crossings(face_edges, a, b, normal, t, t_entry, True)
+        if t_cross < 0.0:
+            break
+        t_entry = t_cross
+        if t_entry - _PATH_NUDGE <= t:
+            break
+        previous = _locate_point(
+            _point_along_arc(a, b, t_entry - _PATH_NUDGE),
+            face,
+            face_face_connectivity,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+            face_node_connectivity,
+            n_nodes_per_face,
+            node_x,
+            node_y,
+            node_z,
+        )
+        if previous == INT_FILL_VALUE or previous == face:
+            break
+        face = previous
+
+    return face, t_entry
+
+
+@njit(cache=True)
+def _walk_path(
+    points,
+    step,
+    face_face_connectivity,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+    face_node_connectivity,
+    n_nodes_per_face,
+    node_x,
+    node_y,
+    node_z,
+):
+    """
+    Walk along the great-circle arcs joining consecutive points, crossing from
+    each face to the neighbor that shares the edge through which the path exits.
+    Parts of the path off the grid are searched for the point where it re-enters
+    the grid, at intervals of ``step`` radians.
+
+    Returns
+    -------
+    faces, entry, exit : np.ndarray
+        The faces crossed in order, and the distances along the path at which the
+        path enters and exits each of them.
+    """
+    capacity = 16
+    faces = np.empty(capacity, dtype=INT_DTYPE)
+    entry = np.empty(capacity, dtype=np.float64)
+    exit = np.empty(capacity, dtype=np.float64)
+    count = 0
+
+    args = (
+        face_face_connectivity,
+        order,
+        lower,
+        upper,
+        children,
+        ranges,
+        centers,
+        radii,
+        face_node_connectivity,
+        n_nodes_per_face,
+        node_x,
+        node_y,
+        node_z,
+    )
+
+    face = INT_FILL_VALUE
+    distance = 0.0
+    for s in range(max(points.shape[0] - 1, 1)):
+        a = points[s]
+        b = points[s + 1] if points.shape[0] > 1 else a
+        length = np.arctan2(np.linalg.norm(np.cross(a, b)), np.dot(a, b))
+        normal = np.cross(a, b)
+
+        t = 0.0
+        include_start = True
+        for _ in range(face_node_connectivity.shape[0]):
+            if face == INT_FILL_VALUE:
+                face, t = _enter_grid(a, b, t, length, step, include_start, *args)
+                if face == INT_FILL_VALUE:
+                    break
+            include_start = False
+
+            # open a record, unless the path stays in the face it was last in
+            if (
+                count == 0
+                or faces[count - 1] != face
+                or exit[count - 1] < distance + t - ERROR_TOLERANCE
+            ):
+                if count == capacity:
+                    capacity *= 2
+                    faces = np.concatenate((faces, np.empty_like(faces)))
+                    entry = np.concatenate((entry, np.empty_like(entry)))
+                    exit = np.concatenate((exit, np.empty_like(exit)))
+                faces[count] = face
+                entry[count] = distance + t
+                count += 1
+            exit[count - 1] = distance + t
+
+            # the path exits through the furthest crossing with the face edges
+            n = n_nodes_per_face[face]
+            face_edges = _get_cartesian_face_edge_nodes(
+                face, face_node_connectivity, n_nodes_per_face, node_x, node_y, node_z
+            )
+            t_exit = -1.0
+            exit_edge = -1
+            if length > 0.0:
+                t_exit, exit_edge = _face_crossings(
+                    face_edges, a, b, normal, t + ERROR_TOLERANCE, length, False
+                )
+
+            if exit_edge == -1:
+                if length == 0.0 or _face_contains_point(face_edges, b):
+                    exit[count - 1] = distance + length
+                    break
+
+                # the path leaves through a node or along an edge, so step past it
+                face = _step_along_arc(a, b, t, length, face, *args)
+                continue
+
+            exit[count - 1] = distance + t_exit
+            t = t_exit
+            neighbor = _face_across_edge(
+                face, exit_edge, face_face_connectivity, face_node_connectivity, n
+            )
+            if neighbor == INT_FILL_VALUE:
+                # the neighbor is not recorded, or the path leaves the grid
+                neighbor = _step_along_arc(a, b, t, length, face, *args)
+            face = neighbor
+
+        distance += length
+
+    return faces[:count].copy(), entry[:count].copy(), exit[:count].copy()
+
+
+def _path_query(source_grid: Grid, points: ArrayLike):
+    """
+    Find the faces crossed by the great-circle arcs joining consecutive points.
+
+    Parameters
+    ----------
+    source_grid : Grid
+        UXarray Grid object.
+    points : array_like, shape (n_points, 3)
+        Cartesian coordinates of the vertices of the path.
+
+    Returns
+    -------
+    faces : np.ndarray
+        Indices of the faces crossed by the path, in order.
+    entry_distance, exit_distance : np.ndarray
+        Distances along the path, in radians, at which it enters and exits each face.
+    """
+    pts = np.atleast_2d(np.asarray(points, dtype=np.float64))
+    pts = np.ascontiguousarray(pts / np.linalg.norm(pts, axis=-1, keepdims=True))
+    if pts.shape[0] == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return np.empty(0, dtype=INT_DTYPE), empty, empty.copy()
+
+    order, lower, upper, children, ranges, centers, radii = source_grid._get_face_bvh()
+    # off-grid parts of the path are searched at about half the size of a face
+    step = 0.5 * float(np.median(radii))
+    return _walk_path(
         pts,
-        flat_cands,
-        offs,
+        step,
+        source_grid.face_face_connectivity.values,
+        order,
+        lower,
+        upper,
+        children,
+        ranges,
+        centers,
+        radii,
         source_grid.face_node_connectivity.values,
         source_grid.n_nodes_per_face.values,
         source_grid.node_x.values,
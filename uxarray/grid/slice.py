@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING, List, Set, Union
 import numpy as np
 import xarray as xr
 
-from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
+from uxarray.constants import INT_DTYPE
+from uxarray.options import _as_index_array, _fill_value, _index_dtype
 
 if TYPE_CHECKING:
     pass
@@ -35,8 +36,9 @@ def _slice_node_indices(
         raise ValueError("Exclusive slicing is not yet supported.")
 
     # faces that saddle nodes given in 'indices'
-    face_indices = np.unique(grid.node_face_connectivity.values[indices].ravel())
-    face_indices = face_indices[face_indices != INT_FILL_VALUE]
+    face_indices = _unique_indices(
+        grid.node_face_connectivity.values[indices], grid.n_face
+    )
 
     return _slice_face_indices(grid, face_indices)
 
@@ -65,8 +67,9 @@ def _slice_edge_indices(
         raise ValueError("Exclusive slicing is not yet supported.")
 
     # faces that saddle nodes given in 'indices'
-    face_indices = np.unique(grid.edge_face_connectivity.values[indices].ravel())
-    face_indices = face_indices[face_indices != INT_FILL_VALUE]
+    face_indices = _unique_indices(
+        grid.edge_face_connectivity.values[indices], grid.n_face
+    )
 
     return _slice_face_indices(grid, face_indices)
 
@@ -103,8 +106,9 @@ def _slice_face_indices(
     face_indices = np.atleast_1d(np.asarray(indices, dtype=INT_DTYPE))
 
     # nodes of each face (inclusive)
-    node_indices = np.unique(grid.face_node_connectivity.values[face_indices].ravel())
-    node_indices = node_indices[node_indices != INT_FILL_VALUE]
+    node_indices = _unique_indices(
+        grid.face_node_connectivity.values[face_indices], grid.n_node
+    )
 
     # Index Node and Face variables
     ds = ds.isel(n_node=node_indices)
@@ -112,51 +116,35 @@ def _slice_face_indices(
 
     # Only slice edge dimension if we have the face edge connectivity
     if "face_edge_connectivity" in ds:
-        edge_indices = np.unique(
-            grid.face_edge_connectivity.values[face_indices].ravel()
+        edge_indices = _unique_indices(
+            grid.face_edge_connectivity.values[face_indices], grid.n_edge
         )
-        edge_indices = edge_indices[edge_indices != INT_FILL_VALUE]
         ds = ds.isel(n_edge=edge_indices)
-        ds["subgrid_edge_indices"] = xr.DataArray(edge_indices, dims=["n_edge"])
+        ds["subgrid_edge_indices"] = xr.DataArray(
+            _as_index_array(edge_indices, grid.n_edge), dims=["n_edge"]
+        )
     # Otherwise, drop any edge variables
     else:
         if "n_edge" in ds.dims:
             ds = ds.drop_dims(["n_edge"])
         edge_indices = None
 
-    ds["subgrid_node_indices"] = xr.DataArray(node_indices, dims=["n_node"])
-    ds["subgrid_face_indices"] = xr.DataArray(face_indices, dims=["n_face"])
-
-    # Construct updated Node Index Map
-    node_indices_dict = {orig: new for new, orig in enumerate(node_indices)}
-    node_indices_dict[INT_FILL_VALUE] = INT_FILL_VALUE
-
-    # Construct updated Edge Index Map
-    if edge_indices is not None:
-        edge_indices_dict = {orig: new for new, orig in enumerate(edge_indices)}
-        edge_indices_dict[INT_FILL_VALUE] = INT_FILL_VALUE
-    else:
-        edge_indices_dict = None
-
-    def map_node_indices(i):
-        return node_indices_dict.get(i, INT_FILL_VALUE)
-
-    if edge_indices is not None:
-
-        def map_edge_indices(i):
-            return edge_indices_dict.get(i, INT_FILL_VALUE)
-    else:
-        map_edge_indices = None
+    ds["subgrid_node_indices"] = xr.DataArray(
+        _as_index_array(node_indices, grid.n_node), dims=["n_node"]
+    )
+    ds["subgrid_face_indices"] = xr.DataArray(
+        _as_index_array(face_indices, grid.n_face), dims=["n_face"]
+    )
 
     for conn_name in list(ds.data_vars):
         if conn_name.endswith("_node_connectivity"):
-            map_fn = map_node_indices
+            kept_indices, n_elements = node_indices, grid.n_node
 
         elif conn_name.endswith("_edge_connectivity"):
-            if edge_indices_dict is None:
+            if edge_indices is None:
                 ds = ds.drop_vars(conn_name)
                 continue
-            map_fn = map_edge_indices
+            kept_indices, n_elements = edge_indices, grid.n_edge
 
         elif "_connectivity" in conn_name:
             # anything else we can't remap
@@ -168,25 +156,27 @@ def _slice_face_indices(
             continue
 
         # Apply Remapping
-        ds[conn_name] = xr.DataArray(
-            np.vectorize(map_fn, otypes=[INT_DTYPE])(ds[conn_name].values),
-            dims=ds[conn_name].dims,
-            attrs=ds[conn_name].attrs,
-        )
+        remapped = _remap_indices(ds[conn_name].values, kept_indices, n_elements)
+        attrs = dict(ds[conn_name].attrs)
+        if "_FillValue" in attrs:
+            attrs["_FillValue"] = _fill_value(remapped.dtype)
+        ds[conn_name] = xr.DataArray(remapped, dims=ds[conn_name].dims, attrs=attrs)
+
+    ds = _slice_derived_variables(grid, ds, face_indices, edge_indices)
 
     if inverse_indices:
         inverse_indices_ds = xr.Dataset()
 
         index_types = {
-            "face": face_indices,
-            "node": node_indices,
+            "face": ds["subgrid_face_indices"].values,
+            "node": ds["subgrid_node_indices"].values,
         }
 
         if edge_indices is not None:
-            index_types["edge"] = edge_indices
+            index_types["edge"] = ds["subgrid_edge_indices"].values
 
         if isinstance(inverse_indices, bool):
-            inverse_indices_ds["face"] = face_indices
+            inverse_indices_ds["face"] = index_types["face"]
         else:
             for index_type in inverse_indices[0]:
                 if index_type in index_types:
@@ -197,11 +187,91 @@ def _slice_face_indices(
                         "instead: 'face', 'edge', 'node'"
                     )
 
-        return Grid.from_dataset(
-            ds,
-            source_grid_spec=grid.source_grid_spec,
-            is_subset=True,
-            inverse_indices=inverse_indices_ds,
+    else:
+        inverse_indices_ds = None
+
+    subgrid = Grid.from_dataset(
+        ds,
+        source_grid_spec=grid.source_grid_spec,
+        is_subset=True,
+        inverse_indices=inverse_indices_ds,
+    )
+
+    # carry over derived quantities that are cached outside of the dataset
+    if grid._face_jacobian is not None:
+        subgrid._face_jacobian = grid._face_jacobian[face_indices]
+    if grid._antimeridian_face_indices is not None:
+        is_antimeridian = np.zeros(grid.n_face, dtype=bool)
+        is_antimeridian[grid._antimeridian_face_indices] = True
+        subgrid._antimeridian_face_indices = np.flatnonzero(
+            is_antimeridian[face_indices]
         )
 
-    return Grid.from_dataset(ds, source_grid_spec=grid.source_grid_spec, is_subset=True)
+    return subgrid
+
+
+# variables that describe the whole grid and are not valid for a subset
+_WHOLE_GRID_VARIABLES = [
+    "max_face_radius",
+    "boundary_node_indices",
+    "boundary_edge_indices",
+    "boundary_face_indices",
+]
+
+
+def _slice_derived_variables(grid, ds, face_indices, edge_indices):
+    """Fixes up derived variables that were sliced along with the grid, so that
+    they can be reused by the subset instead of being recomputed.
+
+    Per-element quantities, such as ``face_areas``, ``bounds`` or ``face_x``,
+    are already valid once sliced. ``edge_face_distances`` is only valid for
+    edges that are still saddled by two faces. Reductions over the whole grid,
+    such as ``max_face_radius``, and index variables that refer to elements of
+    the whole grid, such as ``boundary_edge_indices``, are dropped and
+    recomputed on use.
+    """
+    ds = ds.drop_vars(_WHOLE_GRID_VARIABLES, errors="ignore")
+
+    if "edge_face_distances" in ds:
+        if "edge_face_connectivity" in grid._ds:
+            is_kept = np.zeros(grid.n_face, dtype=bool)
+            is_kept[face_indices] = True
+
+            edge_faces = grid._ds["edge_face_connectivity"].values[edge_indices]
+            saddled = np.all(edge_faces != _fill_value(edge_faces.dtype), axis=1)
+            saddled[saddled] = np.all(is_kept[edge_faces[saddled]], axis=1)
+
+            # edges on the boundary of the subset only border a single face
+            ds["edge_face_distances"] = ds["edge_face_distances"].where(
+                xr.DataArray(saddled, dims=["n_edge"]), 0.0
+            )
+        else:
+            ds = ds.drop_vars("edge_face_distances")
+
+    return ds
+
+
+def _unique_indices(connectivity, n_elements):
+    """Returns the sorted unique indices, excluding fill values, stored in a
+    connectivity array whose values index ``n_elements`` elements."""
+    values = connectivity.ravel()
+    is_kept = np.zeros(n_elements, dtype=bool)
+    is_kept[values[values != _fill_value(values.dtype)]] = True
+    return np.flatnonzero(is_kept)
+
+
+def _remap_indices(connectivity, kept_indices, n_elements):
+    """Renumbers a connectivity array after slicing, mapping each original index
+    to its position in ``kept_indices`` and any index that was not kept to the
+    fill value. The result has the type returned by ``_index_dtype`` for the
+    number of kept elements."""
+    dtype = _index_dtype(kept_indices.size)
+    fill_value = _fill_value(np.dtype(dtype))
+
+    lookup = np.full(n_elements, fill_value, dtype=dtype)
+    lookup[kept_indices] = np.arange(kept_indices.size, dtype=dtype)
+
+    remapped = np.full(connectivity.shape, fill_value, dtype=dtype)
+    valid = connectivity != _fill_value(connectivity.dtype)
+    remapped[valid] = lookup[connectivity[valid]]
+    return remapped
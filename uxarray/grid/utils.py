@@ -3,6 +3,7 @@ import xarray as xr
 from numba import njit
 
 from uxarray.constants import INT_FILL_VALUE
+from uxarray.options import _fill_value
 
 
 @njit(cache=True)
@@ -92,7 +93,7 @@ def _swap_first_fill_value_with_last(arr):
     np.ndarray: The modified array with the swaps made.
     """
     # Find the indices of the first INT_FILL_VALUE in each sub-array
-    mask = arr == INT_FILL_VALUE
+    mask = arr == _fill_value(arr.dtype)
     reshaped_mask = mask.reshape(arr.shape[0], -1)
     first_true_indices = np.argmax(reshaped_mask, axis=1)
 
@@ -242,7 +243,7 @@ def _get_cartesian_face_edge_nodes_array(
     # Get the indices of the nodes from face_edge_conn
     face_edge_conn_flat = face_edge_conn.reshape(-1)
 
-    valid_mask = face_edge_conn_flat != INT_FILL_VALUE
+    valid_mask = face_edge_conn_flat != _fill_value(face_edge_conn_flat.dtype)
 
     # Get the valid node indices
     valid_edges = face_edge_conn_flat[valid_mask]
@@ -306,7 +307,7 @@ def _get_lonlat_rad_face_edge_nodes_array(
     # Get the indices of the nodes from face_edge_conn
     face_edge_conn_flat = face_edge_conn.reshape(-1)
 
-    valid_mask = face_edge_conn_flat != INT_FILL_VALUE
+    valid_mask = face_edge_conn_flat != _fill_value(face_edge_conn_flat.dtype)
 
     # Get the valid node indices
     valid_edges = face_edge_conn_flat[valid_mask]
@@ -441,5 +442,66 @@ def make_setter(key: str):
         if not isinstance(value, xr.DataArray):
             raise ValueError(f"{key} must be an xr.DataArray")
         self._ds[key] = value
+        if key.endswith("_connectivity"):
+            # ragged connectivity may have been derived from the replaced variable
+            self._connectivity_csr.clear()
+        if key in _FINGERPRINT_VARIABLES:
+            self._fingerprint = None
+        if key in _GEOMETRY_VARIABLES:
+            self._dual = None
+            self._face_bvh = None
+        if key in _GEOMETRY_VARIABLES or key == "bounds":
+            # the face bounds and their interval index follow the replaced geometry
+            derived = ["face_bounds_lon", "face_bounds_lat"]
+            if key != "bounds":
+                derived.append("bounds")
+            self._ds = self._ds.drop_vars(derived, errors="ignore")
+            self._face_bounds_index = None
 
     return setter
+
+
+_FINGERPRINT_VARIABLES = ("node_lon", "node_lat", "face_node_connectivity")
+
+# Variables the cached dual mesh and face search structures are built from
+_GEOMETRY_VARIABLES = (
+    "node_lon",
+    "node_lat",
+    "node_x",
+    "node_y",
+    "node_z",
+    "face_lon",
+    "face_lat",
+    "face_x",
+    "face_y",
+    "face_z",
+    "face_node_connectivity",
+)
+
+
+def _grid_fingerprint(grid) -> str:
+    """Return a hex digest that identifies a grid by its node coordinates and
+    face-node connectivity.
+
+    Two grids with identical node locations and topology produce the same
+    fingerprint, regardless of the file format or process they were loaded in.
+    The digest is computed once and cached on the grid, and is cleared when
+    one of the hashed variables is replaced through its setter.
+    """
+    if grid._fingerprint is None:
+        grid._fingerprint = _compute_grid_fingerprint(grid)
+    return grid._fingerprint
+
+
+def _compute_grid_fingerprint(grid) -> str:
+    """Hashes the node coordinates and face-node connectivity of a grid."""
+    import hashlib
+
+    digest = hashlib.sha1()
+    digest.update(np.asarray([grid.n_node, grid.n_face], dtype=np.int64).tobytes())
+    for var in ("node_lon", "node_lat"):
+        digest.update(np.ascontiguousarray(grid._ds[var].values, np.float64).tobytes())
+    digest.update(
+        np.ascontiguousarray(grid.face_node_connectivity.values, np.int64).tobytes()
+    )
+    return digest.hexdigest()
@@ -5,6 +5,7 @@ import xarray as xr
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
 from uxarray.conventions import ugrid
 from uxarray.grid.connectivity import _replace_fill_values
+from uxarray.options import _fill_value
 
 
 def _to_ugrid(in_ds, out_ds):
@@ -172,10 +173,10 @@ def _encode_scrip(face_node_connectivity, node_lon, node_lat, face_areas):
 
     # --- Core logic enhanced with Implementation 2's robust method ---
     # Flatten the connectivity array to easily work with all node indices
-    f_nodes_flat = face_node_connectivity.values.astype(int).ravel()
+    f_nodes_flat = face_node_connectivity.values.ravel()
 
     # Create a mask to identify valid nodes vs. fill values
-    valid_nodes_mask = f_nodes_flat != INT_FILL_VALUE
+    valid_nodes_mask = f_nodes_flat != _fill_value(f_nodes_flat.dtype)
 
     # Create arrays to hold final lat/lon data, filled with NaN
     lat_nodes_flat = np.full(f_nodes_flat.shape, np.nan, dtype=np.float64)
@@ -0,0 +1,89 @@
+import numpy as np
+from numba import njit
+
+from uxarray.constants import INT_DTYPE
+
+OPTIONS = {
+    "compact_indices": False,
+}
+
+_VALIDATORS = {
+    "compact_indices": lambda value: isinstance(value, bool),
+}
+
+
+class set_options:
+    """Set options for UXarray, either globally or within a context manager.
+
+    Parameters
+    ----------
+    compact_indices : bool, default=False
+        Store connectivity and other index arrays as ``int32`` instead of
+        :py:data:`~uxarray.INT_DTYPE` when the number of elements allows it,
+        which roughly halves the memory of a grid. This applies to the
+        connectivity variables of grids read or constructed while the option
+        is set, to the variables built from them (e.g.
+        :py:attr:`~uxarray.Grid.face_edge_connectivity`), to subsets, and to
+        :py:meth:`~uxarray.Grid.connectivity_csr`. Padded ``int32``
+        connectivity uses ``np.iinfo(np.int32).min`` as its fill value in
+        place of :py:data:`~uxarray.INT_FILL_VALUE`.
+
+    Examples
+    --------
+    Set an option globally
+
+    >>> ux.set_options(compact_indices=True)
+
+    Or only within a block
+
+    >>> with ux.set_options(compact_indices=True):
+    ...     offsets, faces = uxgrid.connectivity_csr("node_face")
+    """
+
+    def __init__(self, **kwargs):
+        self.old = {}
+        for key, value in kwargs.items():
+            if key not in OPTIONS:
+                raise ValueError(
+                    f"Invalid option: {key!r}. Expected one of {list(OPTIONS)}"
+                )
+            if not _VALIDATORS[key](value):
+                raise ValueError(f"Invalid value for option {key!r}: {value!r}")
+            self.old[key] = OPTIONS[key]
+        OPTIONS.update(kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        OPTIONS.update(self.old)
+
+
+def _index_dtype(max_value):
+    """Returns the integer type used to store indices no larger than
+    ``max_value``, which is ``int32`` when ``compact_indices`` is set and the
+    values fit, and ``INT_DTYPE`` otherwise."""
+    if OPTIONS["compact_indices"] and max_value <= np.iinfo(np.int32).max:
+        return np.int32
+    return INT_DTYPE
+
+
+@njit(cache=True)
+def _fill_value(dtype):
+    """Returns the fill value of a padded index array of type ``dtype``, which
+    is the smallest value of the type (``INT_FILL_VALUE`` for ``INT_DTYPE``)."""
+    return np.iinfo(dtype).min
+
+
+def _as_index_array(values, n_elements):
+    """Casts an index array, whose values are smaller than ``n_elements``, to
+    the type returned by ``_index_dtype``, converting any fill values to the
+    fill value of that type."""
+    values = np.asarray(values)
+    dtype = np.dtype(_index_dtype(n_elements))
+    if values.dtype == dtype:
+        return values
+    fill = values == _fill_value(values.dtype)
+    values = values.astype(dtype)
+    values[fill] = _fill_value(dtype)
+    return values
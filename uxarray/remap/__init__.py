@@ -1,7 +1,11 @@
 from .inverse_distance_weighted import _inverse_distance_weighted_remap
 from .nearest_neighbor import _nearest_neighbor_remap
+from .structured import remap_structured
+from .weights import RemapWeights
 
 __all__ = (
     "_nearest_neighbor_remap",
     "_inverse_distance_weighted_remap",
+    "RemapWeights",
+    "remap_structured",
 )
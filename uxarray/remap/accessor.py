@@ -3,12 +3,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import xarray as xr
+
     from uxarray.core.dataarray import UxDataArray
     from uxarray.core.dataset import UxDataset
     from uxarray.grid.grid import Grid
+    from uxarray.remap.weights import RemapWeights
 
 from uxarray.remap.bilinear import _bilinear
+from uxarray.remap.conservative import _conservative_remap
 from uxarray.remap.inverse_distance_weighted import _inverse_distance_weighted_remap
+from uxarray.remap.latlon import _to_latlon
 from uxarray.remap.nearest_neighbor import _nearest_neighbor_remap
 
 
@@ -23,8 +28,12 @@ class RemapAccessor:
         return (
             prefix
             + "Supported methods:\n"
-            + "  • nearest_neighbor(destination_grid, remap_to='faces')\n"
-            + "  • inverse_distance_weighted(destination_grid, remap_to='faces', power=2, k=8)\n"
+            + "  • nearest_neighbor(destination_grid, remap_to='faces', chunk_size=None, max_memory=None)\n"
+            + "  • inverse_distance_weighted(destination_grid, remap_to='faces', power=2, k=8, chunk_size=None, max_memory=None)\n"
+            + "  • bilinear(destination_grid, remap_to='faces')\n"
+            + "  • conservative(destination_grid)\n"
+            + "  • apply_weights(weights, destination_grid=None)\n"
+            + "  • to_latlon(lon, lat, method='nearest_neighbor')\n"
         )
 
     def __call__(self, *args, **kwargs) -> UxDataArray | UxDataset:
@@ -37,7 +46,13 @@ class RemapAccessor:
         return self.nearest_neighbor(*args, **kwargs)
 
     def nearest_neighbor(
-        self, destination_grid: Grid, remap_to: str = "faces", **kwargs
+        self,
+        destination_grid: Grid,
+        remap_to: str = "faces",
+        chunk_size: int | None = None,
+        max_memory: int | str | None = None,
+        dtype=None,
+        **kwargs,
     ) -> UxDataArray | UxDataset:
         """
         Perform nearest-neighbor remapping.
@@ -50,6 +65,18 @@ class RemapAccessor:
             The UXarray grid to which data will be interpolated.
         remap_to : {'nodes', 'edges', 'faces'}, default='faces'
             Which grid element receives the remapped values.
+        chunk_size : int, optional
+            If provided, destination points are queried and remapped in blocks of
+            this many points, one block at a time.
+        max_memory : int or str, optional
+            Memory budget for the remapping work arrays, in bytes or as a string
+            such as ``"2GB"``. If provided, the block size is chosen so that each
+            block stays within this budget, regardless of the size of the
+            destination grid.
+        dtype : str or np.dtype, optional
+            Accepted for consistency with the other remapping methods.
+            Nearest-neighbor remapping has no weights, so remapped values always
+            keep the dtype of the source data.
 
         Returns
         -------
@@ -57,10 +84,20 @@ class RemapAccessor:
             A new object with data mapped onto `destination_grid`.
         """
 
-        return _nearest_neighbor_remap(self.ux_obj, destination_grid, remap_to)
+        return _nearest_neighbor_remap(
+            self.ux_obj, destination_grid, remap_to, chunk_size, max_memory
+        )
 
     def inverse_distance_weighted(
-        self, destination_grid: Grid, remap_to: str = "faces", power=2, k=8, **kwargs
+        self,
+        destination_grid: Grid,
+        remap_to: str = "faces",
+        power=2,
+        k=8,
+        chunk_size: int | None = None,
+        max_memory: int | str | None = None,
+        dtype=None,
+        **kwargs,
     ) -> UxDataArray | UxDataset:
         """
         Perform inverse-distance-weighted (IDW) remapping.
@@ -79,6 +116,19 @@ class RemapAccessor:
             interpolation more local.
         k : int, default=8
             Number of nearest source points to include in the weighted average.
+        chunk_size : int, optional
+            If provided, destination points are queried and remapped in blocks of
+            this many points, one block at a time.
+        max_memory : int or str, optional
+            Memory budget for the remapping work arrays, in bytes or as a string
+            such as ``"2GB"``. If provided, the block size is chosen so that each
+            block stays within this budget, regardless of the size of the
+            destination grid.
+        dtype : str or np.dtype, optional
+            Floating point type of the remapping weights. Defaults to
+            ``float64``. The tree queries always use ``float64`` coordinates. With
+            ``float32``, ``float32`` data stays in ``float32`` end to end, halving
+            the memory traffic of the weighted reduction.
 
         Returns
         -------
@@ -87,11 +137,18 @@ class RemapAccessor:
         """
 
         return _inverse_distance_weighted_remap(
-            self.ux_obj, destination_grid, remap_to, power, k
+            self.ux_obj,
+            destination_grid,
+            remap_to,
+            power,
+            k,
+            chunk_size,
+            max_memory,
+            dtype,
         )
 
     def bilinear(
-        self, destination_grid: Grid, remap_to: str = "faces", **kwargs
+        self, destination_grid: Grid, remap_to: str = "faces", dtype=None, **kwargs
     ) -> UxDataArray | UxDataset:
         """
         Perform bilinear remapping.
@@ -102,6 +159,10 @@ class RemapAccessor:
             Destination Grid for remapping
         remap_to : {'nodes', 'edges', 'faces'}, default='faces'
             Which grid element receives the remapped values.
+        dtype : str or np.dtype, optional
+            Floating point type of the remapping weights. Defaults to ``float64``.
+            With ``float32``, ``float32`` data stays in ``float32`` end to end,
+            halving the memory traffic of the sparse product.
 
         Returns
         -------
@@ -109,4 +170,89 @@ class RemapAccessor:
             A new object with data mapped onto `destination_grid`.
         """
 
-        return _bilinear(self.ux_obj, destination_grid, remap_to)
+        return _bilinear(self.ux_obj, destination_grid, remap_to, dtype)
+
+    def conservative(
+        self, destination_grid: Grid, remap_to: str = "faces", dtype=None, **kwargs
+    ) -> UxDataArray | UxDataset:
+        """
+        Perform first-order conservative remapping.
+
+        Each destination face takes the area-weighted average of the source faces
+        it overlaps, which preserves area integrals of the remapped field. The
+        weights are cached on `destination_grid`, so repeated remaps from the same
+        source grid only pay for the overlap computation once.
+
+        Parameters
+        ----------
+        destination_grid : Grid
+            The UXarray grid to which data will be remapped.
+        remap_to : {'faces'}, default='faces'
+            Which grid element receives the remapped values. Only faces are supported.
+        dtype : str or np.dtype, optional
+            Floating point type of the remapping weights. Defaults to ``float64``.
+            With ``float32``, ``float32`` data stays in ``float32`` end to end,
+            halving the memory traffic of the sparse product.
+
+        Returns
+        -------
+        UxDataArray or UxDataset
+            A new object with data mapped onto `destination_grid`.
+        """
+
+        return _conservative_remap(self.ux_obj, destination_grid, remap_to, dtype)
+
+    def apply_weights(
+        self, weights: RemapWeights, destination_grid: Grid | None = None
+    ) -> UxDataArray | UxDataset:
+        """
+        Remap using precomputed weights.
+
+        Parameters
+        ----------
+        weights : RemapWeights
+            Weights computed with one of the ``RemapWeights`` constructors or
+            read with ``RemapWeights.from_file``.
+        destination_grid : Grid, optional
+            Destination grid to attach to the result. Required if the weights were
+            loaded from a file.
+
+        Returns
+        -------
+        UxDataArray or UxDataset
+            A new object with data mapped onto the destination grid.
+        """
+
+        return weights.apply(self.ux_obj, destination_grid)
+
+    def to_latlon(
+        self, lon, lat, method: str = "nearest_neighbor", power=2, k=8, **kwargs
+    ) -> xr.DataArray | xr.Dataset:
+        """
+        Remap onto a regular latitude-longitude grid.
+
+        Unlike remapping onto a ``Grid`` built with ``Grid.from_structured``, the
+        destination is described only by its coordinates: the destination points
+        are built from ``lon`` and ``lat`` and queried against the source in a
+        single batch, and no destination connectivity is constructed.
+
+        Parameters
+        ----------
+        lon : array_like
+            1D longitudes of the destination grid, in degrees.
+        lat : array_like
+            1D latitudes of the destination grid, in degrees.
+        method : {'nearest_neighbor', 'inverse_distance_weighted', 'bilinear'}, default='nearest_neighbor'
+            Remapping method. Bilinear remapping requires face-centered data.
+        power : int, default=2
+            Exponent used by inverse-distance weighting.
+        k : int, default=8
+            Number of nearest source points used by inverse-distance weighting.
+
+        Returns
+        -------
+        xr.DataArray or xr.Dataset
+            A plain xarray object on ``(lat, lon)``.
+        """
+
+        return _to_latlon(self.ux_obj, lon, lat, method, power, k)
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-import xarray as xr
 from numba import njit, prange
 
 if TYPE_CHECKING:
@@ -13,15 +12,11 @@ if TYPE_CHECKING:
 from uxarray.constants import ERROR_TOLERANCE
 from uxarray.grid import Grid
 from uxarray.grid.geometry import barycentric_coordinates_cartesian
+from uxarray.grid.point_in_face import _point_in_face_query
 
 from .utils import (
-    KDTREE_DIM_MAP,
-    LABEL_TO_COORD,
-    SPATIAL_DIMS,
     _assert_dimension,
-    _construct_remapped_ds,
     _get_remap_dims,
-    _prepare_points,
     _to_dataset,
 )
 
@@ -30,6 +25,7 @@ def _bilinear(
     source: UxDataArray | UxDataset,
     destination_grid: Grid,
     destination_dim: str = "n_face",
+    dtype=None,
 ) -> np.ndarray:
     """Bilinear Remapping between two grids, mapping data that resides on the
     corner nodes, edge centers, or face centers on the source grid to the
@@ -41,6 +37,8 @@ def _bilinear(
         Source UxDataArray
     remap_to : str, default="nodes"
         Location of where to map data, either "nodes", "edge centers", or "face centers"
+    dtype : np.dtype, optional
+        Floating point type of the weights. Defaults to ``float64``.
 
     Returns
     -------
@@ -48,65 +46,22 @@ def _bilinear(
         Data mapped to destination grid
     """
 
-    # ensure array is a np.ndarray
-    _assert_dimension(destination_dim)
-
-    # Ensure the destination grid is normalized
-    destination_grid.normalize_cartesian_coordinates()
-
-    # Perform remapping on a UxDataset
-    ds, is_da, name = _to_dataset(source)
-
-    # Determine which spatial dimensions we need to remap
-    dims_to_remap = _get_remap_dims(ds)
+    from .weights import RemapWeights
 
-    for src_dim in dims_to_remap:
-        if src_dim != "n_face":
-            raise ValueError(
-                "Bilinear remapping is not supported for non-face centered variables"
-            )
-
-        # Construct dual for searching
-        dual = source.uxgrid.get_dual()
-
-        # get destination coordinate pairs
-        point_xyz = _prepare_points(destination_grid, destination_dim)
+    _assert_dimension(destination_dim)
 
-        weights, indices = _barycentric_weights(
-            point_xyz=point_xyz,
-            dual=dual,
-            data_size=getattr(destination_grid, f"n_{KDTREE_DIM_MAP[destination_dim]}"),
-            source_grid=ds.uxgrid,
+    ds, _, _ = _to_dataset(source)
+    if _get_remap_dims(ds) - {"n_face"}:
+        raise ValueError(
+            "Bilinear remapping is not supported for non-face centered variables"
         )
 
-    remapped_vars = {}
-    for name, da in ds.data_vars.items():
-        spatial = set(da.dims) & SPATIAL_DIMS
-        if spatial:
-            source_dim = spatial.pop()
-            inds, w = indices, weights
-
-            # pack indices & weights into tiny DataArrays:
-            indexer = xr.DataArray(inds, dims=[LABEL_TO_COORD[destination_dim], "k"])
-            weight_da = xr.DataArray(w, dims=[LABEL_TO_COORD[destination_dim], "k"])
-
-            # gather the k neighbor values:
-            da_k = da.isel({source_dim: indexer}, ignore_grid=True)
-
-            # weighted sum over the small "k" axis:
-            da_idw = (da_k * weight_da).sum(dim="k")
-
-            # attach the new grid
-            da_idw.uxgrid = destination_grid
-            remapped_vars[name] = da_idw
-        else:
-            remapped_vars[name] = da
-
-    ds_remapped = _construct_remapped_ds(
-        source, remapped_vars, destination_grid, destination_dim
+    # weights (and the dual used to compute them) are cached, so repeated
+    # remaps between the same pair of grids only pay for the sparse product
+    weights = RemapWeights.bilinear(
+        source.uxgrid, destination_grid, destination_dim, dtype=dtype
     )
-
-    return ds_remapped[name] if is_da else ds_remapped
+    return weights.apply(source, destination_grid)
 
 
 def _barycentric_weights(point_xyz, dual, data_size, source_grid):
@@ -117,15 +72,14 @@ def _barycentric_weights(point_xyz, dual, data_size, source_grid):
     # Query dual grid
     face_indices, hits = dual.get_faces_containing_point(points=point_xyz)
 
-    # Handle fallback cases (hits == 0)
-    fallback_mask = hits == 0
-    fallback_idxs = np.where(fallback_mask)[0]
-    for i in fallback_idxs:
-        cur_inds, counts = source_grid.get_faces_containing_point(points=point_xyz[i])
-        if counts == 0:
-            continue
-        all_weights[i, 0] = 1.0
-        all_indices[i, 0] = int(cur_inds[0])
+    # Points outside the dual take the value of the primal face containing them,
+    # found with a single batched query
+    fallback_idxs = np.flatnonzero(hits == 0)
+    if fallback_idxs.size:
+        cur_inds, counts = _point_in_face_query(source_grid, point_xyz[fallback_idxs])
+        found = counts > 0
+        all_weights[fallback_idxs[found], 0] = 1.0
+        all_indices[fallback_idxs[found], 0] = cur_inds[found, 0]
 
     # Prepare args for the Numba function
     valid_idxs = np.where(hits != 0)[0]
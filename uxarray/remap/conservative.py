@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numba import njit, prange
+from scipy import sparse
+
+if TYPE_CHECKING:
+    from uxarray.core.dataarray import UxDataArray
+    from uxarray.core.dataset import UxDataset
+
+from uxarray.constants import ERROR_TOLERANCE
+from uxarray.grid import Grid
+from uxarray.grid.area import calculate_face_area
+from uxarray.grid.point_in_face import _bvh_query_cap, _face_caps
+from uxarray.options import _fill_value
+
+from .utils import (
+    LABEL_TO_COORD,
+    _assert_dimension,
+    _get_remap_dims,
+    _to_dataset,
+)
+
+
+def _conservative_remap(
+    source: UxDataArray | UxDataset,
+    destination_grid: Grid,
+    destination_dim: str = "n_face",
+    dtype=None,
+):
+    """
+    Apply first-order conservative remapping to a UXarray object.
+
+    Each destination face receives the area-weighted average of the source faces
+    it overlaps, so that area integrals are preserved.
+
+    Parameters
+    ----------
+    source : UxDataArray or UxDataset
+        Face-centered data to be remapped.
+    destination_grid : Grid
+        The UXarray grid instance on which to remap data.
+    destination_dim : str, default='n_face'
+        The spatial dimension on `destination_grid`. Only faces are supported.
+    dtype : np.dtype, optional
+        Floating point type of the weights. Defaults to ``float64``.
+
+    Returns
+    -------
+    UxDataArray or UxDataset
+        A new UXarray object with values remapped onto `destination_grid`.
+    """
+    from .weights import RemapWeights
+
+    _assert_dimension(destination_dim)
+    if LABEL_TO_COORD[destination_dim] != "n_face":
+        raise ValueError("Conservative remapping only supports remapping to faces")
+
+    ds, _, _ = _to_dataset(source)
+    if _get_remap_dims(ds) != {"n_face"}:
+        raise ValueError(
+            "Conservative remapping is not supported for non-face centered variables"
+        )
+
+    weights = RemapWeights.conservative(source.uxgrid, destination_grid, dtype=dtype)
+    return weights.apply(source, destination_grid)
+
+
+def _conservative_weights(source_grid: Grid, destination_grid: Grid):
+    """
+    Compute first-order conservative remapping weights between the faces of two grids.
+
+    Candidate (destination, source) face pairs are found by intersecting the
+    bounding cap of each destination face with the bounding-cap hierarchy of the
+    source faces, and pruned using the latitude bounds of each face. The
+    overlap area of each remaining pair is then computed in parallel by clipping
+    the source face against the destination face.
+
+    Parameters
+    ----------
+    source_grid : Grid
+        Grid the source data lives on.
+    destination_grid : Grid
+        Grid the data is remapped onto.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Weight matrix of shape (destination n_face, source n_face), where each
+        non-empty row sums to one.
+
+    Raises
+    ------
+    ValueError
+        If a face of `destination_grid` is not convex.
+    """
+    source_grid.normalize_cartesian_coordinates()
+    destination_grid.normalize_cartesian_coordinates()
+
+    concave = np.flatnonzero(
+        _concave_faces(
+            destination_grid.face_node_connectivity.values,
+            destination_grid.n_nodes_per_face.values,
+            destination_grid.node_x.values.astype(np.float64),
+            destination_grid.node_y.values.astype(np.float64),
+            destination_grid.node_z.values.astype(np.float64),
+        )
+    )
+    if concave.size > 0:
+        raise ValueError(
+            f"Conservative remapping requires convex destination faces, but "
+            f"{concave.size} faces are concave (e.g. face {concave[0]})."
+        )
+
+    offsets, candidates = _candidate_face_pairs(source_grid, destination_grid)
+
+    overlap_areas = _overlap_areas(
+        offsets,
+        candidates,
+        destination_grid.face_node_connectivity.values,
+        destination_grid.n_nodes_per_face.values,
+        destination_grid.node_x.values.astype(np.float64),
+        destination_grid.node_y.values.astype(np.float64),
+        destination_grid.node_z.values.astype(np.float64),
+        source_grid.face_node_connectivity.values,
+        source_grid.n_nodes_per_face.values,
+        source_grid.node_x.values.astype(np.float64),
+        source_grid.node_y.values.astype(np.float64),
+        source_grid.node_z.values.astype(np.float64),
+    )
+
+    matrix = sparse.csr_matrix(
+        (overlap_areas, candidates, offsets),
+        shape=(destination_grid.n_face, source_grid.n_face),
+    )
+    matrix.eliminate_zeros()
+
+    # normalize by the covered area of each destination face
+    covered_area = np.asarray(matrix.sum(axis=1)).ravel()
+    covered_area[covered_area == 0.0] = 1.0
+    return sparse.diags(1.0 / covered_area) @ matrix
+
+
+def _candidate_face_pairs(source_grid: Grid, destination_grid: Grid):
+    """Returns CSR-style (offsets, candidates) listing, for each destination face,
+    the source faces that may overlap it.
+
+    Candidates are the source faces whose bounding cap intersects the bounding
+    cap of the destination face. They are found by traversing the bounding-cap
+    hierarchy of the source grid, so the search adapts to the local resolution
+    of both grids instead of using the largest face radius everywhere."""
+    order, lower, upper, children, ranges, centers, radii = source_grid._get_face_bvh()
+    destination_centers, destination_radii = _face_caps(destination_grid)
+
+    offsets, cols = _overlapping_caps(
+        destination_centers,
+        destination_radii,
+        order,
+        lower,
+        upper,
+        children,
+        ranges,
+        centers,
+        radii,
+    )
+    rows = np.repeat(np.arange(destination_grid.n_face), np.diff(offsets))
+
+    # discard pairs whose latitude bounds do not overlap
+    src_lat = source_grid.face_bounds_lat.values
+    dst_lat = destination_grid.face_bounds_lat.values
+    keep = (src_lat[cols, 0] <= dst_lat[rows, 1]) & (
+        src_lat[cols, 1] >= dst_lat[rows, 0]
+    )
+    rows = rows[keep]
+    cols = cols[keep]
+
+    offsets = np.zeros(destination_grid.n_face + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=destination_grid.n_face), out=offsets[1:])
+
+    return offsets, cols
+
+
+@njit(cache=True, parallel=True)
+def _overlapping_caps(
+    query_centers,
+    query_radii,
+    order,
+    lower,
+    upper,
+    children,
+    ranges,
+    centers,
+    radii,
+):
+    """Returns CSR-style (offsets, candidates) listing, for each query cap, the
+    faces of a bounding-cap hierarchy whose cap intersects it, in increasing
+    order. The hierarchy is traversed twice: once to count the candidates of each
+    cap, and once to write them into a single preallocated array."""
+    n = query_centers.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    no_hits = np.empty(0, dtype=np.int64)
+    for i in prange(n):
+        counts[i] = _bvh_query_cap(
+            query_centers[i],
+            query_radii[i],
+            no_hits,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+        )
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    candidates = np.empty(offsets[n], dtype=np.int64)
+    for i in prange(n):
+        hits = candidates[offsets[i] : offsets[i + 1]]
+        _bvh_query_cap(
+            query_centers[i],
+            query_radii[i],
+            hits,
+            order,
+            lower,
+            upper,
+            children,
+            ranges,
+            centers,
+            radii,
+        )
+        hits.sort()
+
+    return offsets, candidates
+
+
+@njit(cache=True, parallel=True)
+def _overlap_areas(
+    offsets,
+    candidates,
+    dst_face_node_connectivity,
+    dst_n_nodes_per_face,
+    dst_x,
+    dst_y,
+    dst_z,
+    src_face_node_connectivity,
+    src_n_nodes_per_face,
+    src_x,
+    src_y,
+    src_z,
+):
+    """Computes the overlap area of each (destination, source) candidate pair."""
+    areas = np.zeros(candidates.shape[0], dtype=np.float64)
+
+    for i in prange(offsets.shape[0] - 1):
+        if offsets[i] == offsets[i + 1]:
+            continue
+
+        dst_poly = _face_polygon(
+            i, dst_face_node_connectivity, dst_n_nodes_per_face, dst_x, dst_y, dst_z
+        )
+        if dst_poly.shape[0] < 3:
+            continue
+
+        for c in range(offsets[i], offsets[i + 1]):
+            src_poly = _face_polygon(
+                candidates[c],
+                src_face_node_connectivity,
+                src_n_nodes_per_face,
+                src_x,
+                src_y,
+                src_z,
+            )
+            if src_poly.shape[0] < 3:
+                continue
+
+            clipped = _clip_polygon(src_poly, dst_poly)
+            if clipped.shape[0] < 3:
+                continue
+
+            area, _ = calculate_face_area(
+                np.ascontiguousarray(clipped[:, 0]),
+                np.ascontiguousarray(clipped[:, 1]),
+                np.ascontiguousarray(clipped[:, 2]),
+                "triangular",
+                4,
+            )
+            areas[c] = area
+
+    return areas
+
+
+@njit(cache=True)
+def _face_polygon(face_idx, face_node_connectivity, n_nodes_per_face, x, y, z):
+    """Returns the counter-clockwise ordered Cartesian vertices of a face."""
+    fill_value = _fill_value(face_node_connectivity.dtype)
+    n = 0
+    for j in range(n_nodes_per_face[face_idx]):
+        if face_node_connectivity[face_idx, j] != fill_value:
+            n += 1
+
+    poly = np.empty((n, 3), dtype=np.float64)
+    k = 0
+    for j in range(n_nodes_per_face[face_idx]):
+        node = face_node_connectivity[face_idx, j]
+        if node == fill_value:
+            continue
+        poly[k, 0] = x[node]
+        poly[k, 1] = y[node]
+        poly[k, 2] = z[node]
+        k += 1
+
+    # the summed edge normals point away from the sphere for counter-clockwise faces
+    normal = np.zeros(3, dtype=np.float64)
+    center = np.zeros(3, dtype=np.float64)
+    for j in range(n):
+        normal += np.cross(poly[j], poly[(j + 1) % n])
+        center += poly[j]
+    orientation = np.dot(normal, center)
+
+    if orientation < 0.0:
+        poly = poly[::-1].copy()
+
+    return poly
+
+
+@njit(cache=True)
+def _is_convex(poly):
+    """Returns whether a counter-clockwise spherical polygon is convex, meaning
+    that every vertex lies on the left of the great circle through the two
+    vertices before it."""
+    n = poly.shape[0]
+    for j in range(n):
+        normal = np.cross(poly[j], poly[(j + 1) % n])
+        length = np.linalg.norm(normal)
+        if length == 0.0:
+            # repeated node
+            continue
+        if np.dot(normal, poly[(j + 2) % n]) < -ERROR_TOLERANCE * length:
+            return False
+    return True
+
+
+@njit(cache=True, parallel=True)
+def _concave_faces(face_node_connectivity, n_nodes_per_face, x, y, z):
+    """Returns a boolean mask of the faces that are not convex."""
+    n_face = face_node_connectivity.shape[0]
+    concave = np.zeros(n_face, dtype=np.bool_)
+    for i in prange(n_face):
+        poly = _face_polygon(i, face_node_connectivity, n_nodes_per_face, x, y, z)
+        if poly.shape[0] >= 3:
+            concave[i] = not _is_convex(poly)
+    return concave
+
+
+@njit(cache=True)
+def _clip_polygon(subject, clip):
+    """Clips a spherical polygon against a convex, counter-clockwise spherical
+    polygon using the Sutherland–Hodgman algorithm, where each edge of ``clip``
+    defines the hemisphere bounded by its great circle."""
+    current = subject
+    n_current = subject.shape[0]
+
+    n_clip = clip.shape[0]
+    for e in range(n_clip):
+        a = clip[e]
+        b = clip[(e + 1) % n_clip]
+        normal = np.cross(a, b)
+
+        # a vertex adds two points only where the polygon re-enters the
+        # hemisphere, which happens at most once for every two vertices
+        scratch = np.empty((n_current + n_current // 2, 3), dtype=np.float64)
+        n_out = 0
+        for j in range(n_current):
+            cur = current[j]
+            prev = current[j - 1] if j > 0 else current[n_current - 1]
+            d_cur = np.dot(cur, normal)
+            d_prev = np.dot(prev, normal)
+            cur_inside = d_cur >= -ERROR_TOLERANCE
+            prev_inside = d_prev >= -ERROR_TOLERANCE
+
+            if cur_inside != prev_inside:
+                # intersection of the subject edge with the great circle of the clip edge
+                t = d_prev / (d_prev - d_cur)
+                p = prev + t * (cur - prev)
+                scratch[n_out] = p / np.linalg.norm(p)
+                n_out += 1
+            if cur_inside:
+                scratch[n_out] = cur
+                n_out += 1
+
+        current = scratch
+        n_current = n_out
+        if n_current < 3:
+            return current[:0]
+
+    return current[:n_current].copy()
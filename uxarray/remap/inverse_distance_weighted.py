@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
-import xarray as xr
 
 if TYPE_CHECKING:
     from uxarray.core.dataarray import UxDataArray
@@ -12,17 +12,19 @@ if TYPE_CHECKING:
 
 from uxarray.grid import Grid
 from uxarray.remap.nearest_neighbor import (
+    _blocked_neighbor_remap,
     _nearest_neighbor_query,
     _nearest_neighbor_remap,
 )
 
 from .utils import (
     LABEL_TO_COORD,
-    SPATIAL_DIMS,
     _assert_dimension,
     _construct_remapped_ds,
     _get_remap_dims,
+    _remap_data_vars,
     _to_dataset,
+    _weighted_gather,
 )
 
 
@@ -55,6 +57,9 @@ def _inverse_distance_weighted_remap(
     destination_dim: str = "n_face",
     power: int = 2,
     k: int = 8,
+    chunk_size: Optional[int] = None,
+    max_memory: Optional[Union[int, str]] = None,
+    dtype=None,
 ):
     """
     Apply inverse-distance-weighted (IDW) remapping to a UXarray object.
@@ -75,6 +80,16 @@ def _inverse_distance_weighted_remap(
         emphasize closer neighbors.
     k : int, default=8
         Number of nearest neighbors to include in the weighted average.
+    chunk_size : int, optional
+        Number of destination points queried and remapped at a time, which bounds
+        the size of the (n_points, k) neighbor arrays.
+    max_memory : int or str, optional
+        Memory budget for the remapping work arrays, in bytes or as a string such
+        as ``"2GB"``, used to choose ``chunk_size``.
+    dtype : np.dtype, optional
+        Floating point type of the weights. Defaults to ``float64``; with
+        ``float32``, float32 data is weighted and reduced in float32. The tree
+        queries always use ``float64`` coordinates.
 
     Returns
     -------
@@ -88,10 +103,24 @@ def _inverse_distance_weighted_remap(
     """
     # Fall back onto nearest neighbor
     if k == 1:
-        return _nearest_neighbor_remap(source, destination_grid, destination_dim)
+        return _nearest_neighbor_remap(
+            source, destination_grid, destination_dim, chunk_size, max_memory
+        )
 
     _assert_dimension(destination_dim)
 
+    if chunk_size is not None or max_memory is not None:
+        return _blocked_neighbor_remap(
+            source,
+            destination_grid,
+            destination_dim,
+            k=k,
+            weight_func=partial(_idw_weights, power=power),
+            chunk_size=chunk_size,
+            max_memory=max_memory,
+            dtype=dtype,
+        )
+
     # Perform remapping on a UxDataset
     ds, is_da, name = _to_dataset(source)
 
@@ -112,31 +141,22 @@ def _inverse_distance_weighted_remap(
         )
 
         weights = _idw_weights(distances, power)
+        if dtype is not None:
+            weights = weights.astype(dtype)
 
         indices_weights_map[src_dim] = (indices, weights)
 
-    remapped_vars = {}
-    for name, da in ds.data_vars.items():
-        spatial = set(da.dims) & SPATIAL_DIMS
-        if spatial:
-            source_dim = spatial.pop()
-            inds, w = indices_weights_map[source_dim]
-
-            # pack indices & weights into tiny DataArrays:
-            indexer = xr.DataArray(inds, dims=[LABEL_TO_COORD[destination_dim], "k"])
-            weight_da = xr.DataArray(w, dims=[LABEL_TO_COORD[destination_dim], "k"])
-
-            # gather the k neighbor values:
-            da_k = da.isel({source_dim: indexer}, ignore_grid=True)
-
-            # weighted sum over the small "k" axis:
-            da_idw = (da_k * weight_da).sum(dim="k")
-
-            # attach the new grid
-            da_idw.uxgrid = destination_grid
-            remapped_vars[name] = da_idw
-        else:
-            remapped_vars[name] = da
+    operators = {
+        src_dim: (
+            partial(_weighted_gather, indices=indices, weights=weights),
+            len(indices),
+            weights.dtype,
+        )
+        for src_dim, (indices, weights) in indices_weights_map.items()
+    }
+    remapped_vars = _remap_data_vars(
+        ds, operators, LABEL_TO_COORD[destination_dim], destination_grid
+    )
 
     ds_remapped = _construct_remapped_ds(
         source, remapped_vars, destination_grid, destination_dim
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+
+if TYPE_CHECKING:
+    from uxarray.core.dataarray import UxDataArray
+    from uxarray.core.dataset import UxDataset
+
+from uxarray.grid import Grid
+
+from .bilinear import _barycentric_weights
+from .inverse_distance_weighted import _idw_weights
+from .utils import (
+    KDTREE_DIM_MAP,
+    SPATIAL_DIMS,
+    _apply_kernel,
+    _get_remap_dims,
+    _to_dataset,
+    _weighted_gather,
+)
+
+LATLON_METHODS = ("nearest_neighbor", "inverse_distance_weighted", "bilinear")
+
+
+def _to_latlon(
+    source: UxDataArray | UxDataset,
+    lon,
+    lat,
+    method: str = "nearest_neighbor",
+    power: int = 2,
+    k: int = 8,
+):
+    """
+    Remap a UXarray object onto a regular latitude-longitude grid.
+
+    The destination is described only by its 1D ``lon`` and ``lat`` coordinates.
+    The Cartesian coordinates of the destination points are formed directly
+    from ``lon`` and ``lat`` and queried in a single batch against the source
+    tree, so no destination grid or connectivity is ever constructed.
+
+    Parameters
+    ----------
+    source : UxDataArray or UxDataset
+        The data to be remapped.
+    lon : array_like
+        1D longitudes of the destination grid, in degrees.
+    lat : array_like
+        1D latitudes of the destination grid, in degrees.
+    method : {'nearest_neighbor', 'inverse_distance_weighted', 'bilinear'}, default='nearest_neighbor'
+        Remapping method. Bilinear remapping requires face-centered data.
+    power : int, default=2
+        Exponent used by inverse-distance weighting.
+    k : int, default=8
+        Number of neighbors used by inverse-distance weighting.
+
+    Returns
+    -------
+    xr.DataArray or xr.Dataset
+        Plain xarray object with the spatial dimension replaced by ``(lat, lon)``.
+    """
+    if method not in LATLON_METHODS:
+        raise ValueError(
+            f"Invalid remapping method: {method!r}. Expected one of {LATLON_METHODS}"
+        )
+
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    if lon.ndim != 1 or lat.ndim != 1:
+        raise ValueError("Both 'lon' and 'lat' must be one-dimensional")
+
+    ds, is_da, name = _to_dataset(source)
+    dims_to_remap = _get_remap_dims(ds)
+
+    if method == "bilinear" and dims_to_remap != {"n_face"}:
+        raise ValueError(
+            "Bilinear remapping is not supported for non-face centered variables"
+        )
+
+    weights_map = {
+        src_dim: _latlon_weights(ds.uxgrid, src_dim, lon, lat, method, power, k)
+        for src_dim in dims_to_remap
+    }
+
+    remapped_vars = {}
+    for var_name, da in ds.data_vars.items():
+        spatial = set(da.dims) & SPATIAL_DIMS
+        if spatial:
+            source_dim = spatial.pop()
+            indices, weights = weights_map[source_dim]
+            dtype = (
+                da.dtype if weights is None else np.result_type(da.dtype, weights.dtype)
+            )
+
+            remapped_vars[var_name] = _apply_latlon_kernel(
+                da,
+                partial(_weighted_gather, indices=indices, weights=weights),
+                source_dim,
+                (lat.size, lon.size),
+                dtype,
+            )
+        else:
+            remapped_vars[var_name] = xr.DataArray(da.variable)
+
+    coords = {
+        coord_name: coord.variable
+        for coord_name, coord in ds.coords.items()
+        if not set(coord.dims) & SPATIAL_DIMS
+    }
+    coords["lat"] = xr.Variable("lat", lat, {"units": "degrees_north"})
+    coords["lon"] = xr.Variable("lon", lon, {"units": "degrees_east"})
+
+    ds_remapped = xr.Dataset(remapped_vars, coords=coords, attrs=ds.attrs)
+
+    return ds_remapped[name] if is_da else ds_remapped
+
+
+def _latlon_weights(
+    source_grid: Grid, source_dim: str, lon, lat, method: str, power: int, k: int
+):
+    """
+    Compute source indices and weights for each point of a lat-lon grid.
+
+    The Cartesian coordinates of all destination points are formed by an outer
+    product of the latitude and longitude terms and queried in a single call.
+
+    Returns
+    -------
+    indices : np.ndarray, shape (n_lat * n_lon,) or (n_lat * n_lon, n)
+        Source indices contributing to each destination point, in row-major
+        ``(lat, lon)`` order.
+    weights : np.ndarray, shape (n_lat * n_lon, n), or None
+        Weights applied to the gathered values, or None for nearest-neighbor.
+    """
+    lon_rad = np.deg2rad(lon)
+    lat_rad = np.deg2rad(lat)
+    cos_lat = np.cos(lat_rad)[:, np.newaxis]
+
+    point_xyz = np.column_stack(
+        [
+            (cos_lat * np.cos(lon_rad)).ravel(),
+            (cos_lat * np.sin(lon_rad)).ravel(),
+            np.repeat(np.sin(lat_rad), lon.size),
+        ]
+    )
+
+    if method == "bilinear":
+        weights, indices = _barycentric_weights(
+            point_xyz=point_xyz,
+            dual=source_grid._get_dual(),
+            data_size=point_xyz.shape[0],
+            source_grid=source_grid,
+        )
+        return indices, weights
+
+    tree = source_grid._get_scipy_kd_tree(coordinates=KDTREE_DIM_MAP[source_dim])
+    n_neighbors = 1 if method == "nearest_neighbor" else k
+    distances, indices = tree.query(point_xyz, k=n_neighbors, workers=-1)
+
+    if method == "inverse_distance_weighted":
+        return indices, _idw_weights(distances, power)
+    return indices, None
+
+
+def _apply_latlon_kernel(da, kernel, source_dim, shape, dtype):
+    """Apply a remapping kernel along ``source_dim`` and unflatten the result onto
+    ``(lat, lon)``, keeping Dask-backed data lazy."""
+
+    def _kernel(data):
+        remapped = _apply_kernel(
+            data, kernel=kernel, n_destination=shape[0] * shape[1], dtype=dtype
+        )
+        return remapped.reshape(remapped.shape[:-1] + shape)
+
+    remapped = xr.apply_ufunc(
+        _kernel,
+        xr.DataArray(da.variable),
+        input_core_dims=[[source_dim]],
+        output_core_dims=[["lat", "lon"]],
+        exclude_dims={source_dim},
+        dask="allowed",
+        keep_attrs=True,
+    )
+
+    # keep the spatial dimensions where the source dimension was
+    dims = []
+    for dim in da.dims:
+        dims.extend(["lat", "lon"] if dim == source_dim else [dim])
+    return remapped.transpose(*dims).rename(da.name)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict
-
-import xarray as xr
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 if TYPE_CHECKING:
     from uxarray.core.dataarray import UxDataArray
@@ -17,12 +16,14 @@ from uxarray.grid import Grid
 from .utils import (
     KDTREE_DIM_MAP,
     LABEL_TO_COORD,
-    SPATIAL_DIMS,
     _assert_dimension,
     _construct_remapped_ds,
+    _element_coordinates,
     _get_remap_dims,
     _prepare_points,
+    _remap_data_vars,
     _to_dataset,
+    _weighted_gather,
 )
 
 
@@ -76,6 +77,8 @@ def _nearest_neighbor_remap(
     source: UxDataArray | UxDataset,
     destination_grid: Grid,
     destination_dim: str = "n_face",
+    chunk_size: Optional[int] = None,
+    max_memory: Optional[Union[int, str]] = None,
 ):
     """
     Apply nearest-neighbor remapping from a UXarray object onto another grid.
@@ -90,6 +93,12 @@ def _nearest_neighbor_remap(
         The UXarray Grid instance to which data will be remapped.
     destination_dim : str, default='n_face'
         The spatial dimension on the destination grid ('n_node', 'n_edge', 'n_face').
+    chunk_size : int, optional
+        Number of destination points queried and remapped at a time. See
+        `_blocked_neighbor_kernel`.
+    max_memory : int or str, optional
+        Memory budget for the remapping work arrays, in bytes or as a string such
+        as ``"2GB"``, used to choose ``chunk_size``.
 
     Returns
     -------
@@ -98,6 +107,16 @@ def _nearest_neighbor_remap(
     """
     _assert_dimension(destination_dim)
 
+    if chunk_size is not None or max_memory is not None:
+        return _blocked_neighbor_remap(
+            source,
+            destination_grid,
+            destination_dim,
+            k=1,
+            chunk_size=chunk_size,
+            max_memory=max_memory,
+        )
+
     # Perform remapping on a UxDataset
     ds, is_da, name = _to_dataset(source)
 
@@ -111,30 +130,205 @@ def _nearest_neighbor_remap(
         )
         for src_dim in dims_to_remap
     }
-    remapped_vars = {}
+    operators = {
+        src_dim: (partial(_weighted_gather, indices=indices), len(indices), None)
+        for src_dim, indices in indices_map.items()
+    }
+    remapped_vars = _remap_data_vars(
+        ds, operators, LABEL_TO_COORD[destination_dim], destination_grid
+    )
 
-    for name, da in ds.data_vars.items():
-        spatial_keys = set(da.dims) & SPATIAL_DIMS
-        if spatial_keys:
-            source_dim = spatial_keys.pop()
+    ds_remapped = _construct_remapped_ds(
+        source, remapped_vars, destination_grid, destination_dim
+    )
 
-            indices = indices_map[source_dim]
-            indexer = xr.DataArray(
-                indices,
-                dims=[
-                    LABEL_TO_COORD[destination_dim],
-                ],
-            )
+    return ds_remapped[name] if is_da else ds_remapped
 
-            da_remap = da.isel({source_dim: indexer}, ignore_grid=True)
 
-            da_remap.uxgrid = destination_grid
-            remapped_vars[name] = da_remap
-        else:
-            remapped_vars[name] = da
+def _blocked_neighbor_remap(
+    source: UxDataArray | UxDataset,
+    destination_grid: Grid,
+    destination_dim: str,
+    k: int = 1,
+    weight_func=None,
+    chunk_size: Optional[int] = None,
+    max_memory: Optional[Union[int, str]] = None,
+    dtype=None,
+):
+    """
+    Nearest-neighbor or inverse-distance-weighted remapping that processes the
+    destination points in blocks, so that no (n_destination, k) arrays are held
+    in memory.
+
+    Parameters
+    ----------
+    source : UxDataArray or UxDataset
+        The data to be remapped.
+    destination_grid : Grid
+        The UXarray grid instance on which to remap data.
+    destination_dim : str
+        The spatial dimension on `destination_grid`.
+    k : int, default=1
+        Number of nearest source points contributing to each destination point.
+    weight_func : callable, optional
+        Maps the (n_points, k) distances of a block to weights. If None, values are
+        gathered without weighting (nearest-neighbor, ``k=1``).
+    chunk_size, max_memory : optional
+        See `_blocked_neighbor_kernel`.
+    dtype : np.dtype, optional
+        Floating point type of the weights returned by `weight_func`. Defaults to
+        ``float64``.
+
+    Returns
+    -------
+    UxDataArray or UxDataset
+        A new UXarray object with values remapped onto `destination_grid`.
+    """
+    ds, is_da, name = _to_dataset(source)
+    dims_to_remap = _get_remap_dims(ds)
+
+    destination_xyz = _element_coordinates(destination_grid, destination_dim)
+    n_destination = destination_xyz[0].shape[0]
+    trees = {
+        src_dim: ds.uxgrid._get_scipy_kd_tree(coordinates=KDTREE_DIM_MAP[src_dim])
+        for src_dim in dims_to_remap
+    }
+
+    weights_dtype = (
+        None
+        if weight_func is None
+        else np.dtype(np.float64 if dtype is None else dtype)
+    )
+    operators = {
+        src_dim: (
+            partial(
+                _blocked_neighbor_kernel,
+                source_tree=tree,
+                destination_xyz=destination_xyz,
+                k=k,
+                weight_func=weight_func,
+                chunk_size=chunk_size,
+                max_memory=max_memory,
+                dtype=dtype,
+            ),
+            n_destination,
+            weights_dtype,
+        )
+        for src_dim, tree in trees.items()
+    }
+    remapped_vars = _remap_data_vars(
+        ds, operators, LABEL_TO_COORD[destination_dim], destination_grid
+    )
 
     ds_remapped = _construct_remapped_ds(
         source, remapped_vars, destination_grid, destination_dim
     )
 
     return ds_remapped[name] if is_da else ds_remapped
+
+
+def _blocked_neighbor_kernel(
+    data,
+    source_tree,
+    destination_xyz,
+    k,
+    weight_func,
+    chunk_size=None,
+    max_memory=None,
+    dtype=None,
+):
+    """
+    Remap ``data`` of shape (..., n_source) onto the destination points, one block
+    of destination points at a time.
+
+    Each block is queried against ``source_tree``, weighted, gathered and written
+    into the output before its work arrays are released. Blocks are processed
+    one after another; the tree queries and the gather kernel are each
+    parallelized within a block.
+
+    Parameters
+    ----------
+    data : np.ndarray, shape (..., n_source)
+        Source values, with the spatial dimension last.
+    source_tree : scipy.spatial.cKDTree
+        Tree over the source points.
+    destination_xyz : tuple of np.ndarray
+        Cartesian x, y and z coordinates of the destination points.
+    k : int
+        Number of nearest source points used for each destination point.
+    weight_func : callable or None
+        Maps the distances of a block to weights, or None for nearest-neighbor.
+    chunk_size : int, optional
+        Number of destination points per block. Derived from ``max_memory`` if not
+        provided.
+    max_memory : int or str, optional
+        Upper bound on the memory used by the work arrays of a block, in bytes or
+        as a string such as ``"2GB"``. Does not include ``data`` or the
+        result itself.
+    dtype : np.dtype, optional
+        Floating point type of the weights. The tree is always queried with
+        ``float64`` points.
+
+    Returns
+    -------
+    np.ndarray, shape (..., n_destination)
+        Remapped values.
+    """
+    n_destination = destination_xyz[0].shape[0]
+    weights_dtype = np.dtype(np.float64 if dtype is None else dtype)
+    out_dtype = (
+        data.dtype if weight_func is None else np.result_type(data.dtype, weights_dtype)
+    )
+    out = np.empty(data.shape[:-1] + (n_destination,), dtype=out_dtype)
+    if n_destination == 0:
+        return out
+
+    chunk_size = _resolve_chunk_size(
+        chunk_size,
+        max_memory,
+        k,
+        int(np.prod(data.shape[:-1])) * out_dtype.itemsize,
+    )
+
+    for start in range(0, n_destination, chunk_size):
+        stop = min(start + chunk_size, n_destination)
+        points = np.column_stack([coord[start:stop] for coord in destination_xyz])
+        distances, indices = source_tree.query(points, k=k, workers=-1)
+        weights = (
+            None
+            if weight_func is None
+            else weight_func(distances).astype(weights_dtype, copy=False)
+        )
+        out[..., start:stop] = _weighted_gather(data, indices, weights)
+
+    return out
+
+
+def _resolve_chunk_size(chunk_size, max_memory, k, bytes_per_value):
+    """
+    Determine the number of destination points per block.
+
+    When ``max_memory`` is given, a block may use all of it. A block of ``b``
+    points holds its coordinates (``3 b`` floats), distances and indices
+    (``2 k b`` values), and the gathered and weighted values (``(2 k + 1) b``
+    values per non-spatial element).
+    """
+    if chunk_size is not None:
+        if int(chunk_size) < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+        chunk_size = int(chunk_size)
+
+    if max_memory is not None:
+        from dask.utils import parse_bytes
+
+        max_memory = (
+            parse_bytes(max_memory) if isinstance(max_memory, str) else int(max_memory)
+        )
+        if max_memory < 1:
+            raise ValueError(f"max_memory must be positive, got {max_memory}")
+
+        bytes_per_point = 24 + 16 * k + (2 * k + 1) * bytes_per_value
+        budget = max(1, max_memory // bytes_per_point)
+        chunk_size = budget if chunk_size is None else min(chunk_size, budget)
+
+    return chunk_size
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import xarray as xr
+
+if TYPE_CHECKING:
+    from uxarray.core.dataarray import UxDataArray
+    from uxarray.core.dataset import UxDataset
+
+from uxarray.grid import Grid
+
+from .utils import (
+    KDTREE_DIM_MAP,
+    LABEL_TO_COORD,
+    _apply_remap_kernel,
+    _assert_dimension,
+    _construct_remapped_ds,
+    _weighted_gather,
+)
+
+STRUCTURED_METHODS = ("nearest_neighbor", "bilinear")
+
+_LON_NAMES = ("lon", "longitude", "nav_lon", "x")
+_LAT_NAMES = ("lat", "latitude", "nav_lat", "y")
+
+
+def remap_structured(
+    source: xr.DataArray | xr.Dataset,
+    destination_grid: Grid,
+    method: str = "bilinear",
+    remap_to: str = "faces",
+    lon_name: Optional[str] = None,
+    lat_name: Optional[str] = None,
+) -> UxDataArray | UxDataset:
+    """Remaps data on a rectilinear latitude-longitude grid onto an unstructured
+    grid.
+
+    Unlike converting the source with ``UxDataset.from_structured`` and remapping
+    the result, the cell enclosing each destination point is found by index
+    arithmetic on the monotonic longitude and latitude axes, so no source ``Grid``
+    or spatial tree is constructed.
+
+    Parameters
+    ----------
+    source : xr.DataArray or xr.Dataset
+        Data on a rectilinear grid, with one-dimensional longitude and latitude
+        coordinates in degrees. Longitudes are treated as periodic when they span
+        the whole globe.
+    destination_grid : Grid
+        The UXarray grid to which data will be remapped.
+    method : {'bilinear', 'nearest_neighbor'}, default='bilinear'
+        Remapping method.
+    remap_to : {'nodes', 'edges', 'faces'}, default='faces'
+        Which grid element receives the remapped values.
+    lon_name, lat_name : str, optional
+        Names of the longitude and latitude coordinates. If not provided, they are
+        inferred from the ``standard_name`` attribute or common coordinate names.
+
+    Returns
+    -------
+    UxDataArray or UxDataset
+        A new object with data mapped onto `destination_grid`. Destination points
+        more than half a cell outside the source domain are set to NaN.
+
+    Examples
+    --------
+    >>> era5 = xr.open_dataset("era5.nc")
+    >>> mpas_grid = ux.open_grid("x1.655362.grid.nc")
+    >>> uxds = ux.remap_structured(era5, mpas_grid, method="bilinear")
+    """
+    from uxarray.core.dataarray import UxDataArray
+
+    if method not in STRUCTURED_METHODS:
+        raise ValueError(
+            f"Invalid remapping method: {method!r}. Expected one of {STRUCTURED_METHODS}"
+        )
+    _assert_dimension(remap_to)
+
+    is_da = isinstance(source, xr.DataArray)
+    name = (source.name or "remap_structured") if is_da else None
+    ds = source.to_dataset(name=name) if is_da else source
+
+    lon_name = lon_name or _find_coordinate(ds, "longitude", _LON_NAMES)
+    lat_name = lat_name or _find_coordinate(ds, "latitude", _LAT_NAMES)
+    lon, lat = ds[lon_name], ds[lat_name]
+    if lon.ndim != 1 or lat.ndim != 1:
+        raise ValueError(
+            "Structured remapping requires one-dimensional longitude and latitude coordinates"
+        )
+    spatial_dims = (lat.dims[0], lon.dims[0])
+
+    element = KDTREE_DIM_MAP[remap_to]
+    destination_dim = LABEL_TO_COORD[remap_to]
+    indices, weights = _structured_weights(
+        lon.values,
+        lat.values,
+        getattr(destination_grid, f"{element}_lon").values,
+        getattr(destination_grid, f"{element}_lat").values,
+        method,
+    )
+
+    remapped_vars = {}
+    for var_name, da in ds.data_vars.items():
+        dims = set(da.dims) & set(spatial_dims)
+        if dims == set(spatial_dims):
+            dtype = (
+                da.dtype if weights is None else np.result_type(da.dtype, weights.dtype)
+            )
+            remapped_vars[var_name] = _apply_remap_kernel(
+                da,
+                partial(_gather_structured, indices=indices, weights=weights),
+                spatial_dims,
+                destination_dim,
+                len(indices),
+                dtype,
+                destination_grid,
+            )
+        elif not dims:
+            remapped_vars[var_name] = UxDataArray(da, uxgrid=destination_grid)
+        # variables along only one of the axes (e.g. bounds) are dropped
+
+    coords = ds.coords.to_dataset().drop_vars(
+        [
+            coord_name
+            for coord_name, coord in ds.coords.items()
+            if set(coord.dims) & set(spatial_dims)
+        ]
+    )
+    ds_remapped = _construct_remapped_ds(
+        coords, remapped_vars, destination_grid, destination_dim
+    )
+    ds_remapped.attrs = ds.attrs
+
+    return ds_remapped[name] if is_da else ds_remapped
+
+
+def _find_coordinate(ds, standard_name, candidates):
+    """Returns the name of the coordinate with the given ``standard_name``, or the
+    first coordinate whose name is one of ``candidates``."""
+    for name, coord in ds.coords.items():
+        if coord.attrs.get("standard_name", "").lower() == standard_name:
+            return name
+    for name in candidates:
+        if name in ds.coords:
+            return name
+    raise ValueError(
+        f"Unable to find a {standard_name} coordinate. Please provide its name "
+        f"explicitly."
+    )
+
+
+def _gather_structured(data, indices, weights):
+    """Flattens the trailing (lat, lon) axes and gathers the remapped values."""
+    flat = data.reshape(data.shape[:-2] + (data.shape[-2] * data.shape[-1],))
+    return _weighted_gather(flat, indices, weights)
+
+
+def _structured_weights(lon, lat, point_lon, point_lat, method):
+    """
+    Compute source indices and weights for remapping from a rectilinear grid.
+
+    Parameters
+    ----------
+    lon, lat : np.ndarray
+        Monotonic 1D source coordinates, in degrees.
+    point_lon, point_lat : np.ndarray
+        Destination coordinates, in degrees.
+    method : {'bilinear', 'nearest_neighbor'}
+        Remapping method.
+
+    Returns
+    -------
+    indices : np.ndarray, shape (n_points,) or (n_points, n)
+        Indices into the flattened ``(lat, lon)`` source array.
+    weights : np.ndarray, shape (n_points, n), or None
+        Weights applied to the gathered values, with NaN for points outside the
+        source domain, or None for nearest-neighbor when every point is inside.
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+
+    i0, i1, fx, lon_valid = _axis_position(lon, point_lon, longitude=True)
+    j0, j1, fy, lat_valid = _axis_position(lat, point_lat, longitude=False)
+    valid = lon_valid & lat_valid
+    n_lon = lon.size
+
+    if method == "nearest_neighbor":
+        i = np.where(fx < 0.5, i0, i1)
+        j = np.where(fy < 0.5, j0, j1)
+        indices = j * n_lon + i
+        if valid.all():
+            return indices, None
+        weights = np.where(valid, 1.0, np.nan)[:, np.newaxis]
+        return indices[:, np.newaxis], weights
+
+    indices = np.stack(
+        [j0 * n_lon + i0, j0 * n_lon + i1, j1 * n_lon + i1, j1 * n_lon + i0], axis=-1
+    )
+    weights = np.stack(
+        [(1 - fx) * (1 - fy), fx * (1 - fy), fx * fy, (1 - fx) * fy], axis=-1
+    )
+    weights[~valid] = np.nan
+
+    return indices, weights
+
+
+def _axis_position(coords, points, longitude):
+    """
+    Locate points between consecutive entries of a monotonic coordinate axis.
+
+    Regularly spaced axes are located in constant time per point with index
+    arithmetic; irregular axes fall back to a binary search. Longitude axes are
+    compared modulo 360 degrees and wrap around when they cover the whole globe.
+
+    Returns
+    -------
+    lower, upper : np.ndarray
+        Indices of the source coordinates bracketing each point.
+    frac : np.ndarray
+        Fractional position of each point between ``lower`` (0) and ``upper`` (1).
+    valid : np.ndarray
+        Whether each point lies inside the axis, allowing half a cell beyond its
+        ends. Always True for axes that wrap around the globe.
+    """
+    n = coords.size
+    if n < 2:
+        raise ValueError("Structured coordinates must contain at least two values")
+
+    # work on an increasing copy of the axis and map back at the end
+    order = np.arange(n)
+    if coords[0] > coords[-1]:
+        coords, order = coords[::-1], order[::-1]
+    spacing = np.diff(coords)
+    if np.any(spacing <= 0):
+        raise ValueError("Structured coordinates must be strictly monotonic")
+
+    points = np.asarray(points, dtype=np.float64)
+    if longitude:
+        # bring points into the 360 degree window starting half a cell before the axis
+        start = coords[0] - 0.5 * spacing[0]
+        points = start + np.mod(points - start, 360.0)
+
+    periodic = longitude and coords[-1] - coords[0] + spacing[-1] >= 360.0 - 1e-6
+    if periodic:
+        points = np.where(points < coords[0], points + 360.0, points)
+        coords = np.append(coords, coords[0] + 360.0)
+        spacing = np.append(spacing, coords[-1] - coords[-2])
+
+    if np.allclose(spacing, spacing[0]):
+        position = (points - coords[0]) / spacing[0]
+    else:
+        cell = np.searchsorted(coords, points, side="right") - 1
+        cell = np.clip(cell, 0, coords.size - 2)
+        position = cell + (points - coords[cell]) / spacing[cell]
+
+    if periodic:
+        lower = np.minimum(np.floor(position), n - 1).astype(np.intp)
+        upper = (lower + 1) % n
+        valid = np.ones(points.shape, dtype=bool)
+    else:
+        valid = (position >= -0.5) & (position <= n - 0.5)
+        position = np.clip(position, 0, n - 1)
+        lower = np.minimum(np.floor(position), n - 2).astype(np.intp)
+        upper = lower + 1
+
+    frac = position - lower
+    return order[lower], order[upper], frac, valid
@@ -1,7 +1,11 @@
+from collections import defaultdict
 from copy import deepcopy
+from functools import partial
 from typing import Set
 
 import numpy as np
+import xarray as xr
+from numba import njit, prange
 
 import uxarray.core.dataset
 
@@ -176,12 +180,240 @@ def _prepare_points(grid, element_dim):
     ValueError
         If `element_dim` is not in `KDTREE_DIM_MAP`.
     """
+    return np.vstack(_element_coordinates(grid, element_dim)).T
+
+
+def _element_coordinates(grid, element_dim):
+    """Returns the normalized x, y and z coordinates of the grid elements along
+    `element_dim` as separate 1D arrays, without stacking them."""
     grid.normalize_cartesian_coordinates()
     element_dim = KDTREE_DIM_MAP[element_dim]
-    return np.vstack(
-        [
-            getattr(grid, f"{element_dim}_x").values,
-            getattr(grid, f"{element_dim}_y").values,
-            getattr(grid, f"{element_dim}_z").values,
+    return tuple(
+        getattr(grid, f"{element_dim}_{axis}").values for axis in ("x", "y", "z")
+    )
+
+
+def _weighted_gather(data, indices, weights=None):
+    """
+    Gather source values along the trailing axis and reduce them with weights.
+
+    Parameters
+    ----------
+    data : np.ndarray, shape (..., n_source)
+        Source values, with the spatial dimension last.
+    indices : np.ndarray, shape (n_destination,) or (n_destination, k)
+        Source indices contributing to each destination element.
+    weights : np.ndarray, shape (n_destination, k), optional
+        Weights applied to the gathered values. If None, values are gathered without
+        reduction (nearest-neighbor).
+
+    Returns
+    -------
+    np.ndarray, shape (..., n_destination)
+        Remapped values.
+    """
+    if weights is None:
+        return np.take(data, indices, axis=-1)
+
+    # gather from a (n_source, n_values) layout so that all values of a source
+    # point are read contiguously
+    dtype = np.result_type(data.dtype, weights.dtype)
+    columns = np.ascontiguousarray(data.reshape(-1, data.shape[-1]).T, dtype=dtype)
+    remapped = _gather_reduce(columns, indices, weights.astype(dtype, copy=False))
+    return remapped.T.reshape(data.shape[:-1] + (indices.shape[0],))
+
+
+@njit(cache=True, parallel=True)
+def _gather_reduce(columns, indices, weights):
+    """Weighted sum of the rows of ``columns`` selected by ``indices``, in
+    parallel over the destination points."""
+    n_destination, k = indices.shape
+    n_values = columns.shape[1]
+    out = np.zeros((n_destination, n_values), dtype=columns.dtype)
+    for i in prange(n_destination):
+        for j in range(k):
+            weight = weights[i, j]
+            source = indices[i, j]
+            for m in range(n_values):
+                out[i, m] += weight * columns[source, m]
+    return out
+
+
+def _remap_data_vars(ds, operators, destination_dim, destination_grid):
+    """
+    Remap all data variables of a dataset, batching NumPy-backed variables.
+
+    Variables that share a spatial dimension and dtype are stacked into a single
+    (n_values, n_source) array, so that each group costs one kernel call instead
+    of one per variable; the result is then split back into the individual
+    variables. Dask-backed variables are remapped lazily one at a time.
+
+    Parameters
+    ----------
+    ds : UxDataset
+        Dataset whose data variables are remapped.
+    operators : dict[str, tuple]
+        Maps each source spatial dimension to ``(kernel, n_destination, dtype)``,
+        where ``kernel`` maps an array of shape (..., n_source) to one of shape
+        (..., n_destination) and ``dtype`` is the dtype of the weights, or None if
+        values are only gathered.
+    destination_dim : str
+        Spatial dimension of the result.
+    destination_grid : Grid
+        Grid attached to the result.
+
+    Returns
+    -------
+    dict[str, xr.DataArray]
+        Remapped variables, with variables without a spatial dimension carried over.
+    """
+    remapped_vars = {}
+    groups = defaultdict(list)
+    for name, da in ds.data_vars.items():
+        spatial = set(da.dims) & SPATIAL_DIMS
+        if not spatial:
+            remapped_vars[name] = da
+            continue
+
+        source_dim = spatial.pop()
+        kernel, n_destination, weights_dtype = operators[source_dim]
+        dtype = (
+            da.dtype
+            if weights_dtype is None
+            else np.result_type(da.dtype, weights_dtype)
+        )
+
+        if da.chunks is not None:
+            remapped_vars[name] = _apply_remap_kernel(
+                da,
+                kernel,
+                source_dim,
+                destination_dim,
+                n_destination,
+                dtype,
+                destination_grid,
+            )
+        else:
+            groups[(source_dim, da.dtype)].append(name)
+
+    for (source_dim, _), names in groups.items():
+        kernel, n_destination, _ = operators[source_dim]
+
+        # move the spatial dimension last and stack every variable as rows
+        variables = [ds[name].variable for name in names]
+        rows = [
+            var.transpose(..., source_dim).values.reshape(-1, var.sizes[source_dim])
+            for var in variables
         ]
-    ).T
+        remapped = kernel(np.concatenate(rows) if len(rows) > 1 else rows[0])
+
+        offsets = np.cumsum([0] + [row.shape[0] for row in rows])
+        for name, var, start, stop in zip(names, variables, offsets[:-1], offsets[1:]):
+            other_dims = [dim for dim in var.dims if dim != source_dim]
+            values = remapped[start:stop].reshape(
+                tuple(var.sizes[dim] for dim in other_dims) + (n_destination,)
+            )
+            result = xr.Variable(
+                other_dims + [destination_dim], values, attrs=var.attrs
+            ).transpose(
+                *[destination_dim if dim == source_dim else dim for dim in var.dims]
+            )
+            remapped_vars[name] = uxarray.core.dataarray.UxDataArray(
+                result, name=name, uxgrid=destination_grid
+            )
+
+    # keep the order of the source variables
+    return {name: remapped_vars[name] for name in ds.data_vars if name in remapped_vars}
+
+
+def _apply_remap_kernel(
+    da, kernel, source_dim, destination_dim, n_destination, dtype, destination_grid
+):
+    """
+    Apply a remapping kernel along the spatial dimension of a DataArray.
+
+    The kernel maps an array of shape (..., n_source) to one of shape
+    (..., n_destination). For Dask-backed data, the kernel is applied blockwise:
+    each task receives all spatial chunks of one block of the remaining
+    (e.g. time or level) dimensions, so the result stays lazy and chunked along
+    those dimensions without a separate rechunking step.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        Variable to remap.
+    kernel : callable
+        Function mapping (..., n_source) to (..., n_destination).
+    source_dim : str or tuple of str
+        Spatial dimension of `da`. Several dimensions (e.g. ``("lat", "lon")``)
+        are passed to the kernel as trailing axes, in the given order.
+    destination_dim : str
+        Spatial dimension of the result.
+    n_destination : int
+        Size of `destination_dim`.
+    dtype : np.dtype
+        Data type of the result.
+    destination_grid : Grid
+        Grid attached to the result.
+
+    Returns
+    -------
+    UxDataArray
+        Remapped variable, with `destination_dim` in place of `source_dim`.
+    """
+    source_dims = (source_dim,) if isinstance(source_dim, str) else tuple(source_dim)
+
+    remapped = xr.apply_ufunc(
+        partial(
+            _apply_kernel,
+            kernel=kernel,
+            n_destination=n_destination,
+            dtype=dtype,
+            n_spatial=len(source_dims),
+        ),
+        xr.DataArray(da.variable),
+        input_core_dims=[list(source_dims)],
+        output_core_dims=[[destination_dim]],
+        exclude_dims=set(source_dims),
+        dask="allowed",
+        keep_attrs=True,
+    )
+
+    # keep the spatial dimension where the (first) source dimension was
+    remapped = remapped.transpose(
+        *[
+            destination_dim if dim == source_dims[0] else dim
+            for dim in da.dims
+            if dim == source_dims[0] or dim not in source_dims
+        ]
+    )
+
+    return uxarray.core.dataarray.UxDataArray(
+        remapped, name=da.name, uxgrid=destination_grid
+    )
+
+
+def _apply_kernel(data, kernel, n_destination, dtype, n_spatial=1):
+    """Apply ``kernel`` to a NumPy array, or lazily to each block of a Dask array.
+
+    With several trailing spatial axes (``n_spatial > 1``) the kernel receives all
+    of them and still returns a single trailing destination axis."""
+    import dask.array
+
+    if not isinstance(data, dask.array.Array):
+        return kernel(data)
+
+    # the trailing (spatial) indices are contracted and replaced with a new axis,
+    # with concatenate=True handing each task the full spatial extent
+    in_index = tuple(range(data.ndim))
+    out_index = in_index[: data.ndim - n_spatial] + (data.ndim,)
+    return dask.array.blockwise(
+        kernel,
+        out_index,
+        data,
+        in_index,
+        concatenate=True,
+        new_axes={data.ndim: n_destination},
+        dtype=dtype,
+        meta=np.empty((0,) * (data.ndim - n_spatial + 1), dtype=dtype),
+    )
@@ -0,0 +1,574 @@
+from __future__ import annotations
+
+import os
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import xarray as xr
+from scipy import sparse
+
+if TYPE_CHECKING:
+    from uxarray.core.dataarray import UxDataArray
+    from uxarray.core.dataset import UxDataset
+    from uxarray.grid import Grid
+
+from uxarray.grid.utils import _grid_fingerprint
+
+from .utils import (
+    KDTREE_DIM_MAP,
+    LABEL_TO_COORD,
+    SPATIAL_DIMS,
+    _assert_dimension,
+    _construct_remapped_ds,
+    _remap_data_vars,
+    _to_dataset,
+)
+
+
+class RemapWeights:
+    """Sparse remapping weights from the elements of a source grid onto the
+    elements of a destination grid.
+
+    Weights are stored as a ``scipy.sparse.csr_matrix`` of shape
+    ``(n_destination, n_source)``, so that remapping a field reduces to a single
+    sparse matrix-vector product. Once computed, weights can be applied to any
+    number of variables or files that live on the same source grid, and can be
+    written to (and read from) netCDF or Zarr to be shared across jobs.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.csr_matrix
+        Sparse weight matrix of shape ``(n_destination, n_source)``
+    source_dim : {'n_node', 'n_edge', 'n_face'}
+        Spatial dimension of the source data
+    destination_dim : {'n_node', 'n_edge', 'n_face'}
+        Spatial dimension of the remapped data
+    source_fingerprint : str
+        Fingerprint of the source grid, used to validate inputs when applying the weights
+    destination_fingerprint : str
+        Fingerprint of the destination grid
+    method : str, optional
+        Name of the method used to compute the weights
+    destination_grid : Grid, optional
+        Destination grid attached to remapped results. Not serialized.
+
+    Examples
+    --------
+    Compute weights once and reuse them:
+
+    >>> import uxarray as ux
+    >>> weights = ux.RemapWeights.inverse_distance_weighted(
+    ...     uxds.uxgrid, destination_grid, source_dim="n_face", k=8
+    ... )
+    >>> remapped = weights.apply(uxds)
+
+    Store them for later use:
+
+    >>> weights.to_netcdf("weights.nc")
+    >>> weights = ux.RemapWeights.from_file("weights.nc")
+    >>> remapped = weights.apply(uxds, destination_grid)
+    """
+
+    def __init__(
+        self,
+        matrix: sparse.csr_matrix,
+        source_dim: str,
+        destination_dim: str,
+        source_fingerprint: str,
+        destination_fingerprint: str,
+        method: Optional[str] = None,
+        destination_grid: Optional[Grid] = None,
+    ):
+        _assert_dimension(source_dim)
+        _assert_dimension(destination_dim)
+
+        self.matrix = sparse.csr_matrix(matrix)
+        self.source_dim = LABEL_TO_COORD[source_dim]
+        self.destination_dim = LABEL_TO_COORD[destination_dim]
+        self.source_fingerprint = source_fingerprint
+        self.destination_fingerprint = destination_fingerprint
+        self.method = method
+        self._destination_grid = destination_grid
+
+    def __repr__(self) -> str:
+        n_destination, n_source = self.matrix.shape
+        return (
+            f"<uxarray.RemapWeights>\n"
+            f"  method: {self.method}\n"
+            f"  source: {self.source_dim} ({n_source})\n"
+            f"  destination: {self.destination_dim} ({n_destination})\n"
+            f"  nnz: {self.matrix.nnz}\n"
+        )
+
+    @property
+    def n_source(self) -> int:
+        """Number of source elements."""
+        return self.matrix.shape[1]
+
+    @property
+    def n_destination(self) -> int:
+        """Number of destination elements."""
+        return self.matrix.shape[0]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the weights."""
+        return self.matrix.dtype
+
+    def astype(self, dtype) -> RemapWeights:
+        """Returns a copy of these weights cast to ``dtype``.
+
+        Applying ``float32`` weights to ``float32`` data keeps the remapped values
+        in ``float32`` and halves the memory traffic of the sparse product.
+
+        Parameters
+        ----------
+        dtype : str or np.dtype
+            Floating point type of the returned weights
+        """
+        return RemapWeights(
+            self.matrix.astype(dtype),
+            self.source_dim,
+            self.destination_dim,
+            self.source_fingerprint,
+            self.destination_fingerprint,
+            method=self.method,
+            destination_grid=self._destination_grid,
+        )
+
+    @classmethod
+    def from_indices(
+        cls,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        source_grid: Grid,
+        destination_grid: Grid,
+        source_dim: str,
+        destination_dim: str,
+        method: Optional[str] = None,
+        dtype=None,
+    ):
+        """Constructs ``RemapWeights`` from dense ``(n_destination, k)`` arrays
+        of source indices and weights, as returned by the query functions of
+        each remapping method.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Source indices of shape ``(n_destination,)`` or ``(n_destination, k)``
+        weights : np.ndarray
+            Weights matching the shape of ``indices``
+        source_grid : Grid
+            Grid the source data lives on
+        destination_grid : Grid
+            Grid the data is remapped onto
+        source_dim : {'n_node', 'n_edge', 'n_face'}
+            Spatial dimension of the source data
+        destination_dim : {'n_node', 'n_edge', 'n_face'}
+            Spatial dimension of the remapped data
+        method : str, optional
+            Name of the method used to compute the weights
+        dtype : str or np.dtype, optional
+            Floating point type of the weights. Defaults to ``float64``.
+        """
+        _assert_dimension(source_dim)
+        _assert_dimension(destination_dim)
+
+        indices = np.asarray(indices)
+        weights = np.asarray(weights, dtype=np.float64 if dtype is None else dtype)
+        if indices.ndim == 1:
+            indices = indices[:, np.newaxis]
+            weights = weights.reshape(indices.shape)
+
+        n_destination, k = indices.shape
+        n_source = getattr(source_grid, LABEL_TO_COORD[source_dim])
+
+        matrix = sparse.csr_matrix(
+            (
+                weights.ravel(),
+                indices.ravel(),
+                np.arange(0, n_destination * k + 1, k),
+            ),
+            shape=(n_destination, n_source),
+        )
+        matrix.eliminate_zeros()
+
+        return cls(
+            matrix,
+            source_dim,
+            destination_dim,
+            _grid_fingerprint(source_grid),
+            _grid_fingerprint(destination_grid),
+            method=method,
+            destination_grid=destination_grid,
+        )
+
+    @classmethod
+    def nearest_neighbor(
+        cls,
+        source_grid: Grid,
+        destination_grid: Grid,
+        source_dim: str = "n_face",
+        remap_to: str = "faces",
+        dtype=None,
+    ):
+        """Computes nearest-neighbor remapping weights.
+
+        Parameters
+        ----------
+        source_grid : Grid
+            Grid the source data lives on
+        destination_grid : Grid
+            Grid the data is remapped onto
+        source_dim : {'n_node', 'n_edge', 'n_face'}, default='n_face'
+            Spatial dimension of the source data
+        remap_to : {'nodes', 'edges', 'faces'}, default='faces'
+            Which grid element receives the remapped values.
+        dtype : str or np.dtype, optional
+            Floating point type of the weights. Defaults to ``float64``.
+        """
+        from .nearest_neighbor import _nearest_neighbor_query
+
+        _assert_dimension(source_dim)
+        _assert_dimension(remap_to)
+
+        indices = _nearest_neighbor_query(
+            source_grid, destination_grid, source_dim, remap_to
+        )
+
+        return cls.from_indices(
+            indices,
+            np.ones(indices.shape),
+            source_grid,
+            destination_grid,
+            source_dim,
+            remap_to,
+            method="nearest_neighbor",
+            dtype=dtype,
+        )
+
+    @classmethod
+    def inverse_distance_weighted(
+        cls,
+        source_grid: Grid,
+        destination_grid: Grid,
+        source_dim: str = "n_face",
+        remap_to: str = "faces",
+        power: int = 2,
+        k: int = 8,
+        dtype=None,
+    ):
+        """Computes inverse-distance-weighted (IDW) remapping weights.
+
+        Parameters
+        ----------
+        source_grid : Grid
+            Grid the source data lives on
+        destination_grid : Grid
+            Grid the data is remapped onto
+        source_dim : {'n_node', 'n_edge', 'n_face'}, default='n_face'
+            Spatial dimension of the source data
+        remap_to : {'nodes', 'edges', 'faces'}, default='faces'
+            Which grid element receives the remapped values.
+        power : int, default=2
+            Exponent controlling distance decay.
+        k : int, default=8
+            Number of nearest source points to include in the weighted average.
+        dtype : str or np.dtype, optional
+            Floating point type of the weights. Defaults to ``float64``.
+        """
+        from .inverse_distance_weighted import _idw_weights
+        from .nearest_neighbor import _nearest_neighbor_query
+
+        if k == 1:
+            return cls.nearest_neighbor(
+                source_grid, destination_grid, source_dim, remap_to, dtype
+            )
+
+        _assert_dimension(source_dim)
+        _assert_dimension(remap_to)
+
+        indices, distances = _nearest_neighbor_query(
+            source_grid,
+            destination_grid,
+            source_dim,
+            remap_to,
+            k=k,
+            return_distances=True,
+        )
+
+        return cls.from_indices(
+            indices,
+            _idw_weights(distances, power),
+            source_grid,
+            destination_grid,
+            source_dim,
+            remap_to,
+            method="inverse_distance_weighted",
+            dtype=dtype,
+        )
+
+    @classmethod
+    def bilinear(
+        cls,
+        source_grid: Grid,
+        destination_grid: Grid,
+        remap_to: str = "faces",
+        dtype=None,
+    ):
+        """Computes bilinear remapping weights for face-centered source data.
+
+        The weights are computed on the dual of ``source_grid``, which is cached
+        on the source grid. The result is cached on ``destination_grid`` and reused
+        by later calls while neither grid changes.
+
+        Parameters
+        ----------
+        source_grid : Grid
+            Grid the source data lives on
+        destination_grid : Grid
+            Grid the data is remapped onto
+        remap_to : {'nodes', 'edges', 'faces'}, default='faces'
+            Which grid element receives the remapped values.
+        dtype : str or np.dtype, optional
+            Floating point type of the returned weights. Defaults to ``float64``.
+            The cached weights are always computed in ``float64``.
+        """
+        from .bilinear import _barycentric_weights
+        from .utils import _prepare_points
+
+        _assert_dimension(remap_to)
+
+        key = (
+            "bilinear",
+            _grid_fingerprint(source_grid),
+            _grid_fingerprint(destination_grid),
+            KDTREE_DIM_MAP[remap_to],
+        )
+
+        if key not in destination_grid._remap_weights:
+            weights, indices = _barycentric_weights(
+                point_xyz=_prepare_points(destination_grid, remap_to),
+                dual=source_grid._get_dual(),
+                data_size=getattr(destination_grid, f"n_{KDTREE_DIM_MAP[remap_to]}"),
+                source_grid=source_grid,
+            )
+
+            destination_grid._remap_weights[key] = cls.from_indices(
+                indices,
+                weights,
+                source_grid,
+                destination_grid,
+                "n_face",
+                remap_to,
+                method="bilinear",
+            )
+
+        weights = destination_grid._remap_weights[key]
+        return weights if dtype is None else weights.astype(dtype)
+
+    @classmethod
+    def conservative(cls, source_grid: Grid, destination_grid: Grid, dtype=None):
+        """Computes first-order conservative remapping weights between the faces
+        of two grids.
+
+        Weights are the overlap areas between each destination face and the source
+        faces it intersects, normalized by the covered area of the destination face.
+        The result is cached on ``destination_grid`` and reused by later calls
+        while neither grid changes.
+
+        Parameters
+        ----------
+        source_grid : Grid
+            Grid the source data lives on
+        destination_grid : Grid
+            Grid the data is remapped onto
+        dtype : str or np.dtype, optional
+            Floating point type of the returned weights. Defaults to ``float64``.
+            The cached weights are always computed in ``float64``.
+
+        Raises
+        ------
+        ValueError
+            If a face of ``destination_grid`` is not convex.
+        """
+        from .conservative import _conservative_weights
+
+        source_fingerprint = _grid_fingerprint(source_grid)
+        destination_fingerprint = _grid_fingerprint(destination_grid)
+        key = ("conservative", source_fingerprint, destination_fingerprint)
+
+        if key not in destination_grid._remap_weights:
+            destination_grid._remap_weights[key] = cls(
+                _conservative_weights(source_grid, destination_grid),
+                "n_face",
+                "n_face",
+                source_fingerprint,
+                destination_fingerprint,
+                method="conservative",
+                destination_grid=destination_grid,
+            )
+
+        weights = destination_grid._remap_weights[key]
+        return weights if dtype is None else weights.astype(dtype)
+
+    def apply(
+        self,
+        source: UxDataArray | UxDataset,
+        destination_grid: Optional[Grid] = None,
+    ) -> UxDataArray | UxDataset:
+        """Remaps a ``UxDataArray`` or ``UxDataset`` using these weights.
+
+        Parameters
+        ----------
+        source : UxDataArray or UxDataset
+            Data on the source grid. Every variable with a spatial dimension must
+            be defined on ``source_dim``; other variables are carried over unchanged.
+        destination_grid : Grid, optional
+            Destination grid to attach to the result. Required if the weights were
+            loaded from a file.
+
+        Returns
+        -------
+        UxDataArray or UxDataset
+            A new object with data mapped onto the destination grid.
+        """
+        destination_grid = self._resolve_destination_grid(destination_grid)
+
+        if _grid_fingerprint(source.uxgrid) != self.source_fingerprint:
+            raise ValueError(
+                "The grid of the source data does not match the source grid used to "
+                "compute these weights."
+            )
+
+        ds, is_da, name = _to_dataset(source)
+
+        for var_name, da in ds.data_vars.items():
+            spatial = set(da.dims) & SPATIAL_DIMS
+            if spatial and spatial != {self.source_dim}:
+                raise ValueError(
+                    f"Variable {var_name!r} is defined on {sorted(spatial)}, but these "
+                    f"weights map from {self.source_dim!r}."
+                )
+
+        operator = (
+            partial(_sparse_matvec, matrix=self.matrix),
+            self.n_destination,
+            self.matrix.dtype,
+        )
+        remapped_vars = _remap_data_vars(
+            ds, {self.source_dim: operator}, self.destination_dim, destination_grid
+        )
+
+        ds_remapped = _construct_remapped_ds(
+            source, remapped_vars, destination_grid, self.destination_dim
+        )
+
+        return ds_remapped[name] if is_da else ds_remapped
+
+    def _resolve_destination_grid(self, destination_grid: Optional[Grid]) -> Grid:
+        """Returns the destination grid to attach to remapped results, validating
+        it against the stored fingerprint."""
+        if destination_grid is None:
+            if self._destination_grid is None:
+                raise ValueError(
+                    "A destination grid must be provided when applying weights loaded "
+                    "from a file."
+                )
+            return self._destination_grid
+
+        if _grid_fingerprint(destination_grid) != self.destination_fingerprint:
+            raise ValueError(
+                "The provided destination grid does not match the destination grid "
+                "used to compute these weights."
+            )
+        return destination_grid
+
+    def to_xarray(self) -> xr.Dataset:
+        """Encodes the weights as an ``xarray.Dataset`` using the ``S``, ``row``
+        and ``col`` (one-based) sparse-matrix variables of ESMF and
+        TempestRemap weight files."""
+        coo = self.matrix.tocoo()
+
+        return xr.Dataset(
+            data_vars={
+                "S": xr.DataArray(coo.data, dims=["n_s"]),
+                "row": xr.DataArray(coo.row.astype(np.int64) + 1, dims=["n_s"]),
+                "col": xr.DataArray(coo.col.astype(np.int64) + 1, dims=["n_s"]),
+            },
+            attrs={
+                "n_a": self.n_source,
+                "n_b": self.n_destination,
+                "source_dim": self.source_dim,
+                "destination_dim": self.destination_dim,
+                "source_grid_fingerprint": self.source_fingerprint,
+                "destination_grid_fingerprint": self.destination_fingerprint,
+                "method": self.method or "",
+            },
+        )
+
+    @classmethod
+    def from_dataset(cls, ds: xr.Dataset):
+        """Constructs ``RemapWeights`` from a dataset produced by ``to_xarray()``."""
+        matrix = sparse.csr_matrix(
+            (
+                ds["S"].values,
+                (ds["row"].values.astype(np.int64) - 1, ds["col"].values - 1),
+            ),
+            shape=(int(ds.attrs["n_b"]), int(ds.attrs["n_a"])),
+        )
+
+        return cls(
+            matrix,
+            ds.attrs["source_dim"],
+            ds.attrs["destination_dim"],
+            ds.attrs["source_grid_fingerprint"],
+            ds.attrs["destination_grid_fingerprint"],
+            method=ds.attrs.get("method") or None,
+        )
+
+    @classmethod
+    def from_file(cls, filename: str | os.PathLike, **kwargs):
+        """Reads weights previously written with ``to_netcdf()`` or ``to_zarr()``.
+
+        Parameters
+        ----------
+        filename : str or os.PathLike
+            Path to a netCDF file or Zarr store
+        **kwargs
+            Additional keyword arguments passed to ``xarray.open_dataset``
+        """
+        with xr.open_dataset(filename, **kwargs) as ds:
+            return cls.from_dataset(ds.load())
+
+    def to_netcdf(self, path: str | os.PathLike, **kwargs):
+        """Writes the weights to a netCDF file.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Path of the file to write
+        **kwargs
+            Additional keyword arguments passed to ``xarray.Dataset.to_netcdf``
+        """
+        return self.to_xarray().to_netcdf(path, **kwargs)
+
+    def to_zarr(self, store, **kwargs):
+        """Writes the weights to a Zarr store.
+
+        Parameters
+        ----------
+        store : str, os.PathLike or MutableMapping
+            Zarr store to write to
+        **kwargs
+            Additional keyword arguments passed to ``xarray.Dataset.to_zarr``
+        """
+        return self.to_xarray().to_zarr(store, **kwargs)
+
+
+def _sparse_matvec(data: np.ndarray, matrix: sparse.csr_matrix) -> np.ndarray:
+    """Multiplies ``matrix`` against the trailing axis of ``data``."""
+    flat = data.reshape(-1, data.shape[-1])
+    out = matrix @ flat.T
+    return np.asarray(out.T).reshape(data.shape[:-1] + (matrix.shape[0],))
@@ -26,6 +26,7 @@ class DataArraySubsetAccessor:
         methods_heading += (
             "  * bounding_box(lon_bounds, lat_bounds, inverse_indices, **kwargs)\n"
         )
+        methods_heading += "  * polygon(geometry, predicate, inverse_indices)\n"
 
         return prefix + methods_heading
 
@@ -126,3 +127,32 @@ class DataArraySubsetAccessor:
         )
 
         return self.uxda._slice_from_grid(grid)
+
+    def polygon(
+        self,
+        geometry,
+        predicate: str = "intersects",
+        inverse_indices: Union[List[str], Set[str], bool] = False,
+    ):
+        """Subsets an unstructured grid by returning the faces that intersect, or
+        lie within, a spherical polygon, such as an ocean basin or a country.
+
+        Parameters
+        ----------
+        geometry : shapely.Polygon, shapely.MultiPolygon or array_like of shape (n, 2)
+            The polygon, with (longitude, latitude) vertices in degrees. Holes are supported. The polygon must
+            lie within a hemisphere.
+        predicate : {'intersects', 'within'}, default='intersects'
+            Whether to select the faces that intersect the polygon, including those crossed by its boundary, or
+            only the faces that lie within it.
+        inverse_indices : Union[List[str], Set[str], bool], optional
+            Controls storage of original grid indices. Options:
+            - True: Stores original face indices
+            - List/Set of strings: Stores specified index types (valid values: "face", "edge", "node")
+            - False: No index storage (default)
+        """
+        grid = self.uxda.uxgrid.subset.polygon(
+            geometry, predicate=predicate, inverse_indices=inverse_indices
+        )
+
+        return self.uxda._slice_from_grid(grid)
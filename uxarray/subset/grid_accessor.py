@@ -24,6 +24,9 @@ class GridSubsetAccessor:
             "  * bounding_circle(center_coord, r, element, inverse_indices, **kwargs)\n"
         )
         methods_heading += "  * bounding_box(lon_bounds, lat_bounds, inverse_indices)\n"
+        methods_heading += (
+            "  * polygon(geometry, predicate, return_mask, inverse_indices)\n"
+        )
 
         return prefix + methods_heading
 
@@ -138,6 +141,58 @@ class GridSubsetAccessor:
 
         return self._index_grid(ind, element, inverse_indices=inverse_indices)
 
+    def polygon(
+        self,
+        geometry,
+        predicate: str = "intersects",
+        return_mask: bool = False,
+        inverse_indices: Union[List[str], Set[str], bool] = False,
+    ):
+        """Subsets an unstructured grid by returning the faces that intersect, or
+        lie within, a spherical polygon, such as an ocean basin or a country.
+
+        The edges of the polygon are great-circle arcs. Only the faces near the
+        polygon are considered: the faces crossed by its boundary are found by
+        walking along it, and the remaining faces within its bounding cap are
+        classified from their centers.
+
+        Parameters
+        ----------
+        geometry : shapely.Polygon, shapely.MultiPolygon or array_like of shape (n, 2)
+            The polygon, with (longitude, latitude) vertices in degrees. Holes are supported. The polygon must
+            lie within a hemisphere.
+        predicate : {'intersects', 'within'}, default='intersects'
+            Whether to select the faces that intersect the polygon, including those crossed by its boundary, or
+            only the faces that lie within it.
+        return_mask : bool, default=False
+            If True, returns a boolean mask of shape (n_face,) of the selected faces instead of a subset of the grid
+        inverse_indices : Union[List[str], Set[str], bool], optional
+            Controls storage of original grid indices. Options:
+            - True: Stores original face indices
+            - List/Set of strings: Stores specified index types (valid values: "face", "edge", "node")
+            - False: No index storage (default)
+
+        Examples
+        --------
+        >>> from shapely.geometry import Polygon
+        >>> basin = Polygon(
+        ...     [(-80.0, 10.0), (-10.0, 10.0), (-10.0, 60.0), (-80.0, 60.0)]
+        ... )
+        >>> subset = uxgrid.subset.polygon(basin)
+        >>> mask = uxgrid.subset.polygon(basin, return_mask=True)
+        """
+        from uxarray.grid.geometry import _polygon_face_mask
+
+        mask = _polygon_face_mask(self.uxgrid, geometry, predicate=predicate)
+        if return_mask:
+            return mask
+
+        faces = np.flatnonzero(mask)
+        if len(faces) == 0:
+            raise ValueError("No faces found within the polygon")
+
+        return self.uxgrid.isel(n_face=faces, inverse_indices=inverse_indices)
+
     def _get_tree(self, coords, tree_type):
         """Internal helper for obtaining the desired KDTree or BallTree."""
         if coords.ndim > 1: